@@ -18,7 +18,6 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Type
 
 import hjson
-from pandas import DataFrame
 
 from kgforge.core.resource import Resource
 from kgforge.core.archetypes.mapping import Mapping
@@ -55,6 +54,7 @@ class Model(ABC):
         prefixes = dict(sorted(self._prefixes().items(), key=lambda item: item[0]))
         if pretty:
             print("Used prefixes:")
+            from pandas import DataFrame
             df = DataFrame(prefixes, index=[0])
             formatters = {
                 x: f"{{:<{df[x].str.len().max()}s}}".format for x in df.columns
@@ -199,6 +199,22 @@ class Model(ABC):
         # POLICY Should notify of failures with exception ValidationError including a message.
         ...
 
+    # State.
+
+    def state(self) -> Optional[Dict]:
+        # POLICY Should return, as a JSON serialisable dictionary, the Model data loaded from the
+        # POLICY source which is costly to load again, None if there is none.
+        return None
+
+    def restore_state(self, state: Dict) -> None:
+        # POLICY Should restore the Model data from a dictionary returned by state().
+        pass
+
+    def close(self) -> None:
+        # POLICY Should release what the Model holds until garbage collected, e.g. the stores it
+        # POLICY loads its data from. The Model should not be used afterwards.
+        pass
+
     # Utils.
 
     def _initialize_service(self, source: str, **source_config) -> Any:
@@ -14,7 +14,7 @@
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from kgforge.core.resource import Resource
 from kgforge.core.archetypes.model import Model
@@ -24,7 +24,7 @@ from kgforge.core.commons.context import Context
 from kgforge.core.commons.exceptions import (
     DownloadingError,
 )
-from kgforge.core.commons.execution import not_supported
+from kgforge.core.commons.execution import not_supported, run_in_executor, run_pages
 from kgforge.core.commons.sparql_query_builder import SPARQLQueryBuilder
 from kgforge.core.reshaping import collect_values, collect_values_jp
 from kgforge.core.wrappings import Filter
@@ -80,6 +80,13 @@ class ReadOnlyStore(ABC):
         # TODO These two operations might be abstracted here when other stores will be implemented.
         ...
 
+    async def aretrieve(
+            self, id_: str, version: Optional[Union[int, str]], cross_bucket: bool, **params
+    ) -> Optional[Resource]:
+        # Asynchronous retrieval could be made native by overriding this method in the specialization.
+        # POLICY Should follow self.retrieve() policies.
+        return await run_in_executor(self.retrieve, id_, version, cross_bucket, **params)
+
     @abstractmethod
     def _retrieve_filename(self, id: str) -> Tuple[str, str]:
         # TODO This operation might be adapted if other file metadata are needed.
@@ -105,6 +112,73 @@ class ReadOnlyStore(ABC):
             content_type: str = None
     ) -> None:
         # path: DirPath.
+        download_urls, filepaths, download_store_metadata, buckets = self._prepare_download(
+            data, follow, path, overwrite, cross_bucket, content_type
+        )
+        if len(download_urls) > 1:
+            self._download_many(download_urls, filepaths, download_store_metadata, cross_bucket,
+                                content_type, buckets)
+        else:
+            self._download_one(download_urls[0], filepaths[0], download_store_metadata[0],
+                               cross_bucket, content_type, buckets[0])
+
+    async def adownload(
+            self,
+            data: Union[Resource, List[Resource]],
+            follow: str,
+            path: str,
+            overwrite: bool,
+            cross_bucket: bool,
+            content_type: Optional[str]
+    ) -> None:
+        # Asynchronous downloading could be made native by overriding this method in the specialization.
+        # POLICY Should follow self.download() policies.
+        await run_in_executor(
+            self.download, data, follow, path, overwrite, cross_bucket, content_type
+        )
+
+    def _prepare_download(
+            self,
+            data: Union[Resource, List[Resource]],
+            follow: str,
+            path: str,
+            overwrite: bool,
+            cross_bucket: bool,
+            content_type: Optional[str]
+    ) -> Tuple[List[str], List[str], List[Optional[DictWrapper]], List[str]]:
+        # Collects the urls to download with their target paths, store metadata and buckets.
+        urls, store_metadata, buckets = self._download_targets(
+            data, follow, cross_bucket, content_type
+        )
+        dirpath = Path(path)
+        dirpath.mkdir(parents=True, exist_ok=True)
+        timestamp = time.strftime("%Y%m%d%H%M%S")
+        filepaths = []
+        download_buckets = []
+        download_urls = []
+        download_store_metadata = []
+        for i, x_download_url in enumerate(urls):
+            filename, store_content_type = self._retrieve_filename(x_download_url)
+            if not content_type or (content_type and store_content_type == content_type):
+                filepaths.append(ReadOnlyStore._download_path(dirpath, filename, overwrite, timestamp))
+                download_urls.append(x_download_url)
+                download_buckets.append(buckets[i])
+                download_store_metadata.append(store_metadata[i])
+        if len(download_urls) == 0:
+            raise DownloadingError(
+                f"No resource with content_type {content_type} was found when following the resource path '{follow}'."
+            )
+        return download_urls, filepaths, download_store_metadata, download_buckets
+
+    def _download_targets(
+            self,
+            data: Union[Resource, List[Resource]],
+            follow: str,
+            cross_bucket: bool,
+            content_type: Optional[str]
+    ) -> Tuple[List[str], List[Optional[DictWrapper]], List[str]]:
+        # Collects the download urls with their store metadata and buckets, without retrieving
+        # the metadata of the files, so that specializations can retrieve them concurrently.
         urls = []
         store_metadata = []
         constraint_dict = None
@@ -122,36 +196,21 @@ class ReadOnlyStore(ABC):
             raise DownloadingError(
                 f"path to follow '{follow}' was not found in any provided resource."
             )
-        dirpath = Path(path)
-        dirpath.mkdir(parents=True, exist_ok=True)
-        timestamp = time.strftime("%Y%m%d%H%M%S")
-        filepaths = []
-        buckets = []
         download_urls = []
-        download_store_metadata = []
+        buckets = []
         for i, x in enumerate(urls):
             x_download_url, x_bucket = self._prepare_download_one(x, store_metadata[i],
                                                                   cross_bucket)
-            filename, store_content_type = self._retrieve_filename(x_download_url)
-            if not content_type or (content_type and store_content_type == content_type):
-                filepath = dirpath / filename
-                if not overwrite and filepath.exists():
-                    filepaths.append(f"{filepath}.{timestamp}")
-                else:
-                    filepaths.append(str(filepath))
-                download_urls.append(x_download_url)
-                buckets.append(x_bucket)
-                download_store_metadata.append(store_metadata[i])
-        if len(download_urls) > 1:
-            self._download_many(download_urls, filepaths, download_store_metadata, cross_bucket,
-                                content_type, buckets)
-        elif len(download_urls) == 1:
-            self._download_one(download_urls[0], filepaths[0], download_store_metadata[0],
-                               cross_bucket, content_type, buckets[0])
-        else:
-            raise DownloadingError(
-                f"No resource with content_type {content_type} was found when following the resource path '{follow}'."
-            )
+            download_urls.append(x_download_url)
+            buckets.append(x_bucket)
+        return download_urls, store_metadata, buckets
+
+    @staticmethod
+    def _download_path(dirpath: Path, filename: str, overwrite: bool, timestamp: str) -> str:
+        filepath = dirpath / filename
+        if not overwrite and filepath.exists():
+            return f"{filepath}.{timestamp}"
+        return str(filepath)
 
     def _download_many(
             self,
@@ -209,6 +268,25 @@ class ReadOnlyStore(ABC):
         # TODO These two operations might be abstracted here when other stores will be implemented.
         ...
 
+    async def asearch(
+            self, *filters: Union[Dict, Filter], resolvers: Optional[List[Resolver]], **params
+    ) -> List[Resource]:
+        # Asynchronous search could be made native by overriding this method in the specialization.
+        # POLICY Should follow self.search() policies.
+        return await run_in_executor(self.search, *filters, resolvers=resolvers, **params)
+
+    def search_iter(
+            self, *filters: Union[Dict, Filter], resolvers: Optional[List[Resolver]],
+            page_size: int, **params
+    ) -> Iterator[Resource]:
+        # Paginated search could be made lazy by overriding this method in the specialization,
+        # using self._sparql_pages().
+        # POLICY Should follow self.search() policies, except for limit and offset.
+        # POLICY Should yield the resources page by page, pages being fetched with a keyset
+        # POLICY given by the param 'keyset', with values in ('id', '_createdAt').
+        params.pop("keyset", None)
+        return iter(self.search(*filters, resolvers=resolvers, **params))
+
     def sparql(
             self, query: str,
             debug: bool,
@@ -216,6 +294,50 @@ class ReadOnlyStore(ABC):
             offset: int = DEFAULT_OFFSET,
             **params
     ) -> List[Resource]:
+        qr = self._prepare_sparql(query, debug, limit, offset, **params)
+        return self._sparql(qr, view=params.get("view", None))
+
+    async def asparql(
+            self, query: str,
+            debug: bool,
+            limit: int = DEFAULT_LIMIT,
+            offset: int = DEFAULT_OFFSET,
+            **params
+    ) -> List[Resource]:
+        qr = self._prepare_sparql(query, debug, limit, offset, **params)
+        return await self._asparql(qr, view=params.get("view", None))
+
+    def sparql_iter(
+            self, query: str, debug: bool, page_size: int = DEFAULT_LIMIT, **params
+    ) -> Iterator[Resource]:
+        qr = self._prepare_sparql(query, debug, None, None, **params)
+        return self._sparql_pages(
+            qr, params.get("keyset", "id"), page_size, params.get("view", None)
+        )
+
+    def _sparql_pages(
+            self, query: str, keyset: str, page_size: int, view: Optional[str],
+            build: Optional[Callable[[List[Resource]], List[Resource]]] = None
+    ) -> Iterator[Resource]:
+        # Results of the query are fetched page by page with keyset pagination and, if given,
+        # passed to build() to get the resources to yield.
+        # Fails early if keyset pagination cannot be applied to the query.
+        SPARQLQueryBuilder.apply_keyset_to_query(query, keyset, None, page_size)
+
+        def fetch_page(last: Optional[List[str]]) -> Tuple[List[Resource], Optional[List[str]]]:
+            qr = SPARQLQueryBuilder.apply_keyset_to_query(query, keyset, last, page_size)
+            results = self._sparql(qr, view) or []
+            following = (
+                SPARQLQueryBuilder.keyset_values(results[-1], keyset)
+                if len(results) >= page_size else None
+            )
+            return (build(results) if build is not None else results), following
+
+        return run_pages(fetch_page)
+
+    def _prepare_sparql(
+            self, query: str, debug: bool, limit: int, offset: int, **params
+    ) -> str:
         rewrite = params.get("rewrite", True)
 
         if self.model_context() is not None and rewrite:
@@ -242,7 +364,7 @@ class ReadOnlyStore(ABC):
         if debug:
             SPARQLQueryBuilder.debug_query(qr)
 
-        return self._sparql(qr, view=params.get("view", None))
+        return qr
 
     @abstractmethod
     def _sparql(self, query: str, view: Optional[str]) -> Optional[Union[List[Resource], Resource]]:
@@ -251,12 +373,37 @@ class ReadOnlyStore(ABC):
         # POLICY Resource _synchronized should not be set (default is False).
         ...
 
+    async def _asparql(
+            self, query: str, view: Optional[str]
+    ) -> Optional[Union[List[Resource], Resource]]:
+        # Asynchronous querying could be made native by overriding this method in the specialization.
+        # POLICY Should follow self._sparql() policies.
+        return await run_in_executor(self._sparql, query, view)
+
     @abstractmethod
     def elastic(
             self, query: str, debug: bool, limit: int = None, offset: int = None, **params
     ) -> Union[List[Resource], Resource, List[Dict], Dict]:
         ...
 
+    async def aelastic(
+            self, query: str, debug: bool, limit: int = None, offset: int = None, **params
+    ) -> Union[List[Resource], Resource, List[Dict], Dict]:
+        # POLICY Should follow self.elastic() policies.
+        return await run_in_executor(self.elastic, query, debug, limit, offset, **params)
+
+    # State.
+
+    def freshness(self) -> Optional[str]:
+        # POLICY Should return a value changing when what a saved forge state depends on changes in
+        # POLICY the store, e.g. its contexts, schemas or ontologies, None if it cannot be known.
+        return None
+
+    def close(self) -> None:
+        # POLICY Should release what the store holds until garbage collected, e.g. connections
+        # POLICY and threads. The store should not be used afterwards.
+        pass
+
     # Versioning.
 
     @abstractmethod
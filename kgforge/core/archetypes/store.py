@@ -14,7 +14,7 @@
 import json
 from abc import abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List,  Optional, Union, Type, Match
+from typing import Any, Dict, Iterable, Iterator, List,  Optional, Union, Type, Match
 
 from kgforge.core.archetypes.read_only_store import ReadOnlyStore, DEFAULT_LIMIT, DEFAULT_OFFSET
 from kgforge.core.archetypes.model import Model
@@ -32,7 +32,7 @@ from kgforge.core.commons.exceptions import (
     UpdatingError,
     UploadingError
 )
-from kgforge.core.commons.execution import run
+from kgforge.core.commons.execution import not_supported, run, run_in_executor, run_stream
 
 
 class Store(ReadOnlyStore):
@@ -111,6 +111,31 @@ class Store(ReadOnlyStore):
             schema_id=schema_id,
         )
 
+    def register_stream(
+            self, data: Iterable[Resource], schema_id: Optional[str]
+    ) -> Iterator[Resource]:
+        # Streamed registration could be made concurrent by overriding this method in the
+        # specialization.
+        # POLICY Should pull resources lazily and yield them back once processed, in any order.
+        # POLICY Should reproduce self.register() behaviour for each resource, not raising on errors.
+        return run_stream(
+            self._register_one,
+            data,
+            required_synchronized=False,
+            execute_actions=True,
+            exception=RegistrationError,
+            monitored_status="_synchronized",
+            schema_id=schema_id,
+        )
+
+    async def aregister(
+            self, data: Union[Resource, List[Resource]], schema_id: Optional[str]
+    ) -> None:
+        # Asynchronous registration could be made native by overriding this method in the
+        # specialization, using execution.arun().
+        # POLICY Should follow self.register() policies.
+        await run_in_executor(self.register, data, schema_id)
+
     @abstractmethod
     def _register_many(self, resources: List[Resource], schema_id: str) -> None:
         # Bulk registration could be optimized by overriding this method in the specialization.
@@ -135,6 +160,13 @@ class Store(ReadOnlyStore):
 
         raise UploadingError("no file_resource_mapping has been configured")
 
+    async def aupload(
+            self, path: str, content_type: str, forge: Optional['KnowledgeGraphForge']
+    ) -> Union[Resource, List[Resource]]:
+        # Asynchronous uploading could be made native by overriding this method in the specialization.
+        # POLICY Should follow self.upload() policies.
+        return await run_in_executor(self.upload, path, content_type, forge)
+
     def upload_image(self, path: str, content_type: str, about: str,
                      forge: 'KnowledgeGraphForge'):
         p = Path(path)
@@ -183,6 +215,27 @@ class Store(ReadOnlyStore):
             schema_id=schema_id,
         )
 
+    def update_stream(
+            self, data: Iterable[Resource], schema_id: Optional[str]
+    ) -> Iterator[Resource]:
+        # POLICY Should follow self.register_stream() policies.
+        return run_stream(
+            self._update_one,
+            data,
+            id_required=True,
+            required_synchronized=False,
+            execute_actions=True,
+            exception=UpdatingError,
+            monitored_status="_synchronized",
+            schema_id=schema_id,
+        )
+
+    async def aupdate(
+            self, data: Union[Resource, List[Resource]], schema_id: Optional[str]
+    ) -> None:
+        # POLICY Should follow self.aregister() policies.
+        await run_in_executor(self.update, data, schema_id)
+
     @abstractmethod
     def _update_many(self, resources: List[Resource], schema_id: Optional[str]) -> None:
         # Bulk update could be optimized by overriding this method in the specialization.
@@ -208,6 +261,17 @@ class Store(ReadOnlyStore):
             value=value,
         )
 
+    def tag_stream(self, data: Iterable[Resource], value: str) -> Iterator[Resource]:
+        # POLICY Should follow self.register_stream() policies.
+        return run_stream(
+            self._tag_one,
+            data,
+            id_required=True,
+            required_synchronized=True,
+            exception=TaggingError,
+            value=value,
+        )
+
     @abstractmethod
     def _tag_many(self, resources: List[Resource], value: str) -> None:
         # Bulk tagging could be optimized by overriding this method in the specialization.
@@ -235,6 +299,17 @@ class Store(ReadOnlyStore):
             monitored_status="_synchronized",
         )
 
+    def deprecate_stream(self, data: Iterable[Resource]) -> Iterator[Resource]:
+        # POLICY Should follow self.register_stream() policies.
+        return run_stream(
+            self._deprecate_one,
+            data,
+            id_required=True,
+            required_synchronized=True,
+            exception=DeprecationError,
+            monitored_status="_synchronized",
+        )
+
     @abstractmethod
     def _deprecate_many(self, resources: List[Resource]) -> None:
         # Bulk deprecation could be optimized by overriding this method in the specialization.
@@ -251,6 +326,38 @@ class Store(ReadOnlyStore):
             self, query: str, debug: bool, limit: int = DEFAULT_LIMIT, offset: int = DEFAULT_OFFSET,
             **params
     ) -> Union[List[Resource], Resource, List[Dict], Dict]:
+        query_dict = self._prepare_elastic(query, debug, limit, offset)
+
+        return self._elastic(
+            query_dict,
+            view=params.get("view", None),
+            as_resource=params.get("as_resource", True),
+            build_resource_from=params.get("build_resource_from", "source")
+        )
+
+    async def aelastic(
+            self, query: str, debug: bool, limit: int = DEFAULT_LIMIT, offset: int = DEFAULT_OFFSET,
+            **params
+    ) -> Union[List[Resource], Resource, List[Dict], Dict]:
+        query_dict = self._prepare_elastic(query, debug, limit, offset)
+
+        return await self._aelastic(
+            query_dict,
+            view=params.get("view", None),
+            as_resource=params.get("as_resource", True),
+            build_resource_from=params.get("build_resource_from", "source")
+        )
+
+    def elastic_iter(
+            self, query: str, debug: bool, page_size: int = DEFAULT_LIMIT, **params
+    ) -> Iterator[Resource]:
+        # POLICY Should follow self.elastic() policies, except for limit and offset.
+        # POLICY Should yield the results page by page, e.g. with execution.run_pages(), without
+        # POLICY holding all of them at once.
+        raise not_supported()
+
+    @staticmethod
+    def _prepare_elastic(query: str, debug: bool, limit: int, offset: int) -> Dict:
         query_dict = json.loads(query)
 
         query_dict = ESQueryBuilder.apply_limit_and_offset_to_query(
@@ -262,12 +369,7 @@ class Store(ReadOnlyStore):
         if debug:
             ESQueryBuilder.debug_query(query_dict)
 
-        return self._elastic(
-            query_dict,
-            view=params.get("view", None),
-            as_resource=params.get("as_resource", True),
-            build_resource_from=params.get("build_resource_from", "source")
-        )
+        return query_dict
 
     @abstractmethod
     def _elastic(
@@ -278,6 +380,13 @@ class Store(ReadOnlyStore):
         # POLICY Resource _synchronized should not be set (default is False).
         ...
 
+    async def _aelastic(
+            self, query: Dict, view: Optional[str], as_resource: bool, build_resource_from: str
+    ) -> Optional[Union[List[Resource], Resource, List[Dict], Dict]]:
+        # Asynchronous querying could be made native by overriding this method in the specialization.
+        # POLICY Should follow self._elastic() policies.
+        return await run_in_executor(self._elastic, query, view, as_resource, build_resource_from)
+
     # Versioning.
 
     def freeze(self, data: Union[Resource, List[Resource]]) -> None:
@@ -61,22 +61,24 @@ class Actions(list):
 
 class LazyAction:
 
-    def __init__(self, operation: Callable, *args) -> None:
+    def __init__(self, operation: Callable, *args, **kwargs) -> None:
         self.operation: Callable = operation
         self.args = args
+        self.kwargs = kwargs
 
     def __repr__(self) -> str:
         return repr_class(self)
 
     def __str__(self) -> str:
-        return f"LazyAction(operation={self.operation.__qualname__}, args={list(self.args)})"
+        kwargs = f", kwargs={self.kwargs}" if self.kwargs else ""
+        return f"LazyAction(operation={self.operation.__qualname__}, args={list(self.args)}{kwargs})"
 
     def __eq__(self, other: object) -> bool:
         return eq_class(self, other)
 
     def execute(self) -> Union[Resource, List[Resource]]:
         # POLICY Operation should propagate exceptions. This is for actions.execute_lazy_actions().
-        return self.operation(*self.args)
+        return self.operation(*self.args, **self.kwargs)
 
 
 def execute_lazy_actions(resource: Resource, lazy_actions: List[str]) -> None:
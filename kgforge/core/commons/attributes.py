@@ -21,13 +21,15 @@ def check_collisions(reserved: Set[str], new: KeysView[str]) -> None:
         raise NotImplementedError(f"some names of the given properties are reserved: {intersect}")
 
 
+_ORDERED = ["_last_action", "_validated", "_synchronized", "_store_metadata",
+            "context", "id", "type", "label"]
+_ORDERS = {x: i for i, x in enumerate(_ORDERED)}
+_NEXT_ORDER = len(_ORDERED) + 1
+
+
 def sort_attrs(kv: Tuple[str, str]) -> Tuple[int, str]:
     # POLICY Should be called to sort attributes of resources, templates, mappings, ...
-    ordered = ["_last_action", "_validated", "_synchronized", "_store_metadata",
-               "context", "id", "type", "label"]
-    orders = {x: i for i, x in enumerate(ordered)}
-    next_order = len(ordered) + 1
-    return orders.get(kv[0], next_order), kv[0]
+    return _ORDERS.get(kv[0], _NEXT_ORDER), kv[0]
 
 
 def repr_class(self: object) -> str:
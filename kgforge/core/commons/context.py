@@ -12,12 +12,20 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
-from typing import Optional, Union, Dict, List
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from functools import partial
+from typing import Optional, Union, Dict, List, Tuple
 from rdflib.plugins.shared.jsonld.context import (
     source_to_json,
     Context as JSONLD_Context,
 )
 
+from kgforge.core.commons.context_cache import cached_context
+
 
 class Context(JSONLD_Context):
     """Context class will hold a JSON-LD context in two forms: iri and document.
@@ -40,27 +48,37 @@ class Context(JSONLD_Context):
             document (Dict, List, str): resolved or resolvable document
             iri (str): the iri for the provided document
         """
-        super().__init__(document, version=1.1)
         if isinstance(document, list):
+            sub_contexts = [interned_context(x) for x in document]
+            super().__init__([x.document for x in sub_contexts], version=1.1)
             sub_docs = {}
-            for x in document:
-                sub_context = Context(x)
+            for sub_context in sub_contexts:
                 sub_docs.update(sub_context.document["@context"])
             self.document = {"@context": sub_docs}
         elif isinstance(document, str):
-            try:
-                self.document = source_to_json(document)
-            except Exception as e:
-                raise ValueError("context not resolvable") from e
-        elif isinstance(document, Dict):
-            self.document = (
-                document if "@context" in document else {"@context": document}
-            )
+            # Resolved once, through the context cache for remote documents.
+            if document.startswith(("http://", "https://")):
+                resolved = cached_context(document, partial(source_to_json, document))
+            else:
+                resolved = source_to_json(document)
+            super().__init__(resolved, version=1.1)
+            self.document = resolved
+        else:
+            super().__init__(document, version=1.1)
+            if isinstance(document, Dict):
+                self.document = (
+                    document if "@context" in document else {"@context": document}
+                )
         self.iri = iri
         self.prefixes = {
             v: k for k, v in self._prefixes.items() if k.endswith(("/", "#"))
         }
 
+    def __reduce__(self):
+        # Rebuilt from the document when unpickled, e.g. in validation processes, as the terms
+        # of rdflib are defined with sentinels which do not keep their identity once unpickled.
+        return Context, (self.document, self.iri)
+
     def is_http_iri(self):
         if self.iri:
             return self.iri.startswith("http")
@@ -69,3 +87,32 @@ class Context(JSONLD_Context):
 
     def has_vocab(self):
         return self.vocab is not None
+
+
+# Contexts built by interned_context(), the least recently used ones being evicted first.
+_INTERNED_MAX = 256
+_interned: "OrderedDict[Tuple[str, Optional[str]], Context]" = OrderedDict()
+_interned_lock = threading.Lock()
+
+
+def interned_context(document: Union[Dict, List, str], iri: Optional[str] = None) -> Context:
+    # POLICY Should be used instead of Context() for documents which are not modified afterwards.
+    # POLICY The returned context is shared: its document should be copied before being modified.
+    # Contexts are keyed by the hash of their document, or by the document if it is a string,
+    # and built from a copy of it so that later changes by the caller are not seen.
+    if isinstance(document, str):
+        key = (document, iri)
+    else:
+        serialised = json.dumps(document, sort_keys=True, default=str)
+        key = (hashlib.sha256(serialised.encode()).hexdigest(), iri)
+    with _interned_lock:
+        context = _interned.get(key)
+        if context is not None:
+            _interned.move_to_end(key)
+            return context
+    context = Context(document if isinstance(document, str) else deepcopy(document), iri)
+    with _interned_lock:
+        _interned[key] = context
+        while len(_interned) > _INTERNED_MAX:
+            _interned.popitem(last=False)
+    return context
@@ -0,0 +1,190 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+from urllib.error import URLError
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class ContextCache:
+    """Persistent cache of JSON-LD context documents, shared by the processes using its directory.
+
+    Documents are kept in a subdirectory per format VERSION of the cache, one JSON file per key,
+    and are fresh for ttl seconds. A document which is not fresh is fetched again, the cached one
+    being still used if the fetch fails. Offline, cached documents are used however old they are
+    and missing ones are not resolvable. Files are written atomically and a lock per document
+    makes concurrent processes missing the same document fetch it once, the others reading it
+    from the cache when the lock is released. Each call returns a new copy of the document.
+    Documents which depend on credentials are cached per identity, e.g. per token, which is kept
+    hashed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, directory: str, ttl: float = 86400, offline: bool = False) -> None:
+        if ttl < 0:
+            raise ValueError(f"ttl value should be positive but {ttl} is provided")
+        self.directory = Path(directory).expanduser() / f"v{ContextCache.VERSION}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.offline = offline
+        # Documents are kept serialised so that callers can modify the ones they get.
+        self._documents: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, fetch: Callable[[], Any], identity: Optional[str] = None) -> Any:
+        """Return the cached document for key, calling fetch() to get it if needed."""
+        if identity is not None:
+            key = f"{hashlib.sha256(identity.encode()).hexdigest()} {key}"
+        cached = self._read(key)
+        if cached is not None and (self.offline or self._fresh(cached)):
+            return json.loads(cached[1])
+        if self.offline:
+            raise URLError(f"{key} is not in the context cache and the cache is offline")
+        with self._locked(key):
+            # Another process may have fetched it while waiting for the lock.
+            cached = self._read(key)
+            if cached is not None and self._fresh(cached):
+                return json.loads(cached[1])
+            try:
+                document = fetch()
+            except Exception:
+                if cached is None:
+                    raise
+                return json.loads(cached[1])
+            self._write(key, json.dumps(document))
+        return document
+
+    def _fresh(self, cached: Tuple[float, str]) -> bool:
+        return time.time() - cached[0] < self.ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _read(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            cached = self._documents.get(key)
+        if cached is not None and self._fresh(cached):
+            return cached
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cached
+        cached = (data["stored_at"], data["document"])
+        with self._lock:
+            self._documents[key] = cached
+        return cached
+
+    def _write(self, key: str, document: str) -> None:
+        stored_at = time.time()
+        with self._lock:
+            self._documents[key] = (stored_at, document)
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "stored_at": stored_at, "document": document}, f)
+            os.replace(tmp, path)
+        except OSError:
+            if tmp.exists():
+                tmp.unlink()
+
+    @contextmanager
+    def _locked(self, key: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(self._path(key).with_suffix(".lock"), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class ContextScope(NamedTuple):
+    """The context cache, if any, of a forge, the documents it resolved, kept serialised to be
+    saved in its snapshots, and the documents restored from a snapshot, used instead of being
+    fetched."""
+
+    cache: Optional[ContextCache]
+    resolved: Dict[str, str]
+    restored: Dict[str, str]
+
+
+# The scope of the forge being initialized, or of the service resolving a context.
+_context_scope: ContextVar[Optional[ContextScope]] = ContextVar("context_scope", default=None)
+# Documents restored from a snapshot, given to the scopes of the forges initialized meanwhile.
+_restored: ContextVar[Dict[str, str]] = ContextVar("restored_contexts", default={})
+
+
+def new_context_scope(cache: Optional[ContextCache]) -> ContextScope:
+    return ContextScope(cache, {}, dict(_restored.get()))
+
+
+def get_context_scope() -> Optional[ContextScope]:
+    return _context_scope.get()
+
+
+@contextmanager
+def using_context_scope(scope: Optional[ContextScope]) -> Iterator[None]:
+    """Resolve contexts through the cache of the given scope and record them there in this block."""
+    token = _context_scope.set(scope)
+    try:
+        yield
+    finally:
+        _context_scope.reset(token)
+
+
+def cached_context(key: str, fetch: Callable[[], Any], identity: Optional[str] = None) -> Any:
+    # POLICY Should be used to fetch remote context documents, and what is needed to build them,
+    # POLICY so that they are shared through the context cache in use, if any. Documents which
+    # POLICY depend on credentials should be given the identity they were fetched with.
+    scope = _context_scope.get()
+    if scope is None:
+        return fetch()
+    restored = scope.restored.get(key)
+    if restored is not None:
+        scope.resolved[key] = restored
+        return json.loads(restored)
+    if scope.cache is None:
+        document = fetch()
+    else:
+        document = scope.cache.get(key, fetch, identity)
+    scope.resolved[key] = json.dumps(document)
+    return document
+
+
+@contextmanager
+def restored_contexts(documents: Dict[str, str]) -> Iterator[None]:
+    """Resolve the given serialised documents from memory, instead of fetching them, in the forges
+    initialized in this block."""
+    token = _restored.set(documents)
+    try:
+        yield
+    finally:
+        _restored.reset(token)
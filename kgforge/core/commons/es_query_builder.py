@@ -17,15 +17,16 @@ from typing import Tuple, List, Dict, Optional, Any
 import copy
 import datetime
 import dateutil
-import elasticsearch_dsl
 from dateutil.parser import ParserError
-from elasticsearch_dsl import Field
 
 from kgforge.core.commons.context import Context
+from kgforge.core.commons.imports import lazy_import
 from kgforge.core.commons.query_builder import QueryBuilder
 from kgforge.core.resource import Resource
 from kgforge.core.wrappings import Filter, FilterOperator
 
+elasticsearch_dsl = lazy_import("elasticsearch_dsl")
+
 elasticsearch_operator_range_map = {
     FilterOperator.LOWER_THAN.value: "lt",
     FilterOperator.LOWER_OR_Equal_Than.value: "lte",
@@ -196,6 +197,28 @@ class ESQueryBuilder(QueryBuilder):
 
         return query
 
+    @staticmethod
+    def apply_search_after_to_query(
+            query: Dict, last: Optional[List], size: int, tiebreaker: str = "@id"
+    ) -> Dict:
+        """Return the query for the page of hits following last, the sort values of the last hit
+        of the previous page.
+
+        Hits are sorted as in the query, then by the tiebreaker field so that their order is total
+        and no hit is skipped or repeated between pages. A from in the query is removed.
+        """
+        query = {k: v for k, v in query.items() if k != "from"}
+        sort = query.get("sort", [])
+        sort = list(sort) if isinstance(sort, list) else [sort]
+        fields = [next(iter(s)) if isinstance(s, dict) else s for s in sort]
+        if tiebreaker not in fields:
+            sort.append({tiebreaker: "asc"})
+        query["sort"] = sort
+        query["size"] = size
+        if last is not None:
+            query["search_after"] = last
+        return query
+
 
 def _look_up_known_parent_paths(f, last_path, property_path, m):
     if (
@@ -304,7 +327,7 @@ def _build_keyword_path(
 
 def _build_bool_query(
         filter: Filter,
-        mapping_type: Field,
+        mapping_type: "elasticsearch_dsl.Field",
         k_path: str,
         property_path: str,
         filter_or_must_or_must_not: str,
@@ -12,10 +12,15 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
+import asyncio
 import inspect
+import time
 import traceback
-from functools import wraps
-from typing import Any, Callable, List, Optional, Tuple, Union, Type
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial, wraps
+from typing import (Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple,
+                    Union, Type)
 import requests
 
 from kgforge.core.resource import Resource
@@ -140,6 +145,84 @@ def run(
         raise TypeError("not a Resource nor a list of Resource")
 
 
+async def arun(
+        fun_many: Callable[..., Awaitable[None]],
+        data: Union[Resource, List[Resource]],
+        exception: Type[RunException],
+        **kwargs
+) -> None:
+    # POLICY Should be called, as run() is, by specializations implementing natively with
+    # POLICY coroutines the asynchronous counterparts of operations on resources.
+    if isinstance(data, List) and all(isinstance(x, Resource) for x in data):
+        await fun_many(data, **kwargs)
+        actions = Actions.from_resources(data)
+        print(actions)
+    elif isinstance(data, Resource):
+        await fun_many([data], **kwargs)
+        action = data._last_action
+        print(action)
+        if not action.succeeded:
+            raise exception(action.message)
+    else:
+        raise TypeError("not a Resource nor a list of Resource")
+
+
+async def run_in_executor(fun: Callable, *args, **kwargs) -> Any:
+    # POLICY Should be used by archetypes as the default of their asynchronous methods. The
+    # POLICY synchronous counterpart is run in the default executor of the running event loop.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(fun, *args, **kwargs))
+
+
+def run_stream(
+        fun_one: Callable,
+        data: Iterable[Resource],
+        exception: Type[RunException],
+        id_required: bool = False,
+        required_synchronized: Optional[bool] = None,
+        execute_actions: bool = False,
+        monitored_status: Optional[str] = None,
+        **kwargs
+) -> Iterator[Resource]:
+    # POLICY Should be called for operations on resources pulled lazily from an iterable. Errors
+    # POLICY are caught and reported in the _last_action of each resource yielded back.
+    for resource in data:
+        if not isinstance(resource, Resource):
+            raise TypeError("not a Resource")
+        _run_one(fun_one, resource, exception, id_required, required_synchronized,
+                 execute_actions, monitored_status, True, **kwargs)
+        yield resource
+
+
+def run_pages(
+        fetch_page: Callable[[Optional[Any]], Tuple[List[Resource], Optional[Any]]]
+) -> Iterator[Resource]:
+    # POLICY Should be called for results fetched page by page. fetch_page(key) should return the
+    # POLICY resources of the page starting after key, None for the first page, and the key of the
+    # POLICY next page, None if it is the last one.
+    # The next page is fetched in a background thread while the resources of the current one are
+    # consumed, so that at most two pages are held in memory.
+    with ThreadPoolExecutor(1, thread_name_prefix="kgforge-page") as executor:
+        page, key = fetch_page(None)
+        while True:
+            following = executor.submit(fetch_page, key) if key is not None else None
+            yield from page
+            if following is None:
+                return
+            page, key = following.result()
+
+
+@contextmanager
+def timed(timings: Dict[str, float], step: str) -> Iterator[None]:
+    # POLICY Should be used to report in timings the duration, in seconds, of the steps of the
+    # POLICY construction of a forge or of its services, including the failed ones.
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[step] = time.perf_counter() - start
+
+
 def _run_many(fun: Callable, resources: List[Resource], *args, **kwargs) -> None:
     for x in resources:
         _run_one(fun, x, *args, **kwargs)
@@ -13,8 +13,9 @@
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
 import re
+import sys
 from importlib import import_module
-from typing import Callable
+from typing import Any, Callable, Dict
 
 from kgforge.core.commons.exceptions import ConfigurationError
 
@@ -39,3 +40,39 @@ def import_class(configuration: str, forge_module_name: str) -> Callable:
             raise ConfigurationError(f"{archetype} class not found for '{configuration}'") from exc2
     else:
         raise ConfigurationError(f"incorrect {archetype} configuration for '{configuration}'")
+
+
+def lazy_import(name: str) -> Any:
+    # POLICY Should be used for heavy dependencies needed only by some features, e.g. pandas for
+    # POLICY dataframes or elasticsearch_dsl for Elasticsearch queries, instead of an import.
+    # Returns a stand-in for the module, which is imported on the first access to its attributes.
+    return _LazyModule(name)
+
+
+class _LazyModule:
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute: str) -> Any:
+        if self._module is None:
+            self._module = import_module(self._name)
+        return getattr(self._module, attribute)
+
+
+def lazy_classes(package: str, modules: Dict[str, str]) -> Callable[[str], Any]:
+    # POLICY Should be assigned to __getattr__ in the __init__.py of specialization packages.
+    # Returns the __getattr__ of the package, importing each class from its module, given relatively
+    # to the package, when it is first accessed. Importing the package does not then import all
+    # the specializations it declares, nor their dependencies.
+    def __getattr__(name: str) -> Any:
+        try:
+            module = modules[name]
+        except KeyError:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+        class_ = getattr(import_module(module, package), name)
+        setattr(sys.modules[package], name, class_)
+        return class_
+
+    return __getattr__
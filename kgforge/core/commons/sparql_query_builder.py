@@ -15,11 +15,9 @@
 from datetime import datetime
 from enum import Enum
 import json
-from pyld import jsonld
 import rdflib
 import re
 from rdflib import Graph
-from rdflib.plugins.sparql.parser import Query
 from typing import Any, Dict, List, Match, Optional, Tuple, Union, Type, Pattern
 
 from kgforge.core.commons.exceptions import QueryingError
@@ -28,10 +26,14 @@ from kgforge.core.conversions.rdf import from_jsonld
 from kgforge.core.archetypes.resolver import Resolver
 from kgforge.core.commons.context import Context
 from kgforge.core.commons.files import is_valid_url
+from kgforge.core.commons.imports import lazy_import
 from kgforge.core.commons.parser import _parse_type
 from kgforge.core.commons.query_builder import QueryBuilder
 from kgforge.core.wrappings.paths import Filter
 
+jsonld = lazy_import("pyld.jsonld")
+sparql_parser = lazy_import("rdflib.plugins.sparql.parser")
+
 
 class CategoryDataType(Enum):
     DATETIME = "datetime"
@@ -118,6 +120,12 @@ sparql_operator_map = {
     "__ge__": ">=",
 }
 
+# Variables ordering the results of a query paginated with a keyset, the last one being unique.
+KEYSET_VARIABLES = {
+    "id": ["id"],
+    "_createdAt": ["_createdAt", "id"],
+}
+
 
 class SPARQLQueryBuilder(QueryBuilder):
 
@@ -189,7 +197,7 @@ class SPARQLQueryBuilder(QueryBuilder):
     def build_resource_from_response(
         query: str, response: Dict, context: Context, *args, **params
     ) -> List[Resource]:
-        _, q_comp = Query.parseString(query)
+        _, q_comp = sparql_parser.Query.parseString(query)
         bindings = response["results"]["bindings"]
         # FIXME workaround to parse a CONSTRUCT query, this fix depends on
         #  https://github.com/BlueBrain/nexus/issues/1155
@@ -384,6 +392,44 @@ class SPARQLQueryBuilder(QueryBuilder):
 
         return query
 
+    @staticmethod
+    def apply_keyset_to_query(
+        query: str, keyset: str, last: Optional[List[str]], limit: int
+    ) -> str:
+        """Rewrite a SELECT query to return the page of results following the last one.
+
+        Results are ordered by the variables of the keyset: ?id, or ?_createdAt then ?id. The page
+        following last, the values of these variables in the last result of the previous page, is
+        selected with a filter in the WHERE clause instead of an OFFSET, so that the triple store
+        does not go through all the previous results again. LIMIT and OFFSET in the query are
+        replaced.
+        """
+        variables = KEYSET_VARIABLES.get(keyset)
+        if variables is None:
+            raise QueryingError(
+                f"The provided keyset value '{keyset}' is not supported. "
+                f"Supported keyset values are: {list(KEYSET_VARIABLES)}"
+            )
+        missing = [f"?{v}" for v in variables if not re.search(rf"\?{v}\b", query)]
+        if missing:
+            raise QueryingError(f"Keyset pagination requires the query to select {', '.join(missing)}")
+        if re.search(r"\bORDER\s+BY\b", query, flags=re.IGNORECASE):
+            raise QueryingError("Keyset pagination cannot be applied to a query with an ORDER BY clause")
+        query = re.sub(r"\s+(LIMIT|OFFSET)\s+\d+", "", query, flags=re.IGNORECASE)
+        if last is not None:
+            # The end of the WHERE clause, solution modifiers come after it.
+            end = query.rfind("}")
+            if end == -1:
+                raise QueryingError("Keyset pagination requires a query with a WHERE clause")
+            condition = _keyset_condition(variables, last)
+            query = f"{query[:end]} FILTER ({condition})\n{query[end:]}"
+        order = " ".join(f"?{v}" for v in variables)
+        return f"{query} ORDER BY {order} LIMIT {limit}"
+
+    @staticmethod
+    def keyset_values(resource: Resource, keyset: str) -> List[str]:
+        return [getattr(resource, v) for v in KEYSET_VARIABLES[keyset]]
+
     @staticmethod
     def create_select_query(
         vars_: List[str],
@@ -420,6 +466,21 @@ def _box_value_as_full_iri(value):
     return f"<{value}>" if is_valid_url(value) else value
 
 
+def _keyset_condition(variables: List[str], values: List[str]) -> str:
+    # Lexicographic comparison of the variables with the values: the first variable is greater,
+    # or it is equal and the comparison holds for the next ones.
+    variable, value = variables[0], values[0]
+    literal = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    if variable == "id":
+        term, literal = "STR(?id)", f'"{literal}"'
+    else:
+        term, literal = f"?{variable}", f'"{literal}"^^<http://www.w3.org/2001/XMLSchema#dateTime>'
+    if len(variables) == 1:
+        return f"{term} > {literal}"
+    following = _keyset_condition(variables[1:], values[1:])
+    return f"{term} > {literal} || ({term} = {literal} && {following})"
+
+
 def build_shacl_query(
     statements: List[str] = None,
     defining_property_uri: str = None,
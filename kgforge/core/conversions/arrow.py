@@ -0,0 +1,191 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import json
+import os
+import threading
+from itertools import islice
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Union
+
+from kgforge.core.commons.context import Context
+from kgforge.core.commons.imports import lazy_import
+from kgforge.core.conversions.dataframe import flattened_columns, resource_columns
+from kgforge.core.conversions.json import as_json
+from kgforge.core.resource import Resource
+
+if TYPE_CHECKING:
+    from pyarrow import Array, Field, Schema, Table
+
+# pyarrow is an optional dependency, installed with the 'arrow' extra.
+pa = lazy_import("pyarrow")
+pq = lazy_import("pyarrow.parquet")
+
+# Metadata of the fields whose values are stored as JSON text.
+JSON_TEXT = {b"encoding": b"json"}
+
+
+def as_arrow(data: Union[Resource, List[Resource]], na: Union[Any, List[Any]], nesting: str,
+             expanded: bool, store_metadata: bool, model_context: Optional[Context],
+             metadata_context: Optional[Context], context_resolver: Optional[Callable]) -> "Table":
+    # Columns are named and ordered as those of as_dataframe(). Missing values are nulls. The
+    # values of a column which do not have a common Arrow type, even once put in lists, are
+    # stored as JSON text.
+    resources = data if isinstance(data, list) else [data]
+    if expanded:
+        dicts = as_json(resources, expanded, store_metadata, model_context=model_context,
+                        metadata_context=metadata_context, context_resolver=context_resolver)
+        columns, _ = flattened_columns(dicts, nesting, None)
+    else:
+        columns, _ = resource_columns(resources, nesting, store_metadata, None)
+    nas = [x for x in (na if isinstance(na, list) else [na]) if x is not None]
+    fields = []
+    arrays = []
+    for name, values in columns.items():
+        if nas:
+            values = [None if _is_na(x, nas) else x for x in values]
+        array = _array(values)
+        if array is None:
+            fields.append(pa.field(name, pa.string(), metadata=JSON_TEXT))
+            arrays.append(_json_array(values))
+        else:
+            fields.append(pa.field(name, array.type))
+            arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def to_parquet(data: Union[Resource, Iterable[Resource]], path: str, na: Union[Any, List[Any]],
+               nesting: str, expanded: bool, store_metadata: bool,
+               model_context: Optional[Context], metadata_context: Optional[Context],
+               context_resolver: Optional[Callable], batch_size: int) -> None:
+    # Resources are converted with as_arrow() batch by batch, each batch being spilled to a
+    # temporary file so that only one is in memory at a time. The schema of the file unifies the
+    # ones of the batches as as_arrow() would: columns missing from a batch are filled with nulls,
+    # types are promoted, e.g. integers to floats, values alone are put in lists if they are in
+    # lists in other batches, and otherwise conflicting values are stored as JSON text. The file
+    # is written next to path and renamed to it once complete, so that a failure leaves no
+    # truncated file at path.
+    resources = iter([data] if isinstance(data, Resource) else data)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        _write_parquet(resources, tmp, na, nesting, expanded, store_metadata, model_context,
+                       metadata_context, context_resolver, batch_size)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _write_parquet(resources: Iterable[Resource], path: str, na: Union[Any, List[Any]],
+                   nesting: str, expanded: bool, store_metadata: bool,
+                   model_context: Optional[Context], metadata_context: Optional[Context],
+                   context_resolver: Optional[Callable], batch_size: int) -> None:
+    with TemporaryDirectory() as directory:
+        batches = []
+        while True:
+            batch = list(islice(resources, batch_size))
+            if not batch:
+                break
+            table = as_arrow(batch, na, nesting, expanded, store_metadata, model_context,
+                             metadata_context, context_resolver)
+            batch_path = os.path.join(directory, f"{len(batches)}.parquet")
+            pq.write_table(table, batch_path)
+            batches.append((batch_path, table.schema))
+        if not batches:
+            pq.write_table(pa.table({}), path)
+            return
+        fields = {}
+        for _, batch_schema in batches:
+            for field in batch_schema:
+                fields.setdefault(field.name, []).append(field)
+        schema = pa.schema([_unified(x) for x in fields.values()])
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch_path, _ in batches:
+                writer.write_table(_conformed(pq.read_table(batch_path), schema))
+
+
+def _array(values: List) -> Optional["Array"]:
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    if any(type(x) is list for x in values):
+        # Values given either alone or in a list, e.g. types, are all put in lists.
+        try:
+            return pa.array(_listed(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return None
+
+
+def _listed(values: List) -> List:
+    return [x if x is None or type(x) is list else [x] for x in values]
+
+
+def _json_array(values: List) -> "Array":
+    return pa.array([None if x is None else json.dumps(x) for x in values], pa.string())
+
+
+def _is_na(value: Any, nas: List[Any]) -> bool:
+    if isinstance(value, (list, dict)):
+        return False
+    # NaN matches NaN, as for the replacement of missing values in dataframes.
+    return any(value == x or (value != value and x != x) for x in nas)
+
+
+def _unified(fields: List["Field"]) -> "Field":
+    name = fields[0].name
+    if any(x.metadata == JSON_TEXT for x in fields):
+        return pa.field(name, pa.string(), metadata=JSON_TEXT)
+    try:
+        return _merged(fields)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    if any(pa.types.is_list(x.type) for x in fields):
+        listed = [x if pa.types.is_list(x.type) or pa.types.is_null(x.type)
+                  else pa.field(name, pa.list_(x.type)) for x in fields]
+        try:
+            return _merged(listed)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return pa.field(name, pa.string(), metadata=JSON_TEXT)
+
+
+def _merged(fields: List["Field"]) -> "Field":
+    schemas = [pa.schema([x]) for x in fields]
+    return pa.unify_schemas(schemas, promote_options="permissive").field(0)
+
+
+def _conformed(table: "Table", schema: "Schema") -> "Table":
+    # The metadata are compared too, as it tells which columns are stored as JSON text.
+    if table.schema.equals(schema, check_metadata=True):
+        return table
+    arrays = []
+    for field in schema:
+        if field.name not in table.column_names:
+            arrays.append(pa.nulls(table.num_rows, field.type))
+            continue
+        column = table.column(field.name)
+        source = table.schema.field(field.name)
+        if field.metadata == JSON_TEXT and source.metadata != JSON_TEXT:
+            arrays.append(_json_array(column.to_pylist()))
+        elif pa.types.is_list(field.type) and not pa.types.is_list(column.type):
+            arrays.append(pa.array(_listed(column.to_pylist()), field.type))
+        else:
+            try:
+                arrays.append(column.cast(field.type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # Structs cannot be cast to structs with other fields by every pyarrow version.
+                arrays.append(pa.array(column.to_pylist(), field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
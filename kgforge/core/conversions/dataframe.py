@@ -12,24 +12,29 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
-from pandas import DataFrame, Series
+from pandas import DataFrame, RangeIndex
 
+from kgforge.core.commons.attributes import sort_attrs
 from kgforge.core.resource import Resource
 from kgforge.core.commons.context import Context
-from kgforge.core.conversions.json import as_json, from_json
+from kgforge.core.conversions.json import _as_json, _encoded, as_json, from_json
 
 
 def as_dataframe(data: Union[Resource, List[Resource]], na: Union[Any, List[Any]], nesting: str, expanded: bool,
                  store_metadata: bool, model_context: Optional[Context],
                  metadata_context: Optional[Context], context_resolver: Optional[Callable]) -> DataFrame:
-    dicts = as_json(data, expanded, store_metadata, model_context=model_context,
-                    metadata_context=metadata_context, context_resolver=context_resolver)
-    # NB: Do not use json_normalize(). It does not respect how the dictionaries are ordered.
-    flattened = (flatten(x, nesting) for x in dicts) if isinstance(dicts, list) else [flatten(dicts, nesting)]
-    df = DataFrame(flattened)
+    resources = data if isinstance(data, list) else [data]
+    if expanded:
+        dicts = as_json(resources, expanded, store_metadata, model_context=model_context,
+                        metadata_context=metadata_context, context_resolver=context_resolver)
+        # NB: Do not use json_normalize(). It does not respect how the dictionaries are ordered.
+        columns, rows = flattened_columns(dicts, nesting, np.nan)
+    else:
+        columns, rows = resource_columns(resources, nesting, store_metadata, np.nan)
+    df = DataFrame(columns, index=RangeIndex(rows)) if columns else DataFrame([{}] * rows)
     if na is not None:
         df.replace(na, np.nan, inplace=True)
     return df
@@ -39,6 +44,98 @@ def flatten(data: Dict, sep: str) -> Dict:
     return dict(_flatten(data, sep, []))
 
 
+def flattened_columns(dicts: Iterable[Dict], sep: str, missing: Any) -> Tuple[Dict[str, List], int]:
+    # Columns of the dictionaries flattened as by flatten(), in the order their names are first
+    # found, with missing as the value of the rows without them. Returns them with the number of
+    # rows. The values are appended to the columns as found instead of building a dictionary
+    # per row first.
+    columns: Dict[str, List] = {}
+    rows = 0
+    for data in dicts:
+        _append_flattened(columns, data, sep, "", rows, missing)
+        rows += 1
+        for column in columns.values():
+            if len(column) < rows:
+                column.append(missing)
+    return columns, rows
+
+
+def resource_columns(resources: Iterable[Resource], sep: str, store_metadata: bool, missing: Any
+                     ) -> Tuple[Dict[str, List], int]:
+    # As flattened_columns() for the JSON of the resources given by as_json(), the values of their
+    # properties being appended to the columns without building the JSON of the resources first.
+    columns: Dict[str, List] = {}
+    rows = 0
+    for resource in resources:
+        metadata = resource._store_metadata if store_metadata is True else None
+        if metadata and any(k in resource.__dict__ and k != "context" for k in metadata):
+            # The store metadata replaces properties of the resource in its JSON.
+            _append_flattened(columns, _as_json(resource, store_metadata), sep, "", rows, missing)
+        else:
+            _append_object(columns, resource, sep, "", rows, missing, set())
+            if metadata:
+                _append_flattened(columns, _encoded(metadata, False, False, set()), sep, "", rows,
+                                  missing)
+        rows += 1
+        for column in columns.values():
+            if len(column) < rows:
+                column.append(missing)
+    return columns, rows
+
+
+def _append_flattened(columns: Dict[str, List], data: Dict, sep: str, prefix: str, row: int,
+                      missing: Any) -> None:
+    for k, v in data.items():
+        name = prefix + k
+        if isinstance(v, dict):
+            _append_flattened(columns, v, sep, name + sep, row, missing)
+        else:
+            _set_value(columns, name, v, row, missing)
+
+
+def _append_object(columns: Dict[str, List], value: Any, sep: str, prefix: str, row: int,
+                   missing: Any, markers: Set[int]) -> None:
+    # Values are encoded as by as_json(), from the resources and dictionaries down to the others.
+    attrs = ({k: v for k, v in value.__dict__.items() if k not in value._RESERVED}
+             if isinstance(value, Resource) else value)
+    if not all(type(k) is str for k in attrs):
+        _append_flattened(columns, _encoded(value, True, True, markers), sep, prefix, row, missing)
+        return
+    marker = id(value)
+    if marker in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(marker)
+    for k, v in sorted(attrs.items(), key=sort_attrs):
+        if k == "context":
+            continue
+        name = prefix + k
+        if _is_object(v):
+            _append_object(columns, v, sep, name + sep, row, missing, markers)
+            continue
+        v = _encoded(v, True, True, markers)
+        if isinstance(v, dict):
+            _append_flattened(columns, v, sep, name + sep, row, missing)
+        else:
+            _set_value(columns, name, v, row, missing)
+    markers.remove(marker)
+
+
+def _is_object(value: Any) -> bool:
+    return (type(value) is dict or isinstance(value, Resource)
+            or isinstance(value, dict) and not callable(getattr(value, "_asdict", None)))
+
+
+def _set_value(columns: Dict[str, List], name: str, value: Any, row: int, missing: Any) -> None:
+    column = columns.get(name)
+    if column is None:
+        column = columns[name] = [missing] * row
+    if len(column) > row:
+        # As for flatten(), the last value of a name found twice in a row is kept.
+        column[row] = value
+    else:
+        column.append(value)
+
+
 def _flatten(data: Dict, sep: str, path: List[str]) -> Iterator[Tuple[str, Any]]:
     for k, v in data.items():
         p = [*path, k]
@@ -50,20 +147,35 @@ def _flatten(data: Dict, sep: str, path: List[str]) -> Iterator[Tuple[str, Any]]
 
 def from_dataframe(data: DataFrame, na: Union[Any, List[Any]], nesting: str
                    ) -> Union[Resource, List[Resource]]:
-    converted = [_from_dataframe(x, na, nesting) for _, x in data.iterrows()]
+    # Missing values are masked once for the whole frame and values are taken column by column,
+    # the nesting of the properties being planned once from the column labels, instead of
+    # converting each row as a Series.
+    missing = data.replace(na, np.nan).isna().to_numpy()
+    columns = []
+    for index, label in enumerate(data.columns):
+        present = ~missing[:, index]
+        if not present.any():
+            continue
+        if not isinstance(label, str):
+            raise ValueError('Non-string column name!')
+        values = data.iloc[:, index].tolist()
+        columns.append((label, label.split(nesting), values, present.tolist()))
+    converted = []
+    for row in range(len(data)):
+        items = [(label, keys, values[row]) for label, keys, values, present in columns
+                 if present[row]]
+        converted.append(_resource(_deflattened(items)))
     if len(converted) == 1:
         converted = converted[0]
     return converted
 
 
-def _from_dataframe(row: Series, na: Union[Any, List[Any]], nesting: str) -> Resource:
-    new_na = row.replace(na, np.nan)
-    no_na = new_na.dropna()
-    items = list(no_na.items())
-    if not all(isinstance(i[0], str) for i in items):
-        raise ValueError('Non-string column name!')
-    data = deflatten(items, nesting)
-    return from_json(data, None)
+def _resource(properties: Dict) -> Resource:
+    # As from_json() with None as missing value, without going through the values which are
+    # neither dictionaries nor lists.
+    return Resource(**{k: _resource(v) if isinstance(v, dict)
+                       else from_json(v, None) if isinstance(v, list) else v
+                       for k, v in properties.items() if v is not None})
 
 
 def deflatten(items: List[Tuple[str, Any]], sep: str) -> Dict:
@@ -90,13 +202,20 @@ def deflatten(items: List[Tuple[str, Any]], sep: str) -> Dict:
         Deflatten means that the separator implies nesting of the dictionary.
 
     """
-    deflattened_row = {}
-    for col_label, v in items:
-        keys = col_label.split(sep)
+    return _deflattened([(label, label.split(sep), v) for label, v in items])
+
 
+def _deflattened(items: List[Tuple[str, List[str], Any]]) -> Dict:
+    # Items are the column labels, already split into keys, with their values.
+    deflattened_row = {}
+    for col_label, keys, v in items:
+        if len(keys) == 1:
+            deflattened_row[col_label] = v
+            continue
         current = deflattened_row
+        last = len(keys) - 1
         for i, k in enumerate(keys):
-            if i == len(keys) - 1:
+            if i == last:
                 try:
                     current[k] = v
                 except TypeError as exc:
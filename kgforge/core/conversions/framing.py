@@ -0,0 +1,529 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.namespace import OWL, RDF, XSD
+
+from kgforge.core.commons.context import Context, interned_context
+from kgforge.core.commons.exceptions import NotSupportedError
+
+# Conversion of a RDFLib.Graph into compacted JSON-LD node objects giving the same result as
+# serialising it to JSON-LD and then framing it with pyld with '@embed' set to '@once'. Instead
+# of round trips through n3 and JSON-LD, triples are indexed by subject and each node object is
+# built from the index, with its terms selected as pyld does it for the context.
+#
+# Contexts with features beyond terms, prefixes and '@vocab' (e.g. reverse or scoped terms,
+# language, index or type maps, keyword aliases, '@base') are not supported: NotSupportedError
+# is raised so that the caller falls back to pyld.
+
+_KEYWORDS = {RDF.type, OWL.sameAs, Namespace("http://www.w3.org/2000/10/swap/log#").implies}
+_NATIVE_TYPES = {XSD.boolean, XSD.integer, XSD.double, XSD.string}
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+_GEN_DELIMS = (":", "/", "?", "#", "[", "]", "@")
+_TERM_KEYS = {"@id", "@type", "@container", "@prefix", "@protected"}
+_CONTAINERS = {"@set", "@list"}
+
+# A term is defined by its IRI, its type coercion and its containers.
+Term = Tuple[str, Optional[str], FrozenSet[str]]
+
+
+class TermMap:
+    """Terms of a JSON-LD context, selected for IRIs and values as the compaction of pyld does."""
+
+    def __init__(self, document: Dict, context: Context) -> None:
+        self.vocab: Optional[str] = None
+        self.terms: Dict[str, Term] = {}
+        self._prefixes: Dict[int, Dict[str, List[str]]] = {}
+        self._curies: Dict[str, List[str]] = {}
+        for name, value in document.items():
+            if name in ("@version", "@protected"):
+                continue
+            if name == "@vocab":
+                if value is not None and ":" not in (context.vocab or ""):
+                    raise NotSupportedError("relative @vocab in the context")
+                self.vocab = context.vocab if value is not None else None
+                continue
+            term = context.terms.get(name)
+            if name.startswith("@") or term is None or not isinstance(term.id, str):
+                raise NotSupportedError(f"{name} in the context")
+            if isinstance(value, str):
+                prefix = ":" not in name and (term.id.startswith("_:") or term.id.endswith(_GEN_DELIMS))
+            elif (
+                isinstance(value, dict)
+                and value.keys() <= _TERM_KEYS
+                and term.container <= _CONTAINERS
+                and value.get("@type") not in ("@none", "@json")
+            ):
+                prefix = value.get("@prefix") is True
+            else:
+                raise NotSupportedError(f"definition of the term {name} in the context")
+            if term.id.startswith("@"):
+                raise NotSupportedError(f"alias {name} of {term.id} in the context")
+            type_ = term.type if isinstance(term.type, str) else None
+            self.terms[name] = (term.id, type_, frozenset(term.container))
+            if prefix:
+                self._prefixes.setdefault(len(term.id), {}).setdefault(term.id, []).append(name)
+            if ":" in name:
+                self._curies.setdefault(term.id, []).append(name)
+        self._prefix_names = {x for names in self._prefixes.values() for x in sum(names.values(), [])}
+        self._inverse = self._inverse_context()
+        self._keys: Dict[Tuple[str, Tuple], str] = {}
+        self._iris: Dict[Tuple[str, bool], str] = {}
+
+    def expand(self, value: str) -> str:
+        if value.startswith("@"):
+            return value
+        if value in self.terms:
+            return self.terms[value][0]
+        if value.find(":") > 0:
+            prefix, suffix = value.split(":", 1)
+            if prefix == "_" or suffix.startswith("//"):
+                return value
+            if prefix in self._prefix_names:
+                return self.terms[prefix][0] + suffix
+            return value
+        return self.vocab + value if self.vocab else value
+
+    def key(self, iri: str, value: Dict) -> str:
+        # Term, compact IRI or IRI used as the key of a property value.
+        signature = _signature(value, self._is_term)
+        key = self._keys.get((iri, signature))
+        if key is None:
+            key = self._keys[(iri, signature)] = self._compact_iri(iri, signature, True)
+        return key
+
+    def iri(self, iri: str, vocab: bool) -> str:
+        # Compacted form of a type when vocab is True, otherwise of an identifier.
+        compacted = self._iris.get((iri, vocab))
+        if compacted is None:
+            compacted = self._iris[(iri, vocab)] = self._compact_iri(iri, None, vocab)
+        return compacted
+
+    def value(self, key: str, value: Dict) -> Union[Dict, str, int, float, bool]:
+        term = self.terms.get(key)
+        if len(value) == 1 or (term is not None and value.get("@type", False) == term[1]):
+            return value["@value"]
+        if "@type" in value:
+            return {"@type": self.iri(value["@type"], True), "@value": value["@value"]}
+        return {"@language": value["@language"], "@value": value["@value"]}
+
+    def reference(self, key: str, iri: str) -> Union[Dict, str]:
+        term = self.terms.get(key)
+        type_ = term[1] if term is not None else None
+        compacted = self.iri(iri, type_ == "@vocab")
+        return compacted if type_ in ("@id", "@vocab") else {"@id": compacted}
+
+    def containers(self, key: str) -> FrozenSet[str]:
+        term = self.terms.get(key)
+        return term[2] if term is not None else frozenset()
+
+    def _inverse_context(self) -> Dict[str, Dict[str, Dict[str, Dict[str, str]]]]:
+        inverse = {}
+        for name in sorted(self.terms, key=lambda x: (len(x), x)):
+            iri, type_, containers = self.terms[name]
+            container = "".join(sorted(containers)) or "@none"
+            entry = inverse.setdefault(iri, {}).setdefault(container, {"@language": {}, "@type": {}, "@any": {}})
+            entry["@any"].setdefault("@none", name)
+            if type_ is not None:
+                entry["@type"].setdefault(type_, name)
+            else:
+                entry["@language"].setdefault("@none", name)
+                entry["@type"].setdefault("@none", name)
+        return inverse
+
+    def _is_term(self, iri: str) -> bool:
+        if iri not in self._inverse:
+            return False
+        term = self.terms.get(self.iri(iri, True))
+        return term is not None and term[0] == iri
+
+    def _compact_iri(self, iri: str, signature: Optional[Tuple], vocab: bool) -> str:
+        if vocab and iri in self._inverse:
+            term = self._select_term(iri, signature)
+            if term is not None:
+                return term
+        if vocab and self.vocab and iri.startswith(self.vocab) and iri != self.vocab:
+            suffix = iri[len(self.vocab):]
+            if suffix not in self.terms:
+                return suffix
+        candidate = None
+        for length, prefixes in self._prefixes.items():
+            for name in prefixes.get(iri[:length], ()) if length < len(iri) else ():
+                curie = name + ":" + iri[length:]
+                if curie not in self.terms and (candidate is None or (len(curie), curie) < (len(candidate), candidate)):
+                    candidate = curie
+        for curie in self._curies.get(iri, ()) if signature is None else ():
+            term = self.terms.get(curie.split(":", 1)[0])
+            if term is not None and term[0] and term[0] != iri and iri.startswith(term[0]) \
+                    and curie == curie.split(":", 1)[0] + ":" + iri[len(term[0]):] \
+                    and (candidate is None or (len(curie), curie) < (len(candidate), candidate)):
+                candidate = curie
+        if candidate is not None:
+            return candidate
+        if iri.find(":") > 0 and iri.split(":", 1)[0] in self._prefix_names:
+            raise NotSupportedError(f"absolute IRI {iri} confused with a prefix of the context")
+        return iri
+
+    def _select_term(self, iri: str, signature: Optional[Tuple]) -> Optional[str]:
+        # Port of the term selection of pyld for value objects ('v'), node objects ('n'),
+        # lists ('l') and no value (None), the signature keeping what the selection depends on.
+        if signature is None:
+            containers = ["@set", "@none"]
+            type_or_language, preferred = "@type", ["@id"]
+        elif signature[0] == "v":
+            _, type_, language, alone = signature
+            containers = []
+            if language is not None:
+                containers.extend(["@language", "@language@set"])
+                type_or_language, preferred = "@language", [language]
+            elif type_ is not None:
+                type_or_language, preferred = "@type", [type_]
+            else:
+                type_or_language, preferred = "@language", ["@null"]
+            containers.extend(["@set", "@none", "@index", "@index@set"])
+            if alone:
+                containers.extend(["@language", "@language@set"])
+        elif signature[0] == "n":
+            _, has_id, is_term = signature
+            containers = ["@id", "@id@set", "@type", "@set@type", "@set", "@none", "@index", "@index@set"]
+            type_or_language = "@type"
+            if not has_id:
+                preferred = ["@id"]
+            else:
+                preferred = ["@vocab", "@id"] if is_term else ["@id", "@vocab"]
+        else:
+            _, type_, language, empty = signature
+            containers = ["@id", "@id@set", "@type", "@set@type", "@list", "@none", "@index", "@index@set"]
+            if empty:
+                type_or_language, preferred = "@any", ["@none"]
+            elif type_ != "@none":
+                type_or_language, preferred = "@type", [type_]
+            else:
+                type_or_language, preferred = "@language", [language]
+        if signature is None or signature[0] != "n":
+            with_direction = [x for x in preferred if "_" in x]
+            if with_direction:
+                preferred.append("_" + with_direction[0].split("_")[-1])
+        preferred.append("@none")
+        container_map = self._inverse[iri]
+        for container in containers:
+            if container in container_map:
+                terms = container_map[container][type_or_language]
+                for preference in preferred:
+                    if preference in terms:
+                        return terms[preference]
+        return None
+
+
+def _signature(value: Dict, is_term) -> Tuple:
+    if "@value" in value:
+        return "v", value.get("@type"), value.get("@language"), len(value) == 1
+    if "@list" in value:
+        items = value["@list"]
+        if not items:
+            return "l", None, None, True
+        common_language = common_type = None
+        for item in items:
+            item_language = item_type = "@none"
+            is_value = "@value" in item
+            if is_value:
+                if "@language" in item:
+                    item_language = item["@language"]
+                elif "@type" in item:
+                    item_type = item["@type"]
+                else:
+                    item_language = "@null"
+            else:
+                item_type = "@id"
+            if common_language is None:
+                common_language = item_language
+            elif item_language != common_language and is_value:
+                common_language = "@none"
+            if common_type is None:
+                common_type = item_type
+            elif item_type != common_type:
+                common_type = "@none"
+            if common_language == "@none" and common_type == "@none":
+                break
+        return "l", common_type, common_language, False
+    return "n", "@id" in value, "@id" in value and is_term(value["@id"])
+
+
+class GraphFramer:
+    """Nodes of a RDFLib.Graph with the given types, each one embedding the nodes it refers to."""
+
+    def __init__(self, data: Graph, type_: Optional[Union[str, List[str]]], model_context: Optional[Context]) -> None:
+        if data.context_aware or data.base is not None:
+            raise NotSupportedError("graphs with contexts or a base")
+        if model_context is not None and not isinstance(model_context.document.get("@context"), dict):
+            raise NotSupportedError("model contexts which are not a dictionary")
+        self._subjects: Dict = {}
+        self._types: Dict = {}
+        self._objects: Dict = {}
+        predicates: Dict[URIRef, None] = {}
+        datatypes: Set[URIRef] = set()
+        for s, p, o in data:
+            predicates[p] = None
+            if p == RDF.type:
+                if not isinstance(o, URIRef):
+                    raise NotSupportedError("types which are not IRIs")
+                self._types.setdefault(s, []).append(o)
+                self._subjects.setdefault(s, {})
+            else:
+                self._subjects.setdefault(s, {}).setdefault(p, []).append(o)
+                if not isinstance(o, Literal):
+                    self._objects[o] = None
+                elif o.datatype is not None:
+                    datatypes.add(o.datatype)
+        if model_context is None:
+            nodes = chain(self._subjects, self._objects, datatypes, *self._types.values())
+            self.context = _auto_context(data, predicates, (x for x in nodes if isinstance(x, URIRef)))
+        else:
+            self.context = model_context.document["@context"]
+        self.resolved_context = interned_context(self.context)
+        self.terms = TermMap(self.context, self.resolved_context)
+        for node, types in self._types.items():
+            self._types[node] = sorted(str(x) for x in types)
+        self._lists: Dict = {}
+        self._values: Dict[Literal, Dict] = {}
+        self._properties: Dict = {}
+        self._ids: Dict = {}
+        self._nodes = self._framed_nodes()
+        if type_:
+            types = [type_] if isinstance(type_, str) else type_
+            if not all(isinstance(x, str) for x in types):
+                raise NotSupportedError("frames with types which are not strings")
+            self._frame_types = {self.terms.expand(x) for x in types}
+        else:
+            self._frame_types = {x for types in self._types.values() for x in types}
+
+    def chunks(self, size: Optional[int]) -> Iterator[List[Dict]]:
+        # Blank node identifiers referred to only once are removed per chunk.
+        if self._frame_types:
+            matches = [x for x in self._nodes if not self._frame_types.isdisjoint(self._types.get(x, ()))]
+        else:
+            matches = [x for x in self._nodes if x not in self._types]
+        matches = [x for _, x in sorted((self._id(x), x) for x in matches)]
+        size = size or len(matches) or 1
+        for start in range(0, len(matches), size):
+            bnodes: Dict[str, List[Dict]] = {}
+            framed = [self._frame(x, set(), bnodes) for x in matches[start:start + size]]
+            for outputs in bnodes.values():
+                if len(outputs) == 1:
+                    del outputs[0]["@id"]
+            chunk = []
+            for node in framed:
+                compacted = {"@context": self.context}
+                compacted.update(self._compact(node))
+                if len(compacted) == 2 and "@id" in compacted:
+                    # Dropped as pyld does when expanding a node object with only an identifier.
+                    del compacted["@id"]
+                chunk.append(compacted)
+            yield chunk
+
+    # Framing
+
+    def _framed_nodes(self) -> List:
+        # Nodes of the graph as seen by pyld, the blank nodes of lists being consumed by them.
+        nodes = {}
+        for node in self._objects:
+            items = self._list(node)
+            if items is None:
+                nodes[node] = None
+                continue
+            for item in items:
+                if isinstance(item, BNode) and self._list(item) is not None or item == RDF.nil:
+                    raise NotSupportedError("lists of lists")
+                if not isinstance(item, Literal):
+                    nodes[item] = None
+        for node in self._subjects:
+            if node not in nodes and (node not in self._objects or self._list(node) is None):
+                nodes[node] = None
+        return list(nodes)
+
+    def _list(self, head) -> Optional[List]:
+        # Items of the list starting at head, as rdflib collects them when serialising to JSON-LD.
+        if head in self._lists:
+            return self._lists[head]
+        items = None
+        properties = self._subjects.get(head, {})
+        if head == RDF.nil or properties.get(RDF.first, [None])[0]:
+            items, node, seen = [], head, {head}
+            while node != RDF.nil:
+                properties = self._subjects.get(node, {})
+                if (
+                    not isinstance(node, BNode)
+                    or len(properties.get(RDF.first, ())) != 1
+                    or len(properties.get(RDF.rest, ())) != 1
+                    or len(properties) != 2
+                    or any(x != str(RDF.List) for x in self._types.get(node, ()))
+                ):
+                    items = None
+                    break
+                items.append(properties[RDF.first][0])
+                node = properties[RDF.rest][0]
+                if node in seen:
+                    items = None
+                    break
+                seen.add(node)
+        self._lists[head] = items
+        return items
+
+    def _id(self, node) -> str:
+        if not isinstance(node, BNode):
+            return str(node)
+        # Blank nodes are relabelled _:b0, _:b1, ... as by pyld, in the order they are met.
+        id_ = self._ids.get(node)
+        if id_ is None:
+            id_ = self._ids[node] = f"_:b{len(self._ids)}"
+        return id_
+
+    def _frame(self, node, embedded: Set, bnodes: Dict[str, List[Dict]]) -> Dict:
+        output = {"@id": self._id(node)}
+        if isinstance(node, BNode):
+            bnodes.setdefault(output["@id"], []).append(output)
+        if node in embedded:
+            return output
+        embedded.add(node)
+        types = self._types.get(node)
+        if types:
+            output["@type"] = types
+        for predicate, values in self._node_properties(node):
+            output[predicate] = [
+                value if type(value) is dict
+                else {"@list": [x if type(x) is dict else self._frame(x, embedded, bnodes) for x in value]}
+                if type(value) is list
+                else self._frame(value, embedded, bnodes)
+                for value in values
+            ]
+        return output
+
+    def _node_properties(self, node) -> List[Tuple[str, List]]:
+        # Properties sorted by IRI, with their values sorted as when serialised to n3.
+        properties = self._properties.get(node)
+        if properties is None:
+            properties = []
+            for predicate, objects in sorted(self._subjects.get(node, {}).items()):
+                values, literals = [], set()
+                for o in sorted(objects):
+                    if isinstance(o, Literal):
+                        value = self._value(o)
+                        # Booleans are not equal to numbers for pyld, whereas 1 and 1.0 are.
+                        literal = (
+                            value["@value"], isinstance(value["@value"], bool),
+                            value.get("@type"), value.get("@language"),
+                        )
+                        if literal not in literals:
+                            literals.add(literal)
+                            values.append(value)
+                        continue
+                    items = self._list(o) if isinstance(o, BNode) or o == RDF.nil else None
+                    values.append(o if items is None else [self._value(x) if isinstance(x, Literal) else x for x in items])
+                properties.append((str(predicate), values))
+            self._properties[node] = properties
+        return properties
+
+    def _value(self, literal: Literal) -> Dict:
+        value = self._values.get(literal)
+        if value is None:
+            if literal.datatype in _NATIVE_TYPES:
+                native = literal.toPython()
+                value = {"@value": str(native) if isinstance(native, Literal) else native}
+            elif literal.datatype is not None:
+                value = {"@type": str(literal.datatype), "@value": str(literal)}
+            elif literal.language:
+                value = {"@language": literal.language.lower(), "@value": str(literal)}
+            else:
+                value = {"@value": str(literal)}
+            self._values[literal] = value
+        return value
+
+    # Compaction
+
+    def _compact(self, node: Dict) -> Dict:
+        terms = self.terms
+        compacted = {}
+        for predicate, values in node.items():
+            if predicate == "@id":
+                compacted["@id"] = terms.iri(values, False)
+            elif predicate == "@type":
+                types = [terms.iri(x, True) for x in values]
+                compacted["@type"] = types[0] if len(types) == 1 else types
+            else:
+                for value in values:
+                    key = terms.key(predicate, value)
+                    containers = terms.containers(key)
+                    if "@list" in value:
+                        items = [self._compact_item(key, x) for x in value["@list"]]
+                        if "@list" in containers:
+                            compacted[key] = items
+                            continue
+                        item = {"@list": items}
+                    else:
+                        item = self._compact_item(key, value)
+                    if key not in compacted:
+                        compacted[key] = [item] if "@set" in containers or "@list" in containers else item
+                    elif type(compacted[key]) is list:
+                        compacted[key].append(item)
+                    else:
+                        compacted[key] = [compacted[key], item]
+        return compacted
+
+    def _compact_item(self, key: str, value: Dict) -> Union[Dict, str, int, float, bool]:
+        if "@value" in value:
+            return self.terms.value(key, value)
+        if len(value) == 1 and "@id" in value:
+            return self.terms.reference(key, value["@id"])
+        return self._compact(value)
+
+
+def _auto_context(data: Graph, predicates: Iterable[URIRef], nodes: Iterable[URIRef]) -> Dict[str, str]:
+    # Prefixes declared when data is serialised to n3 and which rdflib puts in the context when
+    # a graph parsed from it is serialised to JSON-LD, together with the prefixes bound by default.
+    namespaces: Dict[str, str] = {}
+    rewritten: Dict[str, str] = {}
+
+    def add_namespace(uri: URIRef, generate: bool) -> None:
+        try:
+            prefix, namespace, name = data.namespace_manager.compute_qname(uri, generate=generate)
+        except Exception:
+            prefix, namespace, name = data.store.prefix(uri), uri, ""
+            if prefix is None:
+                return
+        if name.replace("(", r"\(").replace(")", r"\)").endswith("."):
+            return
+        if prefix[:1] == "_" or namespaces.get(prefix, namespace) != namespace:
+            if prefix not in rewritten:
+                rewritten_prefix = "p" + prefix
+                while rewritten_prefix in namespaces:
+                    rewritten_prefix = "p" + rewritten_prefix
+                rewritten[prefix] = rewritten_prefix
+            prefix = rewritten[prefix]
+        if namespaces.get(prefix, namespace) != namespace:
+            raise NotSupportedError(f"prefix {prefix} bound to several namespaces")
+        namespaces[prefix] = namespace
+
+    for predicate in predicates:
+        if predicate not in _KEYWORDS and isinstance(predicate, URIRef):
+            add_namespace(predicate, True)
+    for node in nodes:
+        add_namespace(node, False)
+    graph = Graph()
+    for prefix, namespace in sorted(namespaces.items()):
+        graph.bind(prefix, namespace)
+    return dict(sorted((prefix, str(namespace)) for prefix, namespace in graph.namespaces()
+                       if prefix and str(namespace) != _XML_NAMESPACE))
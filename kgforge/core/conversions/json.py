@@ -13,7 +13,8 @@
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
 import json
-from typing import Any, Dict, List, Union, Optional, Callable
+from math import isfinite
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import hjson
 
@@ -22,6 +23,7 @@ from kgforge.core.commons.attributes import sort_attrs
 from kgforge.core.commons.context import Context
 from kgforge.core.conversions.rdf import as_jsonld
 from kgforge.core.resource import encode
+from kgforge.core.wrappings.dict import DictWrapper
 
 
 def as_json(data: Union[Resource, List[Resource]], expanded: bool, store_metadata: bool,
@@ -43,13 +45,84 @@ def from_json(data: Union[Dict, List[Dict]], na: Union[Any, List[Any]]
 
 
 def _as_json(resource: Resource, store_metadata: bool) -> Dict:
-    data = json.loads(hjson.dumpsJSON(resource, default=encode, item_sort_key=sort_attrs))
-    _remove_context(data)
+    data = _encoded(resource, True, True, set())
     if store_metadata is True and resource._store_metadata:
-        data.update(json.loads(hjson.dumpsJSON(resource._store_metadata, item_sort_key=sort_attrs)))
+        data.update(_encoded(resource._store_metadata, False, False, set()))
     return data
 
 
+def _encoded(value: Any, resources: bool, strip: bool, markers: Set[int]) -> Any:
+    # Single pass equivalent of json.loads(hjson.dumpsJSON(value, default=encode,
+    # item_sort_key=sort_attrs)) followed by _remove_context() when strip is True, without
+    # default=encode when resources is False. Values of other types go through hjson.
+    type_ = type(value)
+    if type_ is str or type_ is int or type_ is bool or value is None:
+        return value
+    if type_ is float:
+        # As hjson does, NaN and infinities are encoded as null.
+        return value if isfinite(value) else None
+    if type_ is list or type_ is tuple:
+        return _encoded_items(value, resources, strip, markers)
+    if type_ is dict or type_ is DictWrapper:
+        return _encoded_attrs(value, value, resources, strip, markers)
+    if isinstance(value, str):
+        return str.__str__(value)
+    if _is_array(value):
+        return _encoded_items(value, resources, strip, markers)
+    if isinstance(value, dict) and not callable(getattr(value, "_asdict", None)):
+        return _encoded_attrs(value, value, resources, strip, markers)
+    if resources and isinstance(value, Resource):
+        attrs = {k: v for k, v in value.__dict__.items() if k not in value._RESERVED}
+        return _encoded_attrs(value, attrs, resources, strip, markers)
+    if resources and type_.__name__ == "LazyAction":
+        return str(value)
+    data = _hjson_encoded(value, resources)
+    if strip:
+        _remove_context(data)
+    return data
+
+
+def _is_array(value: Any) -> bool:
+    # As for hjson, named tuples are encoded as objects.
+    return isinstance(value, list) or (
+        isinstance(value, tuple) and not callable(getattr(value, "_asdict", None))
+    )
+
+
+def _encoded_items(value: Union[List, Tuple], resources: bool, strip: bool, markers: Set[int]
+                   ) -> List:
+    marker = id(value)
+    if marker in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(marker)
+    # As with _remove_context(), lists of lists are left as they are.
+    items = [_encoded(x, resources, strip and not _is_array(x), markers) for x in value]
+    markers.remove(marker)
+    return items
+
+
+def _encoded_attrs(value: Any, attrs: Dict, resources: bool, strip: bool, markers: Set[int]
+                   ) -> Dict:
+    if not all(type(k) is str for k in attrs):
+        data = _hjson_encoded(value, resources)
+        if strip:
+            _remove_context(data)
+        return data
+    marker = id(value)
+    if marker in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(marker)
+    data = {k: _encoded(v, resources, strip, markers)
+            for k, v in sorted(attrs.items(), key=sort_attrs) if not (strip and k == "context")}
+    markers.remove(marker)
+    return data
+
+
+def _hjson_encoded(value: Any, resources: bool) -> Any:
+    return json.loads(hjson.dumpsJSON(value, default=encode if resources else None,
+                                      item_sort_key=sort_attrs))
+
+
 def _remove_context(dictionary: dict):
     if isinstance(dictionary, dict):
         for i in list(dictionary):
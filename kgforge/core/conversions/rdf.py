@@ -14,23 +14,29 @@
 
 from copy import deepcopy
 
-from typing import Union, Dict, List, Tuple, Optional, Callable
+from typing import Union, Dict, Iterator, List, Tuple, Optional, Callable
 
 from enum import Enum
 import json
 from collections import OrderedDict
 from urllib.error import URLError, HTTPError
 from rdflib import Graph
+from rdflib.plugins.parsers.jsonld import Parser as JSONLD_Parser
+from rdflib.plugins.shared.jsonld.context import Context as JSONLD_Context
+from rdflib.plugins.shared.jsonld.util import norm_url
 from rdflib.plugins.shared.jsonld.keys import CONTEXT, GRAPH
 from rdflib.namespace import RDF
-from pyld import jsonld
 
 from kgforge.core.commons.actions import LazyAction
-from kgforge.core.commons.context import Context
+from kgforge.core.commons.context import Context, interned_context
 from kgforge.core.commons.exceptions import NotSupportedError
 from kgforge.core.commons.execution import dispatch
+from kgforge.core.commons.imports import lazy_import
+from kgforge.core.conversions.framing import GraphFramer
 from kgforge.core.resource import Resource
 
+jsonld = lazy_import("pyld.jsonld")
+
 
 class Form(Enum):
     EXPANDED = "expanded"
@@ -103,6 +109,46 @@ def from_graph(
     frame: Dict = None,
     model_context: Optional[Context] = None,
 ) -> Union[Resource, List[Resource]]:
+    if not frame:
+        try:
+            framer = GraphFramer(data, type_, model_context)
+            resources = [x for chunk in framer.chunks(None) for x in _from_framed(chunk, framer)]
+        except NotSupportedError:
+            # Falls back to framing with pyld, e.g. for contexts with features not supported.
+            pass
+        else:
+            if not resources:
+                return from_jsonld({CONTEXT: framer.context})
+            return resources[0] if len(resources) == 1 else resources
+    return _from_graph_framed(data, type_, frame, model_context)
+
+
+def from_graph_iter(
+    data: Graph,
+    type_: Optional[Union[str, List]] = None,
+    model_context: Optional[Context] = None,
+    chunk_size: int = 1000,
+) -> Iterator[Resource]:
+    try:
+        framer = GraphFramer(data, type_, model_context)
+    except NotSupportedError:
+        framed = _from_graph_framed(data, type_, None, model_context)
+        yield from framed if isinstance(framed, list) else [framed]
+        return
+    for chunk in framer.chunks(chunk_size):
+        yield from _from_framed(chunk, framer)
+
+
+def _from_framed(nodes: List[Dict], framer: GraphFramer) -> List[Resource]:
+    return [_remove_ld_keys(x, framer.resolved_context) for x in nodes]
+
+
+def _from_graph_framed(
+    data: Graph,
+    type_: Optional[Union[str, List]],
+    frame: Optional[Dict],
+    model_context: Optional[Context],
+) -> Union[Resource, List[Resource]]:
 
     if not type_:
         _types = data.triples(
@@ -164,7 +210,7 @@ def _from_jsonld_many(dataset: List[Dict]) -> List[Resource]:
 def _from_jsonld_one(data: Dict) -> Resource:
     if "@context" in data:
         try:
-            resolved_context = Context(data["@context"])
+            resolved_context = interned_context(data["@context"])
         except URLError as e:
             raise ValueError("context not resolvable") from e
 
@@ -206,7 +252,7 @@ def _as_jsonld_one(
     **params,
 ) -> Dict:
     context = _resource_context(resource, model_context, context_resolver)
-    resolved_context = deepcopy(context.document)
+    resolved_context = context.document
     output_context = (
         context.iri if context.is_http_iri() else context.document["@context"]
     )
@@ -222,14 +268,17 @@ def _as_jsonld_one(
             output_context = _merge_jsonld(output_context, metadata_context_output)
         else:
             raise NotSupportedError("no available context in the metadata")
+    # The resource is already in compacted form once its JSON-LD keys are added. An RDF graph is
+    # built only for the store metadata, to be compacted or expanded with the merged context.
     try:
-        data_graph, metadata_graph, encoded_resource, json_array = _as_graphs(
-            resource, store_metadata, context, metadata_context
+        encoded_resource, _ = _encode_resource(resource, context)
+        metadata_graph = _metadata_graph(
+            resource._store_metadata, store_metadata, metadata_context
         )
     except Exception as e:
         raise ValueError(e) from e
 
-    if store_metadata is True and len(metadata_graph) > 0:
+    if metadata_graph is not None and len(metadata_graph) > 0:
         metadata_expanded = json.loads(metadata_graph.serialize(format="json-ld"))
         if form is Form.COMPACTED:
             metadata_compacted = jsonld.compact(metadata_expanded, resolved_context)
@@ -255,16 +304,15 @@ def _as_jsonld_one(
     if isinstance(result, dict):
         if "@context" in result:
             result.pop("@context")
+        # Contexts are interned and shared with other resources: the output gets its own copy.
+        if not isinstance(output_context, str):
+            output_context = deepcopy(output_context)
         result = (
             {**{"@context": output_context}, **result}
             if form is Form.COMPACTED
             else result
         )
-        resource_id = (
-            resource.id
-            if hasattr(resource, "id")
-            else (getattr(resource, "@id") if hasattr(resource, "@id") else None)
-        )
+        resource_id = _resource_id(resource)
         if resource_id:
             result["@id"] = resource_id
     else:
@@ -280,17 +328,19 @@ def _as_graph_many(
     context_resolver: Optional[Callable],
 ) -> Graph:
     graph = Graph()
+    doc_base = graph.absolutize("")
+    rdf_contexts = {}
     for resource in resources:
-        # Do not use _as_graph_one as it will lead to using graph1 + graph2 operation which can lead to blank node collisions
-        json_ld = _as_jsonld_one(
+        _add_triples(
+            graph,
             resource,
-            Form.EXPANDED,
             store_metadata,
             model_context,
             metadata_context,
             context_resolver,
+            doc_base,
+            rdf_contexts,
         )
-        graph.parse(data=json.dumps(json_ld), format="json-ld")
     return graph
 
 
@@ -301,24 +351,95 @@ def _as_graph_one(
     metadata_context: Optional[Context],
     context_resolver: Optional[Callable],
 ) -> Graph:
-    json_ld = _as_jsonld_one(
-        resource,
-        Form.EXPANDED,
-        store_metadata,
-        model_context,
-        metadata_context,
-        context_resolver,
+    return _as_graph_many(
+        [resource], store_metadata, model_context, metadata_context, context_resolver
     )
-    return Graph().parse(data=json.dumps(json_ld), format="json-ld")
 
 
-def _as_graphs(
+def _add_triples(
+    graph: Graph,
     resource: Resource,
     store_metadata: bool,
+    model_context: Optional[Context],
+    metadata_context: Optional[Context],
+    context_resolver: Optional[Callable],
+    doc_base: str,
+    rdf_contexts: Dict[int, Tuple[Context, JSONLD_Context]],
+) -> None:
+    # Adds the triples of the resource, read from its compacted form with its resolved context, so
+    # that neither a JSON-LD expansion nor a serialisation is needed. Blank nodes and relative IRIs
+    # are as if the expanded form, with the id of the resource, were parsed by rdflib.
+    context = _resource_context(resource, model_context, context_resolver)
+    if store_metadata and resource._store_metadata and not metadata_context:
+        raise NotSupportedError("no available context in the metadata")
+    try:
+        node, _ = _encode_resource(resource, context)
+        del node["@context"]
+        resource_id = _resource_id(resource)
+        if resource_id:
+            node["@id"] = _absolute_iri(resource_id, doc_base)
+        _add_node(graph, node, context, doc_base, rdf_contexts)
+        if store_metadata is True and resource._store_metadata is not None:
+            metadata = resource._store_metadata
+            if "id" not in metadata:
+                raise ValueError("no id in the metadata")
+            metadata, _ = _add_ld_keys(metadata, None, None)
+            if resource_id:
+                metadata["@id"] = node["@id"]
+            _add_node(graph, metadata, metadata_context, doc_base, rdf_contexts)
+    except Exception as e:
+        raise ValueError(e) from e
+
+
+# Method of the JSON-LD parser of rdflib adding the triples of a node with a resolved context,
+# without binding namespaces in the graph as its parse() does. It is private, hence checked for.
+_ADD_TO_GRAPH: Optional[Callable] = getattr(JSONLD_Parser(), "_add_to_graph", None)
+
+
+def _add_node(
+    graph: Graph,
+    node: Dict,
     context: Context,
-    metadata_context: Context,
-) -> Tuple[Graph, Graph, Dict, List[str]]:
-    """Returns a data and a metadata graph"""
+    doc_base: str,
+    rdf_contexts: Dict[int, Tuple[Context, JSONLD_Context]],
+) -> None:
+    if _ADD_TO_GRAPH is not None:
+        _ADD_TO_GRAPH(graph, graph, _rdf_context(context, doc_base, rdf_contexts), node, True)
+    else:
+        document = {CONTEXT: context.document["@context"], **node}
+        graph.parse(data=json.dumps(document), format="json-ld", base=doc_base)
+
+
+def _rdf_context(
+    context: Context, doc_base: str, rdf_contexts: Dict[int, Tuple[Context, JSONLD_Context]]
+) -> JSONLD_Context:
+    # Contexts are shared, see interned_context(): relative IRIs are resolved with a copy of them.
+    # They are kept with their copy so that their id is not reused.
+    if id(context) not in rdf_contexts:
+        rdf_context = context.subcontext({})
+        rdf_context.doc_base = doc_base
+        if rdf_context.base is None:
+            rdf_context.base = doc_base
+        rdf_contexts[id(context)] = (context, rdf_context)
+    return rdf_contexts[id(context)][1]
+
+
+def _absolute_iri(iri: str, base: str) -> str:
+    return iri if ":" in iri else norm_url(base, iri)
+
+
+def _resource_id(resource: Resource) -> Optional[str]:
+    return (
+        resource.id
+        if hasattr(resource, "id")
+        else (getattr(resource, "@id") if hasattr(resource, "@id") else None)
+    )
+
+
+def _encode_resource(
+    resource: Resource, context: Context
+) -> Tuple[Dict, List[str]]:
+    """Returns the resource with JSON-LD keys and the keys of its JSON arrays"""
     if hasattr(resource, "context"):
         output_context = resource.context
     else:
@@ -327,31 +448,22 @@ def _as_graphs(
         )
     converted, json_array = _add_ld_keys(resource, output_context, context.base)
     converted["@context"] = context.document["@context"]
-    return (
-        _dicts_to_graph(
-            converted, resource._store_metadata, store_metadata, metadata_context
-        )
-        + (converted,)
-        + (json_array,)
-    )
-
-
-def _dicts_to_graph(
-    data: Dict, metadata: Dict, store_meta: bool, metadata_context: Context
-) -> Tuple[Graph, Graph]:
-    json_str = json.dumps(data)
-    graph = Graph().parse(data=json_str, format="json-ld")
-    meta_data_graph = Graph()
-    if store_meta is True and metadata is not None:
-        if "id" not in metadata:
-            raise ValueError("no id in the metadata")
-        metadata, _ = _add_ld_keys(metadata, None, None)
-        metadata["@context"] = metadata_context.document["@context"]
-        try:
-            meta_data_graph.parse(data=json.dumps(metadata), format="json-ld")
-        except Exception as e:
-            raise ValueError("generated an invalid json-ld") from e
-    return graph, meta_data_graph
+    return converted, json_array
+
+
+def _metadata_graph(
+    metadata: Optional[Dict], store_meta: bool, metadata_context: Context
+) -> Optional[Graph]:
+    if store_meta is not True or metadata is None:
+        return None
+    if "id" not in metadata:
+        raise ValueError("no id in the metadata")
+    metadata, _ = _add_ld_keys(metadata, None, None)
+    metadata["@context"] = metadata_context.document["@context"]
+    try:
+        return Graph().parse(data=json.dumps(metadata), format="json-ld")
+    except Exception as e:
+        raise ValueError("generated an invalid json-ld") from e
 
 
 def recursive_resolve(
@@ -394,10 +506,10 @@ def _resource_context(
                         "https://bluebrain.github.io/nexus/contexts/metadata.json",
                     ],
                 )
-                context = Context(document, iri)
+                context = interned_context(document, iri)
             except (HTTPError, URLError, NotSupportedError):
                 try:
-                    context = Context(resource.context, iri)
+                    context = interned_context(resource.context, iri)
                 except URLError as e:
                     raise ValueError(f"{resource.context} is not resolvable") from e
     else:
@@ -438,7 +550,7 @@ def _add_ld_keys(
         if k not in Resource._RESERVED:
             if k == "context":
                 if v != context:
-                    local_context = Context(v)
+                    local_context = interned_context(v)
                     base = local_context.base
             else:
                 key = LD_KEYS.get(k, k)
@@ -13,11 +13,11 @@
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
 from copy import deepcopy
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Type
 
+import json
 import os
-import numpy as np
-from pandas import DataFrame
+import time
 from rdflib import Graph
 
 from kgforge.core.resource import Resource
@@ -28,24 +28,38 @@ from kgforge.core.archetypes.mapper import Mapper
 from kgforge.core.archetypes.store import Store
 from kgforge.core.commons.files import load_yaml_from_file
 from kgforge.core.commons.actions import LazyAction
+from kgforge.core.commons.context_cache import (
+    ContextCache,
+    new_context_scope,
+    restored_contexts,
+    using_context_scope,
+)
 from kgforge.core.commons.dictionaries import with_defaults
 from kgforge.core.commons.exceptions import ResolvingError
-from kgforge.core.commons.execution import catch
+from kgforge.core.commons.execution import catch, timed
 from kgforge.core.commons.imports import import_class
 from kgforge.core.commons.strategies import ResolvingStrategy
 from kgforge.core.commons.formatter import Formatter
-from kgforge.core.conversions.dataframe import as_dataframe, from_dataframe
 from kgforge.core.conversions.json import as_json, from_json
 from kgforge.core.conversions.rdf import (
     as_jsonld,
     from_jsonld,
     as_graph,
     from_graph,
+    from_graph_iter,
     Form,
 )
 from kgforge.core.reshaping import Reshaper
 from kgforge.core.wrappings.paths import PathsWrapper, wrap_paths, Filter
 
+if TYPE_CHECKING:
+    # pandas and pyarrow are imported only when dataframes and tables are converted.
+    from pandas import DataFrame
+    from pyarrow import Table
+
+# Version of the format of the files written by KnowledgeGraphForge.save_state().
+STATE_VERSION = 1
+
 
 class KnowledgeGraphForge:
 
@@ -114,6 +128,11 @@ class KnowledgeGraphForge:
          Formatters:
            <identifier>: <a string template with replacement fields delimited by braces, i.e. '{}'>
 
+         ContextCache:
+           directory: <a directory path where resolved JSON-LD contexts are kept, shared by processes>
+           ttl: <a number of seconds after which cached contexts are resolved again, default to 86400>
+           offline: <whether to resolve contexts from the cache only (True) or not (False)>
+
         - A Python dictionary with the following structure:
 
          {
@@ -185,6 +204,11 @@ class KnowledgeGraphForge:
                  "<name>": <str>,
                  ...,
              },
+             "ContextCache": {
+                 "directory": <str>,
+                 "ttl": <float>,
+                 "offline": <bool>,
+             },
          }
 
          In the configuration, Class name could be provided in three formats:
@@ -198,6 +222,10 @@ class KnowledgeGraphForge:
         :param kwargs:  keyword arguments
         """
 
+        # Durations, in seconds, of the construction steps. See startup_timings().
+        self._startup_timings: Dict[str, float] = {}
+        start = time.perf_counter()
+
         self.set_environment_variables()
 
         if isinstance(configuration, str):
@@ -211,54 +239,67 @@ class KnowledgeGraphForge:
         # Debugging.
         self._debug = kwargs.pop("debug", False)
 
-        # Store.
-        store_config = config.pop("Store")
-        store_config.update(kwargs)
-
-        # Model.
-        model_config = config.pop("Model")
-        if model_config["origin"] == "store":
-            with_defaults(
-                model_config,
-                store_config,
-                "source",
-                "name",
-                ["endpoint", "token", "bucket", "vocabulary"],
-            )
-        model_name = model_config.pop("name")
-        model = import_class(model_name, "models")
-        self._model: Model = model(**model_config)
-
-        # Store.
-        store_name = store_config.pop("name")
-        store_model_config = store_config.pop("model", None)
-        if store_model_config:
-            store_model_name = store_model_config.pop("name")
-            if store_model_name != model_name:
-                # Same model, different config
-                store_model = import_class(store_model_name, "models")
-                store_config["model"] = store_model(**store_model_config)
-            else:
-                # Same model, same config
-                store_config["model"] = self._model
-        else:
-            raise ValueError(f"Missing model configuration for store {store_name}")
-        store = import_class(store_name, "stores")
-        self._store: Store = store(**store_config)
-        store_config.update(name=store_name)
-
-        # Resolvers.
-        resolvers_config = config.pop("Resolvers", None)
-        # Format: Optional[Dict[scope_name, Dict[resolver_name, Resolver]]].
-        self._resolvers: Optional[Dict[str, Dict[str, Resolver]]] = (
-            prepare_resolvers(resolvers_config, store_config)
-            if resolvers_config
-            else None
+        # Contexts, cached before the Model and the Store resolve theirs. The cache, and the record
+        # of the resolved contexts, are the ones of this forge only: its services keep using them
+        # once initialized.
+        context_cache_config = config.pop("ContextCache", None)
+        self._context_scope = new_context_scope(
+            ContextCache(**context_cache_config) if context_cache_config is not None else None
         )
+        with using_context_scope(self._context_scope):
+            # Store.
+            store_config = config.pop("Store")
+            store_config.update(kwargs)
+
+            # Model.
+            model_config = config.pop("Model")
+            if model_config["origin"] == "store":
+                with_defaults(
+                    model_config,
+                    store_config,
+                    "source",
+                    "name",
+                    ["endpoint", "token", "bucket", "vocabulary"],
+                )
+            model_name = model_config.pop("name")
+            model = import_class(model_name, "models")
+            with timed(self._startup_timings, "model"):
+                self._model: Model = model(**model_config)
+
+            # Store.
+            store_name = store_config.pop("name")
+            store_model_config = store_config.pop("model", None)
+            if store_model_config:
+                store_model_name = store_model_config.pop("name")
+                if store_model_name != model_name:
+                    # Same model, different config
+                    store_model = import_class(store_model_name, "models")
+                    store_config["model"] = store_model(**store_model_config)
+                else:
+                    # Same model, same config
+                    store_config["model"] = self._model
+            else:
+                raise ValueError(f"Missing model configuration for store {store_name}")
+            store = import_class(store_name, "stores")
+            with timed(self._startup_timings, "store"):
+                self._store: Store = store(**store_config)
+            store_config.update(name=store_name)
+
+            # Resolvers.
+            resolvers_config = config.pop("Resolvers", None)
+            # Format: Optional[Dict[scope_name, Dict[resolver_name, Resolver]]].
+            with timed(self._startup_timings, "resolvers"):
+                self._resolvers: Optional[Dict[str, Dict[str, Resolver]]] = (
+                    prepare_resolvers(resolvers_config, store_config)
+                    if resolvers_config
+                    else None
+                )
 
         # Formatters.
         self._formatters: Optional[Dict[str, str]] = config.pop("Formatters", None)
 
+        self._startup_timings["total"] = time.perf_counter() - start
+
     @staticmethod
     def set_environment_variables():
         # Set environment variable for pyshacl
@@ -644,6 +685,28 @@ class KnowledgeGraphForge:
             id_=id, version=version, cross_bucket=cross_bucket, **params
         )
 
+    # No @catch because errors are raised to the awaiting caller.
+    async def aretrieve(
+        self,
+        id: Union[str, List[str]],
+        version: Optional[Union[int, str, List[Union[str, int]]]] = None,
+        cross_bucket: bool = False,
+        **params
+    ) -> Union[Optional[Resource], List[Optional[Resource]]]:
+        """
+        Asynchronous counterpart of retrieve(), to be awaited from a running event loop without
+        blocking it. Errors are raised instead of being printed.
+
+        :param id: the resource identifier to retrieve
+        :param version: a version of the resource to retrieve
+        :param cross_bucket: instructs the configured store to whether search beyond the configured bucket (True) or not (False)
+        :param params: a dictionary of parameters.
+        :return: Resource
+        """
+        return await self._store.aretrieve(
+            id_=id, version=version, cross_bucket=cross_bucket, **params
+        )
+
     @catch
     def paths(self, type: str) -> PathsWrapper:
         """
@@ -671,6 +734,44 @@ class KnowledgeGraphForge:
         )
         return self._store.search(resolvers=resolvers, *filters, **params)
 
+    # No @catch because errors are raised to the awaiting caller.
+    async def asearch(self, *filters: Union[Dict, Filter], **params) -> List[Resource]:
+        """
+        Asynchronous counterpart of search(), to be awaited from a running event loop without
+        blocking it. Errors are raised instead of being printed.
+
+        :param filters: a list of filters
+        :param params: a dictionary of parameters
+        :return: List[Resource]
+        """
+        resolvers = (
+            list(self._resolvers.values()) if self._resolvers is not None else None
+        )
+        return await self._store.asearch(*filters, resolvers=resolvers, **params)
+
+    # No @catch because errors are raised while iterating.
+    def search_iter(
+        self, *filters: Union[Dict, Filter], page_size: int = 100, **params
+    ) -> Iterator[Resource]:
+        """
+        Lazily iterate over the resources found by search(), fetched page by page. Pages are
+        ordered by the param keyset ('id' by default, or '_createdAt') and each one starts after
+        the last resource of the previous one, so that walking through a large result set does
+        not get slower page after page as with an offset. The next page is fetched while the
+        resources of the current one are consumed. Errors are raised instead of being printed.
+
+        :param filters: a list of filters
+        :param page_size: the number of resources fetched per page
+        :param params: a dictionary of parameters, as for search() except limit and offset
+        :return: Iterator[Resource]
+        """
+        resolvers = (
+            list(self._resolvers.values()) if self._resolvers is not None else None
+        )
+        return self._store.search_iter(
+            *filters, resolvers=resolvers, page_size=page_size, **params
+        )
+
     @catch
     def sparql(
         self,
@@ -692,6 +793,49 @@ class KnowledgeGraphForge:
         """
         return self._store.sparql(query, debug, limit, offset, **params)
 
+    # No @catch because errors are raised to the awaiting caller.
+    async def asparql(
+        self,
+        query: str,
+        debug: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **params,
+    ) -> List[Resource]:
+        """
+        Asynchronous counterpart of sparql(), to be awaited from a running event loop without
+        blocking it. Errors are raised instead of being printed.
+
+        :param query: a SPARQL query
+        :param debug: a boolean
+        :param limit: the number of resources to retrieve. Default to 100. If provided in query limit will be replaced
+        :param offset: how many results to skip from the first one. If provided in query offset will be replaced
+        :param params: a dictionary of parameters. Supported params are: rewrite (whether to rewrite the sparql query or run it as is)
+        :return: List[Resource]
+        """
+        return await self._store.asparql(query, debug, limit, offset, **params)
+
+    # No @catch because errors are raised while iterating.
+    def sparql_iter(
+        self,
+        query: str,
+        debug: bool = False,
+        page_size: int = 100,
+        **params,
+    ) -> Iterator[Resource]:
+        """
+        Lazily iterate over the resources found by a SPARQL query, fetched page by page as with
+        search_iter(). The query should select ?id, and ?_createdAt when keyset='_createdAt', and
+        should not have an ORDER BY clause. Errors are raised instead of being printed.
+
+        :param query: a SPARQL query
+        :param debug: a boolean
+        :param page_size: the number of resources fetched per page. Limit and offset in the query are replaced
+        :param params: a dictionary of parameters. Supported params are: rewrite (whether to rewrite the sparql query or run it as is), keyset (the variables ordering the pages, 'id' or '_createdAt')
+        :return: Iterator[Resource]
+        """
+        return self._store.sparql_iter(query, debug, page_size, **params)
+
     @catch
     def elastic(
         self,
@@ -712,6 +856,49 @@ class KnowledgeGraphForge:
         """
         return self._store.elastic(query, debug, limit, offset, **params)
 
+    # No @catch because errors are raised to the awaiting caller.
+    async def aelastic(
+        self,
+        query: str,
+        debug: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **params,
+    ) -> Union[List[Resource], Resource, List[Dict], Dict]:
+        """
+        Asynchronous counterpart of elastic(), to be awaited from a running event loop without
+        blocking it. Errors are raised instead of being printed.
+
+        :param query: an ElasticSerach DSL query
+        :param debug: a boolean
+        :param limit: the number of resources to retrieve
+        :param offset: how many results to skip from the first one
+        :return: List[Resource]
+        """
+        return await self._store.aelastic(query, debug, limit, offset, **params)
+
+    # No @catch because errors are raised while iterating.
+    def elastic_iter(
+        self,
+        query: str,
+        debug: bool = False,
+        page_size: int = 100,
+        **params,
+    ) -> Iterator[Union[Resource, Dict]]:
+        """
+        Lazily iterate over all the results of an ElasticSearch DSL query, fetched page by page
+        with search_after. Unlike with limit and offset, the results are not restricted to the
+        first 10,000 ones. Hits are sorted as in the query then by @id. The next page is fetched
+        while the results of the current one are consumed. Errors are raised instead of being printed.
+
+        :param query: an ElasticSerach DSL query
+        :param debug: a boolean
+        :param page_size: the number of results fetched per page. Size and from in the query are replaced
+        :param params: a dictionary of parameters, as for elastic()
+        :return: Iterator[Union[Resource, Dict]]
+        """
+        return self._store.elastic_iter(query, debug, page_size, **params)
+
     @catch
     def download(
         self,
@@ -735,6 +922,30 @@ class KnowledgeGraphForge:
         # path: DirPath.
         self._store.download(data, follow, path, overwrite, cross_bucket, content_type)
 
+    # No @catch because errors are raised to the awaiting caller.
+    async def adownload(
+        self,
+        data: Union[Resource, List[Resource]],
+        follow: str = "distribution.contentUrl",
+        path: str = ".",
+        overwrite: bool = False,
+        cross_bucket: bool = False,
+        content_type: str = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of download(), to be awaited from a running event loop without
+        blocking it. Errors are raised instead of being printed.
+
+        :param data: the resources whose attached files to download
+        :param follow: the property path holding a URL to download the files
+        :param path: where to output the downloaded files
+        :param overwrite: whether to replace (True) and existing file with the same name or not (False)
+        :param cross_bucket: instructs the configured store to whether download files beyond the configured bucket (True) or not (False)
+        :param content_type: the content_type of the files to download
+        """
+        # path: DirPath.
+        await self._store.adownload(data, follow, path, overwrite, cross_bucket, content_type)
+
     # Storing User Interface.
 
     # No @catch because the error handling is done by execution.run().
@@ -750,6 +961,35 @@ class KnowledgeGraphForge:
         # self._store.mapper = self._store.mapper(self)
         self._store.register(data, schema_id)
 
+    # No @catch because the error handling is done by execution.run().
+    async def aregister(
+        self, data: Union[Resource, List[Resource]], schema_id: Optional[str] = None
+    ) -> None:
+        """
+        Asynchronous counterpart of register(), to be awaited from a running event loop without
+        blocking it.
+
+        :param data: the resources to register
+        :param schema_id: an identifier of the schema the registered resources should conform to
+        """
+        await self._store.aregister(data, schema_id)
+
+    # No @catch because the error handling is done by execution.run_stream().
+    def register_stream(
+        self, data: Iterable[Resource], schema_id: Optional[str] = None
+    ) -> Iterator[Resource]:
+        """
+        Store resources pulled lazily from an iterable, e.g. a generator, in the configured Store.
+        Each resource is yielded back as soon as it has been processed, possibly not in the input
+        order, with its outcome in its _last_action and _synchronized attributes. Resources are
+        only pulled from data as the yielded ones are consumed.
+
+        :param data: the resources to register
+        :param schema_id: an identifier of the schema the registered resources should conform to
+        :return: Iterator[Resource]
+        """
+        return self._store.register_stream(data, schema_id)
+
     # No @catch because the error handling is done by execution.run().
     def update(
         self, data: Union[Resource, List[Resource]], schema_id: Optional[str] = None
@@ -762,6 +1002,33 @@ class KnowledgeGraphForge:
         """
         self._store.update(data, schema_id)
 
+    # No @catch because the error handling is done by execution.run().
+    async def aupdate(
+        self, data: Union[Resource, List[Resource]], schema_id: Optional[str] = None
+    ) -> None:
+        """
+        Asynchronous counterpart of update(), to be awaited from a running event loop without
+        blocking it.
+
+        :param data: the resources to update
+        :param schema_id: an identifier of the schema the updated resources should conform to
+        """
+        await self._store.aupdate(data, schema_id)
+
+    # No @catch because the error handling is done by execution.run_stream().
+    def update_stream(
+        self, data: Iterable[Resource], schema_id: Optional[str] = None
+    ) -> Iterator[Resource]:
+        """
+        Update resources pulled lazily from an iterable in the configured Store. See
+        register_stream() for how the updated resources are yielded.
+
+        :param data: the resources to update
+        :param schema_id: an identifier of the schema the updated resources should conform to
+        :return: Iterator[Resource]
+        """
+        return self._store.update_stream(data, schema_id)
+
     # No @catch because the error handling is done by execution.run().
     def deprecate(self, data: Union[Resource, List[Resource]]) -> None:
         """
@@ -771,6 +1038,17 @@ class KnowledgeGraphForge:
         """
         self._store.deprecate(data)
 
+    # No @catch because the error handling is done by execution.run_stream().
+    def deprecate_stream(self, data: Iterable[Resource]) -> Iterator[Resource]:
+        """
+        Deprecate resources pulled lazily from an iterable. See register_stream() for how the
+        deprecated resources are yielded.
+
+        :param data: the resources to deprecate
+        :return: Iterator[Resource]
+        """
+        return self._store.deprecate_stream(data)
+
     # Versioning User Interface.
 
     # No @catch because the error handling is done by execution.run().
@@ -783,6 +1061,18 @@ class KnowledgeGraphForge:
         """
         self._store.tag(data, value)
 
+    # No @catch because the error handling is done by execution.run_stream().
+    def tag_stream(self, data: Iterable[Resource], value: str) -> Iterator[Resource]:
+        """
+        Assign a tag (value) to resources pulled lazily from an iterable. See register_stream()
+        for how the tagged resources are yielded.
+
+        :param data: the resources to tag
+        :param value: the tag value
+        :return: Iterator[Resource]
+        """
+        return self._store.tag_stream(data, value)
+
     # No @catch because the error handling is done by execution.run().
     def freeze(self, data: Union[Resource, List[Resource]]) -> None:
         """
@@ -808,6 +1098,21 @@ class KnowledgeGraphForge:
         # path: Union[FilePath, DirPath].
         return LazyAction(self._store.upload, path, content_type, self)
 
+    # No @catch because errors are raised to the awaiting caller.
+    async def aupload(
+        self, path: str, content_type: str = None
+    ) -> Union[Resource, List[Resource]]:
+        """
+        Upload files located in a provided path without blocking the running event loop. Unlike
+        attach(), the files are uploaded right away and the resources mapped from their metadata
+        are returned, to be used as the value of a property of the resources to register.
+
+        :param path: path to upload files from
+        :param content_type: the content_type of the files to upload
+        :return: Union[Resource, List[Resource]]
+        """
+        return await self._store.aupload(path, content_type, self)
+
     # Converting User Interface.
 
     @catch
@@ -888,7 +1193,7 @@ class KnowledgeGraphForge:
         nesting: str = ".",
         expanded: bool = False,
         store_metadata: bool = False,
-    ) -> DataFrame:
+    ) -> "DataFrame":
         """
         Convert a resource or a list of resources to pandas.DataFrame.
 
@@ -899,6 +1204,7 @@ class KnowledgeGraphForge:
         :param store_metadata: whether to add (True) store related metadata (e.g rev) to the output or not (False)
         :return: pandas.DataFrame
         """
+        from kgforge.core.conversions.dataframe import as_dataframe
         return as_dataframe(
             data,
             na,
@@ -910,6 +1216,74 @@ class KnowledgeGraphForge:
             self._model.resolve_context,
         )
 
+    @catch
+    def as_arrow(
+        self,
+        data: Union[Resource, List[Resource]],
+        na: Union[Any, List[Any]] = [None],
+        nesting: str = ".",
+        expanded: bool = False,
+        store_metadata: bool = False,
+    ) -> "Table":
+        """
+        Convert a resource or a list of resources to pyarrow.Table, with the columns of as_dataframe().
+
+        :param data: the resources to convert
+        :param na: represents missing values
+        :param nesting: str to use to join when flattening nested properties as columns
+        :param expanded: whether to expand (True) resources' properties as URIs using a JSON-LD context (if any) or not (False)
+        :param store_metadata: whether to add (True) store related metadata (e.g rev) to the output or not (False)
+        :return: pyarrow.Table
+        """
+        from kgforge.core.conversions.arrow import as_arrow
+        return as_arrow(
+            data,
+            na,
+            nesting,
+            expanded,
+            store_metadata,
+            self._model.context(),
+            self._store.metadata_context,
+            self._model.resolve_context,
+        )
+
+    @catch
+    def to_parquet(
+        self,
+        data: Union[Resource, Iterable[Resource]],
+        path: str,
+        na: Union[Any, List[Any]] = [None],
+        nesting: str = ".",
+        expanded: bool = False,
+        store_metadata: bool = False,
+        batch_size: int = 10000,
+    ) -> None:
+        """
+        Write a resource or resources to a Parquet file, converting them by batches with as_arrow().
+
+        :param data: the resources to write, e.g. an iterator
+        :param path: the path of the Parquet file
+        :param na: represents missing values
+        :param nesting: str to use to join when flattening nested properties as columns
+        :param expanded: whether to expand (True) resources' properties as URIs using a JSON-LD context (if any) or not (False)
+        :param store_metadata: whether to add (True) store related metadata (e.g rev) to the output or not (False)
+        :param batch_size: the number of resources converted at once
+        :return: None
+        """
+        from kgforge.core.conversions.arrow import to_parquet
+        to_parquet(
+            data,
+            path,
+            na,
+            nesting,
+            expanded,
+            store_metadata,
+            self._model.context(),
+            self._store.metadata_context,
+            self._model.resolve_context,
+            batch_size,
+        )
+
     @catch
     def from_json(
         self, data: Union[Dict, List[Dict]], na: Union[Any, List[Any]] = None
@@ -956,9 +1330,33 @@ class KnowledgeGraphForge:
         context = self._model.context() if use_model_context else None
         return from_graph(data, type, frame, context)
 
+    # No @catch because errors are raised while iterating.
+    def from_graph_iter(
+        self,
+        data: Graph,
+        type: Union[str, List[str]] = None,
+        use_model_context=False,
+        chunk_size: int = 1000,
+    ) -> Iterator[Resource]:
+        """
+        Lazily convert a RDFLib.Graph object to resources, as from_graph() without a frame does.
+        The resources are built chunk by chunk from an index of the triples by subject, so that
+        those of a large graph are not all held in memory at once. Within a chunk, as for the
+        resources returned by from_graph(), the identifiers of blank nodes referred to only once
+        are removed. Errors are raised instead of being printed.
+
+        :param data: the RDFLib.Graph object to convert
+        :param type: the types of RDF resources to convert from the RDFLib.Graph object
+        :param use_model_context: whether to use  (True) the JSON-LD context from the configured Model or not (False)
+        :param chunk_size: the number of resources built at once
+        :return: Iterator[Resource]
+        """
+        context = self._model.context() if use_model_context else None
+        return from_graph_iter(data, type, context, chunk_size)
+
     @catch
     def from_dataframe(
-        self, data: DataFrame, na: Union[Any, List[Any]] = np.nan, nesting: str = "."
+        self, data: "DataFrame", na: Union[Any, List[Any]] = float("nan"), nesting: str = "."
     ) -> Union[Resource, List[Resource]]:
         """
         Convert a pandas.DataFrame to a resource or a list of resources.
@@ -968,8 +1366,76 @@ class KnowledgeGraphForge:
         :param nesting: str to use to detect nested nested properties
         :return: Union[Resource, List[Resource]]
         """
+        from kgforge.core.conversions.dataframe import from_dataframe
         return from_dataframe(data, na, nesting)
 
+    def startup_timings(self) -> Dict[str, float]:
+        """
+        Return the durations, in seconds, of the steps of the construction of the forge: 'model',
+        'store', 'resolvers' and 'total'. The steps of the model and store services, like the fetch
+        of the project context, follow with their name prefixed by 'model.' or 'store.'. Steps
+        deferred until first use, like building the shapes map of a model, are listed once done.
+
+        :return: Dict[str, float]
+        """
+        timings = dict(self._startup_timings)
+        for prefix, archetype in (("model", self._model), ("store", self._store)):
+            service_timings = getattr(getattr(archetype, "service", None), "startup_timings", {})
+            timings.update({f"{prefix}.{k}": v for k, v in service_timings.items()})
+        return timings
+
+    @catch
+    def save_state(self, path: str) -> None:
+        """
+        Save to a file what the forge loaded at its initialization and while it was used: the
+        resolved contexts and, for a model following SHACL shapes, its shapes and ontologies maps
+        and the loaded schemas and ontologies. The forge can then be restored from the file with
+        KnowledgeGraphForge.from_state() without loading them again. Credentials (i.e. tokens) are
+        not saved.
+
+        :param path: the path of the file to write
+        :return: None
+        """
+        state = {
+            "version": STATE_VERSION,
+            "config": _without_credentials(self._config["config"]),
+            "kwargs": _without_credentials(self._config["kwargs"]),
+            "freshness": self._store.freshness(),
+            "contexts": dict(self._context_scope.resolved),
+            "model": self._model.state(),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    @classmethod
+    def from_state(cls, path: str, check_freshness: bool = True, **kwargs) -> "KnowledgeGraphForge":
+        """
+        Create a forge from a file written by save_state(), without loading again what was saved.
+        Credentials should be provided again as keyword arguments, e.g. token.
+        With check_freshness=True, the store is asked whether what the saved state depends on has
+        changed since it was saved, in which case the forge is initialized from scratch instead.
+
+        :param path: the path of a file written by save_state()
+        :param check_freshness: whether to check that the saved state is still up to date (True) or not (False)
+        :param kwargs: keyword arguments, as for KnowledgeGraphForge(...)
+        :return: KnowledgeGraphForge
+        """
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"{path} is not a forge state of version {STATE_VERSION}")
+        kwargs = {**state["kwargs"], **kwargs}
+        with restored_contexts(state["contexts"]):
+            forge = cls(state["config"], **kwargs)
+        if check_freshness and forge._store.freshness() != state["freshness"]:
+            # The forge initialized from the outdated state is replaced: its I/O is released now.
+            forge._store.close()
+            forge._model.close()
+            return cls(state["config"], **kwargs)
+        if state["model"] is not None:
+            forge._model.restore_state(state["model"])
+        return forge
+
     def get_store_context(self):
         """Expose the context used in the store."""
         return self._store.context
@@ -979,6 +1445,14 @@ class KnowledgeGraphForge:
         return self._model.context()
 
 
+def _without_credentials(config: Any) -> Any:
+    if isinstance(config, dict):
+        return {k: _without_credentials(v) for k, v in config.items() if k != "token"}
+    if isinstance(config, list):
+        return [_without_credentials(x) for x in config]
+    return config
+
+
 def prepare_resolvers(
     config: Dict, store_config: Dict
 ) -> Dict[str, Dict[str, Resolver]]:
@@ -88,7 +88,7 @@ class Resource:
     def _get_synchronized(self) -> bool:
         inner = []
         for v in self.__dict__.values():
-            if isinstance(v, List):
+            if isinstance(v, list):
                 for iv in v:
                     self._sync_resource(iv, inner)
             else:
@@ -103,11 +103,10 @@ class Resource:
     def _set_synchronized(self, sync: bool) -> None:
         inner = []
         for v in self.__dict__.values():
-            if isinstance(v, List):
-                for iv in v:
-                    self._sync_resource(iv, inner, sync_value=False)
-            else:
-                self._sync_resource(v, inner, sync_value=False)
+            if isinstance(v, list):
+                inner.extend(iv for iv in v if isinstance(iv, Resource))
+            elif isinstance(v, Resource):
+                inner.append(v)
         if inner:
             for iresource in inner:
                 iresource._synchronized = sync
@@ -148,9 +147,9 @@ class Resource:
     def from_json(cls, data: Union[Dict, List[Dict]], na: Union[Any, List[Any]] = None):
 
         def _(d: Union[Dict, List[Dict]], nas: List[Any]) -> Resource:
-            if isinstance(d, List):
+            if isinstance(d, list):
                 return [_(x, nas) for x in d]
-            if isinstance(d, Dict):
+            if isinstance(d, dict):
                 properties = {k: _(v, nas) for k, v in d.items() if v not in nas}
                 return Resource(**properties)
 
@@ -12,4 +12,15 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
-from .dictionaries import DictionaryMapper
+from typing import TYPE_CHECKING
+
+from kgforge.core.commons.imports import lazy_classes
+
+if TYPE_CHECKING:
+    from .dictionaries import DictionaryMapper
+
+__all__ = ["DictionaryMapper"]
+
+__getattr__ = lazy_classes(__name__, {
+    "DictionaryMapper": ".dictionaries",
+})
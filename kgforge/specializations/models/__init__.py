@@ -12,5 +12,17 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
-from .demo_model import DemoModel
-from .rdf_model import RdfModel
+from typing import TYPE_CHECKING
+
+from kgforge.core.commons.imports import lazy_classes
+
+if TYPE_CHECKING:
+    from .demo_model import DemoModel
+    from .rdf_model import RdfModel
+
+__all__ = ["DemoModel", "RdfModel"]
+
+__getattr__ = lazy_classes(__name__, {
+    "DemoModel": ".demo_model",
+    "RdfModel": ".rdf_model",
+})
@@ -11,8 +11,9 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+import threading
 import types
-from typing import List, Dict, Tuple, Set, Optional
+from typing import Any, Callable, List, Dict, Tuple, Set, Optional
 from abc import abstractmethod
 from pyshacl.constraints import ALL_CONSTRAINT_PARAMETERS
 from pyshacl.shape import Shape
@@ -28,7 +29,9 @@ from rdflib.exceptions import ParserError
 
 from kgforge.core.resource import Resource
 from kgforge.core.commons.context import Context
+from kgforge.core.commons.context_cache import get_context_scope
 from kgforge.core.commons.exceptions import ConfigurationError
+from kgforge.core.commons.execution import timed
 from kgforge.core.conversions.rdf import as_graph
 from kgforge.specializations.models.rdf.collectors import (
     AndCollector,
@@ -163,17 +166,100 @@ class RdfService:
         self._init_shape_graph_wrapper()
         self.NXV = Namespace("https://bluebrain.github.io/nexus/vocabulary/")
         self._context_cache = {}
+        # Contexts resolved after the initialization still go through the forge context cache and
+        # are recorded as resolved by the forge.
+        self.context_scope = get_context_scope()
         resolved_context = self.resolve_context(context_iri)
         self.context = Context(resolved_context, context_iri)
-        (
-            self.class_to_shape,
-            self.shape_to_defining_resource,
-            self.defining_resource_to_named_graph,
-        ) = self._build_shapes_map()
-        self.ont_to_named_graph = self._build_ontology_map()
+        # The shapes and ontology maps are built on first use. Their durations are reported in
+        # startup_timings.
+        self.startup_timings: Dict[str, float] = {}
+        self._maps: Optional[Tuple[Tuple[Dict, Dict, Dict], Dict]] = None
+        self._maps_lock = threading.Lock()
         self._imported = []
         self._defining_resource_to_imported_ontology = {}
 
+    @property
+    def class_to_shape(self) -> Dict:
+        return self._get_maps()[0][0]
+
+    @property
+    def shape_to_defining_resource(self) -> Dict:
+        return self._get_maps()[0][1]
+
+    @property
+    def defining_resource_to_named_graph(self) -> Dict:
+        return self._get_maps()[0][2]
+
+    @property
+    def ont_to_named_graph(self) -> Dict:
+        return self._get_maps()[1]
+
+    def _get_maps(self) -> Tuple[Tuple[Dict, Dict, Dict], Dict]:
+        with self._maps_lock:
+            if self._maps is None:
+                self._maps = self._build_maps()
+            return self._maps
+
+    def _build_maps(self) -> Tuple[Tuple[Dict, Dict, Dict], Dict]:
+        return (
+            self._timed("shapes_map", self._build_shapes_map),
+            self._timed("ontology_map", self._build_ontology_map),
+        )
+
+    def _timed(self, step: str, fun: Callable[[], Any]) -> Any:
+        with timed(self.startup_timings, step):
+            return fun()
+
+    def state(self) -> Dict:
+        """Serialise what was loaded from the source: the maps, the loaded schemas and ontologies
+
+        Returns:
+            A JSON serialisable Dict to be given to restore_state()
+        """
+        shapes_map, ontology_map = self._get_maps()
+        resource_to_named_graph = {**shapes_map[2], **ontology_map}
+        return {
+            "shapes_map": [_str_map(m) for m in shapes_map],
+            "ontology_map": _str_map(ontology_map),
+            "imported": [str(x) for x in self._imported],
+            "imported_ontologies": {
+                str(k): [str(x) for x in v]
+                for k, v in self._defining_resource_to_imported_ontology.items()
+            },
+            # Graph identifiers can be relative paths, which N-Quads does not allow.
+            "graphs": {
+                str(g): self._dataset_graph.graph(g).serialize(format="nt")
+                for g in {resource_to_named_graph[x] for x in self._imported}
+            },
+        }
+
+    def restore_state(self, state: Dict) -> None:
+        """Restore what state() returned instead of loading it from the source
+
+        Args:
+            state: a Dict returned by state()
+        """
+        # Blank nodes are shared between the graphs, as graphs of imported resources are merged.
+        bnode_context = {}
+        for graph_id, triples in state["graphs"].items():
+            graph = self._dataset_graph.graph(URIRef(graph_id))
+            graph.remove((None, None, None))
+            graph.parse(data=triples, format="nt", bnode_context=bnode_context)
+        self._init_shape_graph_wrapper()
+        with self._maps_lock:
+            self._maps = (
+                tuple(_uriref_map(m) for m in state["shapes_map"]),
+                _uriref_map(state["ontology_map"]),
+            )
+        self._imported = [URIRef(x) for x in state["imported"]]
+        self._defining_resource_to_imported_ontology = {
+            URIRef(k): [URIRef(x) for x in v] for k, v in state["imported_ontologies"].items()
+        }
+
+    def close(self) -> None:
+        """Release what the service holds until garbage collected"""
+
     @abstractmethod
     def schema_source_id(self, shape_uri: str) -> str:
         """Id of the source from which the shape is accessible (e.g. bucket, file path, ...)
@@ -667,3 +753,11 @@ class RdfService:
             return self.class_to_shape[URIRef(type_expanded_cls)]
         except Exception as ke:
             raise TypeError(f"Unknown type '{fragment}': {ke}") from ke
+
+
+def _str_map(map_: Dict[URIRef, URIRef]) -> Dict[str, str]:
+    return {str(k): str(v) for k, v in map_.items()}
+
+
+def _uriref_map(map_: Dict[str, str]) -> Dict[URIRef, URIRef]:
+    return {URIRef(k): URIRef(v) for k, v in map_.items()}
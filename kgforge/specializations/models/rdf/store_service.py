@@ -11,6 +11,7 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Union, List, Tuple
 
 import json
@@ -49,6 +50,10 @@ class StoreService(RdfService):
         )
         super().__init__(RDFDataset(), context_iri)
 
+    def close(self) -> None:
+        self.default_store.close()
+        self.context_store.close()
+
     def schema_source_id(self, shape_uri: str) -> str:
         return str(self.shape_to_defining_resource[URIRef(shape_uri)])
 
@@ -77,6 +82,13 @@ class StoreService(RdfService):
         self._init_shape_graph_wrapper()
         return self._generate_context()
 
+    def _build_maps(self) -> Tuple[Tuple[Dict, Dict, Dict], Dict]:
+        # The paginated queries of both maps are independent and are run concurrently.
+        with ThreadPoolExecutor(2, thread_name_prefix="kgforge-startup") as executor:
+            shapes_map = executor.submit(self._timed, "shapes_map", self._build_shapes_map)
+            ontology_map = executor.submit(self._timed, "ontology_map", self._build_ontology_map)
+        return shapes_map.result(), ontology_map.result()
+
     def _build_shapes_map(self) -> Tuple[Dict, Dict, Dict]:
         query = build_shacl_query(
             defining_property_uri=self.NXV.shapes,
@@ -27,6 +27,7 @@ from kgforge.core.archetypes.store import Store
 from kgforge.core.archetypes.model import Model
 from kgforge.core.commons.actions import Action
 from kgforge.core.commons.context import Context
+from kgforge.core.commons.context_cache import using_context_scope
 from kgforge.core.commons.exceptions import ValidationError
 from kgforge.core.commons.execution import run, not_supported
 from kgforge.specializations.models.rdf.collectors import NodeProperties
@@ -85,7 +86,8 @@ class RdfModel(Model):
         return self.service.context
 
     def resolve_context(self, iri: str) -> Dict:
-        return self.service.resolve_context(iri)
+        with using_context_scope(self.service.context_scope):
+            return self.service.resolve_context(iri)
 
     def _generate_context(self) -> Context:
         document = self.service.generate_context()
@@ -197,6 +199,17 @@ class RdfModel(Model):
             ont_graph=ont_graph, short_message=False, raise_=True, context=self.service.context
         )
 
+    # State.
+
+    def state(self) -> Optional[Dict]:
+        return self.service.state()
+
+    def restore_state(self, state: Dict) -> None:
+        self.service.restore_state(state)
+
+    def close(self) -> None:
+        self.service.close()
+
     # Utils.
 
     @staticmethod
@@ -12,8 +12,23 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
-from kgforge.specializations.resolvers.demo_resolver import DemoResolver
-from kgforge.specializations.resolvers.agent_resolver import AgentResolver
-from kgforge.specializations.resolvers.ontology_resolver import OntologyResolver
-from kgforge.specializations.resolvers.entity_linking.entity_linker import EntityLinker
-from kgforge.specializations.resolvers.entity_linking.entity_linker_elastic import EntityLinkerElastic
+from typing import TYPE_CHECKING
+
+from kgforge.core.commons.imports import lazy_classes
+
+if TYPE_CHECKING:
+    from .demo_resolver import DemoResolver
+    from .agent_resolver import AgentResolver
+    from .ontology_resolver import OntologyResolver
+    from .entity_linking.entity_linker import EntityLinker
+    from .entity_linking.entity_linker_elastic import EntityLinkerElastic
+
+__all__ = ["DemoResolver", "AgentResolver", "OntologyResolver", "EntityLinker", "EntityLinkerElastic"]
+
+__getattr__ = lazy_classes(__name__, {
+    "DemoResolver": ".demo_resolver",
+    "AgentResolver": ".agent_resolver",
+    "OntologyResolver": ".ontology_resolver",
+    "EntityLinker": ".entity_linking.entity_linker",
+    "EntityLinkerElastic": ".entity_linking.entity_linker_elastic",
+})
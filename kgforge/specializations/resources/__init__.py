@@ -12,5 +12,17 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
-from .datasets import Dataset
-from .entity_linking_candidate import EntityLinkingCandidate
+from typing import TYPE_CHECKING
+
+from kgforge.core.commons.imports import lazy_classes
+
+if TYPE_CHECKING:
+    from .datasets import Dataset
+    from .entity_linking_candidate import EntityLinkingCandidate
+
+__all__ = ["Dataset", "EntityLinkingCandidate"]
+
+__getattr__ = lazy_classes(__name__, {
+    "Dataset": ".datasets",
+    "EntityLinkingCandidate": ".entity_linking_candidate",
+})
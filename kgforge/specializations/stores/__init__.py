@@ -12,5 +12,17 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
-from .bluebrain_nexus import BlueBrainNexus
-from .demo_store import DemoStore
+from typing import TYPE_CHECKING
+
+from kgforge.core.commons.imports import lazy_classes
+
+if TYPE_CHECKING:
+    from .bluebrain_nexus import BlueBrainNexus
+    from .demo_store import DemoStore
+
+__all__ = ["BlueBrainNexus", "DemoStore"]
+
+__getattr__ = lazy_classes(__name__, {
+    "BlueBrainNexus": ".bluebrain_nexus",
+    "DemoStore": ".demo_store",
+})
@@ -16,25 +16,30 @@ import os
 import asyncio
 import copy
 import collections
+import hashlib
 
 import json
 import mimetypes
 import re
-from asyncio import Semaphore, Task, AbstractEventLoop
+import time
+from asyncio import Task
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, Type, Callable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, Type, Callable
 from urllib.parse import quote_plus, unquote, urlparse, parse_qs
 
 import aiohttp
 import requests
-from aiohttp import ClientSession, MultipartWriter, hdrs, ClientResponseError
+from aiohttp import ClientPayloadError, ClientSession, MultipartWriter, hdrs, ClientResponseError
 from aiohttp.hdrs import CONTENT_DISPOSITION, CONTENT_TYPE
 
 from kgforge.core.commons.constants import DEFAULT_REQUEST_TIMEOUT
 from kgforge.core.commons.dictionaries import update_dict
 from kgforge.core.commons.es_query_builder import ESQueryBuilder
 from kgforge.core.commons.sparql_query_builder import (
+    KEYSET_VARIABLES,
     SPARQLQueryBuilder,
     format_type,
     CategoryDataType,
@@ -56,8 +61,16 @@ from kgforge.core.commons.exceptions import (
     UpdatingError,
     UploadingError,
     SchemaUpdateError,
+    RunException,
+)
+from kgforge.core.commons.execution import (
+    arun,
+    catch_http_error,
+    not_supported,
+    run,
+    run_in_executor,
+    run_pages,
 )
-from kgforge.core.commons.execution import run, not_supported, catch_http_error
 from kgforge.core.commons.files import is_valid_url
 from kgforge.core.conversions.json import as_json
 from kgforge.core.wrappings.dict import DictWrapper
@@ -68,9 +81,11 @@ from kgforge.specializations.stores.nexus.batch_request_handler import (
     BatchRequestHandler,
     BatchResult,
 )
+from kgforge.specializations.stores.nexus.resource_cache import CachedResponse
+from kgforge.specializations.stores.nexus.retry_policy import RetryRequest
 from kgforge.specializations.stores.nexus.service import Service, _error_message
 import kgforge.specializations.stores.nexus.prepare_methods as prepare_methods
-from kgforge.specializations.stores.nexus.http_helpers import files_create
+from kgforge.specializations.stores.nexus.http_helpers import files_create, project_fetch
 
 
 REQUEST_TIMEOUT = DEFAULT_REQUEST_TIMEOUT
@@ -93,6 +108,12 @@ def catch_http_error_nexus(
 
 class BlueBrainNexus(Store):
 
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    HYDRATE_ELASTIC = "elastic"
+    HYDRATE_FETCH = "fetch"
+    ELASTIC_HYDRATION_BATCH = 1000
+
     @property
     def context(self) -> Optional[Context]:
         return self.service.context
@@ -123,9 +144,22 @@ class BlueBrainNexus(Store):
             schema_id=schema_id,
         )
 
-    def _register_many(self, resources: List[Resource], schema_id: str) -> None:
+    def register_stream(
+        self, data: Iterable[Resource], schema_id: Optional[str]
+    ) -> Iterator[Resource]:
+        return self._stream_request(
+            data,
+            fc_name=self._register_many.__name__,
+            exception=RegistrationError,
+            id_required=False,
+            required_synchronized=False,
+            execute_actions=True,
+            prepare_function=prepare_methods.prepare_create,
+            callback=self._register_callback(self._register_many.__name__),
+            schema_id=schema_id,
+        )
 
-        fc_name = self._register_many.__name__
+    def _register_callback(self, fc_name: str) -> Callable:
 
         def register_callback(task: Task):
             result = task.result()
@@ -146,6 +180,46 @@ class BlueBrainNexus(Store):
                 result.resource, result.response, fc_name, succeeded, succeeded
             )
 
+        return register_callback
+
+    def _stream_request(
+        self,
+        data: Iterable[Resource],
+        fc_name: str,
+        exception: Type[RunException],
+        id_required: bool,
+        required_synchronized: bool,
+        execute_actions: bool,
+        prepare_function: Callable,
+        callback: Callable,
+        **kwargs,
+    ) -> Iterator[Resource]:
+
+        def verify(resource: Resource) -> bool:
+            return len(self.service.verify(
+                [resource],
+                function_name=fc_name,
+                exception=exception,
+                id_required=id_required,
+                required_synchronized=required_synchronized,
+                execute_actions=execute_actions,
+            )) == 1
+
+        results = BatchRequestHandler.stream_request_on_resources(
+            service=self.service,
+            resources=data,
+            prepare_function=prepare_function,
+            callback=callback,
+            verify=verify,
+            **kwargs,
+        )
+        for result in results:
+            yield result.resource
+
+    def _register_many(self, resources: List[Resource], schema_id: str) -> None:
+
+        fc_name = self._register_many.__name__
+
         verified = self.service.verify(
             resources,
             function_name=fc_name,
@@ -158,7 +232,34 @@ class BlueBrainNexus(Store):
         BatchRequestHandler.batch_request_on_resources(
             service=self.service,
             resources=verified,
-            callback=register_callback,
+            callback=self._register_callback(fc_name),
+            prepare_function=prepare_methods.prepare_create,
+            schema_id=schema_id,
+        )
+
+    async def aregister(
+        self, data: Union[Resource, List[Resource]], schema_id: str = None
+    ) -> None:
+        await arun(self._aregister_many, data, RegistrationError, schema_id=schema_id)
+
+    async def _aregister_many(self, resources: List[Resource], schema_id: str) -> None:
+
+        fc_name = self._register_many.__name__
+
+        # Lazy actions of the resources, e.g. files to attach, are executed synchronously.
+        verified = self.service.verify(
+            resources,
+            function_name=fc_name,
+            exception=RegistrationError,
+            id_required=False,
+            required_synchronized=False,
+            execute_actions=True,
+        )
+
+        await BatchRequestHandler.abatch_request_on_resources(
+            service=self.service,
+            resources=verified,
+            callback=self._register_callback(fc_name),
             prepare_function=prepare_methods.prepare_create,
             schema_id=schema_id,
         )
@@ -167,7 +268,7 @@ class BlueBrainNexus(Store):
         method, url, resource, exception_, headers, params, payload = (
             prepare_methods.prepare_create(service=self.service, resource=resource, schema_id=schema_id)
         )
-        response = requests.request(
+        response = self.service.session.request(
             method=method,
             url=url,
             headers=headers,
@@ -188,40 +289,57 @@ class BlueBrainNexus(Store):
 
         self.service.sync_metadata(resource, response_json)
 
-    def _upload_many(self, paths: List[Path], content_type: str) -> List[Dict]:
-        async def _bulk():
-            loop = asyncio.get_event_loop()
-            semaphore = Semaphore(self.service.max_connection)
-            async with ClientSession(headers=self.service.headers_upload) as session:
-                tasks = (_create_task(x, loop, semaphore, session) for x in paths)
-                return await asyncio.gather(*tasks)
-
-        def _create_task(path, loop, semaphore, session):
-            default = "application/octet-stream"
-            mime_type = content_type or mimetypes.guess_type(str(path))[0] or default
-            # FIXME Nexus seems to not parse the Content-Disposition 'filename*' field  properly.
-            # data = FormData()
-            # data.add_field("file", path.open("rb"), content_type=mime_type, filename=path.name)
-            # FIXME This hack is to prevent sending Content-Disposition with the 'filename*' field.
-            data = MultipartWriter("form-data")
-            part = data.append(path.open("rb"))
-            part.headers[CONTENT_TYPE] = mime_type
-            part.headers[CONTENT_DISPOSITION] = (
-                f'form-data; name="file"; filename="{path.name}"'
-            )
-            return loop.create_task(_upload(data, semaphore, session))
+    async def aupload(
+        self, path: str, content_type: str, forge: Optional["KnowledgeGraphForge"]
+    ) -> Union[Resource, List[Resource]]:
+        # path: Union[FilePath, DirPath].
+        if self.file_mapping is None:
+            raise UploadingError("no file_resource_mapping has been configured")
+        p = Path(path)
+        if p.is_dir():
+            filepaths = [
+                x for x in p.iterdir() if x.is_file() and not x.name.startswith(".")
+            ]
+            uploaded = await self._aupload_many(filepaths, content_type)
+        else:
+            uploaded = (await self._aupload_many([p], content_type))[0]
+        return self.mapper(forge).map(uploaded, self.file_mapping, None)
 
-        async def _upload(data, semaphore, session):
-            async with semaphore:
-                async with session.post(self.service.url_files, data=data) as response:
-                    body = await response.json()
-                    if response.status < 400:
-                        return body
+    def _upload_many(self, paths: List[Path], content_type: str) -> List[Dict]:
+        return self.service.run(self._aupload_many(paths, content_type))
 
-                    msg = " ".join(re.findall("[A-Z][^A-Z]*", body["@type"])).lower()
-                    raise UploadingError(msg)
+    async def _aupload_many(self, paths: List[Path], content_type: str) -> List[Dict]:
 
-        return asyncio.run(_bulk())
+        async def _upload(path, session):
+            default = "application/octet-stream"
+            mime_type = content_type or mimetypes.guess_type(str(path))[0] or default
+            async with self.service.limiter.acquire() as slot:
+                with path.open("rb") as file:
+                    # FIXME Nexus seems to not parse the Content-Disposition 'filename*' field  properly.
+                    # data = FormData()
+                    # data.add_field("file", file, content_type=mime_type, filename=path.name)
+                    # FIXME This hack is to prevent sending Content-Disposition with the 'filename*' field.
+                    data = MultipartWriter("form-data")
+                    part = data.append(file)
+                    part.headers[CONTENT_TYPE] = mime_type
+                    part.headers[CONTENT_DISPOSITION] = (
+                        f'form-data; name="file"; filename="{path.name}"'
+                    )
+                    async with session.post(
+                        self.service.url_files, data=data, headers=self.service.headers_upload
+                    ) as response:
+                        slot.status = response.status
+                        body = await response.json()
+                        if response.status < 400:
+                            return body
+
+                        msg = " ".join(re.findall("[A-Z][^A-Z]*", body["@type"])).lower()
+                        raise UploadingError(msg)
+
+        return await BatchRequestHandler.dispatch(
+            asyncio.get_running_loop(), paths, _upload, None, self.service.client_session(),
+            self.service.limiter
+        )
 
     def _upload_one(self, path: Path, content_type: str) -> Dict:
         file = str(path.absolute())
@@ -235,7 +353,7 @@ class BlueBrainNexus(Store):
                 os.path.getsize(file)
             )
             file_obj = {"file": (filename, open(file, "rb"), mime_type)}
-            response = requests.post(
+            response = self.service.session.post(
                 self.service.url_files, headers=headers, files=file_obj
             )
             response.raise_for_status()
@@ -273,10 +391,14 @@ class BlueBrainNexus(Store):
 
     def _get_resource_sync(self, url: str, query_params: Dict) -> Resource:
 
-        response = requests.request(
+        entry, fresh = self._cached_response(url, query_params)
+        if fresh:
+            return self._retrieved_resource(url, query_params, entry, None, entry.text, None)
+
+        response = self.service.session.request(
             method=hdrs.METH_GET,
             url=url,
-            headers=self.service.headers,
+            headers=self._conditional_headers(entry),
             params=query_params,
         )
 
@@ -284,45 +406,82 @@ class BlueBrainNexus(Store):
             response, RetrievalError, aiohttp_error=False
         )
 
-        response_json = response.json()
-
-        try:
-            resource = self.service.to_resource(response_json)
-            self.service.synchronize_resource(
-                resource, None, self.retrieve.__name__, True, True
-            )
-            return resource
-
-        except Exception as e:
-            raise RetrievalError(e) from e
+        return self._retrieved_resource(
+            url, query_params, entry, response.status_code,
+            response.content.decode("utf-8"), response.headers.get(hdrs.ETAG)
+        )
 
     async def _get_resource_async(
         self, session: ClientSession, url: str, query_params: Dict
     ) -> Resource:
 
-        async with session.request(
-            method=hdrs.METH_GET,
-            url=url,
-            headers=self.service.headers,
-            params=query_params,
-        ) as response:
+        entry, fresh = self._cached_response(url, query_params)
+        if fresh:
+            return self._retrieved_resource(url, query_params, entry, None, entry.text, None)
+
+        async def send(attempt: int) -> Tuple[int, str, Optional[str]]:
+            async with self.service.limiter.acquire() as slot:
+                async with session.request(
+                    method=hdrs.METH_GET,
+                    url=url,
+                    headers=self._conditional_headers(entry),
+                    params=query_params,
+                ) as response:
+                    slot.status = response.status
+                    self.service.retry_policy.raise_for_retry(
+                        attempt, True, response.status, response.headers
+                    )
+                    catch_http_error_nexus(
+                        response, RetrievalError, aiohttp_error=True
+                    )
+                    text = (await response.read()).decode("utf-8")
+                    return response.status, text, response.headers.get(hdrs.ETAG)
 
-            catch_http_error_nexus(
-                response, RetrievalError, aiohttp_error=True
-            )
+        status, text, etag = await self.service.retry_policy.arun(send, idempotent=True)
 
-            response_json = await response.json()
+        return self._retrieved_resource(url, query_params, entry, status, text, etag)
+
+    def _cached_response(
+        self, url: str, query_params: Dict
+    ) -> Tuple[Optional[CachedResponse], bool]:
+        cache = self.service.resource_cache
+        return cache.lookup(url, query_params) if cache is not None else (None, False)
+
+    def _conditional_headers(self, entry: Optional[CachedResponse]) -> Dict:
+        # A cached response which is not fresh anymore is sent again by the store only if it
+        # was modified.
+        if entry is None or entry.etag is None:
+            return self.service.headers
+        return {**self.service.headers, hdrs.IF_NONE_MATCH: entry.etag}
+
+    def _retrieved_resource(
+        self,
+        url: str,
+        query_params: Dict,
+        entry: Optional[CachedResponse],
+        status: Optional[int],
+        text: str,
+        etag: Optional[str],
+    ) -> Resource:
+        # Builds the resource from the response, or from the cached one when it was not sent
+        # again (status None) or not modified (status 304), and caches the response.
+        cache = self.service.resource_cache
+        if status == 304:
+            cache.revalidated(url, query_params, entry)
+            text = entry.text
 
         try:
-            resource = self.service.to_resource(response_json)
+            resource = self.service.to_resource(json.loads(text))
             self.service.synchronize_resource(
                 resource, None, self.retrieve.__name__, True, True
             )
-            return resource
-
         except Exception as e:
             raise RetrievalError(e) from e
 
+        if cache is not None and status is not None and status != 304:
+            cache.store(url, query_params, resource.id, text, etag)
+        return resource
+
     def _retrieve_one(
         self, id_: str, version: Optional[Union[int, str]], cross_bucket: bool, **params
     ):
@@ -343,6 +502,35 @@ class BlueBrainNexus(Store):
 
         return resource
 
+    async def _aretrieve_one(
+        self,
+        id_: str,
+        version: Optional[Union[int, str]],
+        cross_bucket: bool,
+        session: ClientSession,
+        **params,
+    ) -> Resource:
+
+        url, query_params = self._make_get_resource_url(
+            by_id=True, id_=id_, version=version, cross_bucket=cross_bucket, **params
+        )
+
+        # The concurrency of each request is bounded by the limiter of the service.
+        try:
+            resource = await self._get_resource_async(
+                session=session, url=url, query_params=query_params
+            )
+        except RetrievalError as er:
+
+            url, query_params = self._make_get_resource_url(
+                by_id=False, raise_=er, id_=id_, version=version, cross_bucket=cross_bucket, **params
+            )
+            resource = await self._get_resource_async(
+                session=session, url=url, query_params=query_params
+            )
+
+        return resource
+
     def _retrieve_many(
         self,
         ids: List[str],
@@ -350,6 +538,17 @@ class BlueBrainNexus(Store):
         cross_bucket: bool,
         **params,
     ) -> List[Union[Resource, Action]]:
+        return self.service.run(
+            self._aretrieve_many(ids, versions, cross_bucket, **params)
+        )
+
+    async def _aretrieve_many(
+        self,
+        ids: List[str],
+        versions: List[Optional[Union[int, str]]],
+        cross_bucket: bool,
+        **params,
+    ) -> List[Union[Resource, Action]]:
 
         def retrieve_done_callback(task: Task):
             result = task.result()
@@ -365,71 +564,21 @@ class BlueBrainNexus(Store):
                     synchronized=succeeded,
                 )
 
-        async def create_tasks(
-            semaphore: asyncio.Semaphore,
-            loop: AbstractEventLoop,
-            ids_: List[Any],
-            service,
-            **kwargs,
-        ) -> Tuple[List[asyncio.Task], List[ClientSession]]:
-
-            async def do_catch(id_, version, session) -> Union[Resource, Action]:
-                try:
-
-                    url, query_params = self._make_get_resource_url(
-                        by_id=True, id_=id_, version=version, cross_bucket=cross_bucket, **params
-                    )
-
-                    async with semaphore:
-
-                        try:
-                            resource = await self._get_resource_async(
-                                session=session,
-                                url=url,
-                                query_params=query_params
-                            )
-                        except RetrievalError as er:
-
-                            url, query_params = self._make_get_resource_url(
-                                by_id=False, raise_=er, id_=id_, version=version, cross_bucket=cross_bucket, **params
-                            )
-                            resource = await self._get_resource_async(
-                                session=session,
-                                url=url,
-                                query_params=query_params
-                            )
-
-                    return resource
-
-                except RetrievalError as e:
-                    return Action(self._retrieve_many.__name__, False, e)
-
-            vs = kwargs["versions"]
-            tasks = []
-            sessions = []
-            for batch_i in BatchRequestHandler.batch(list(zip(ids_, vs))):
-
-                session = ClientSession()
-                sessions.append(session)
-
-                for id_, version in batch_i:
-                    batch_result = do_catch(id_, version, session)
-                    prepared_request: asyncio.Task = loop.create_task(batch_result)
-
-                    prepared_request.add_done_callback(retrieve_done_callback)
-                    tasks.append(prepared_request)
-
-            return tasks, sessions
-
-        batch_results = BatchRequestHandler.batch_request(
-            service=self.service,
-            task_creator=create_tasks,
-            data=ids,
-            versions=versions,
-            cross_bucket=cross_bucket,
-            **params,
+        async def do_catch(id_version: Tuple[str, Any], session: ClientSession) -> Union[Resource, Action]:
+            id_, version = id_version
+            try:
+                return await self._aretrieve_one(id_, version, cross_bucket, session, **params)
+            except RetrievalError as e:
+                return Action(self._retrieve_many.__name__, False, e)
+
+        return await BatchRequestHandler.dispatch(
+            asyncio.get_running_loop(),
+            zip(ids, versions),
+            do_catch,
+            retrieve_done_callback,
+            self.service.client_session(),
+            self.service.limiter,
         )
-        return batch_results
 
     def retrieve(
         self,
@@ -450,6 +599,36 @@ class BlueBrainNexus(Store):
         :return: Union[List[Optional[Resource]], Optional[Resource]]
         """
 
+        ids, versions = BlueBrainNexus._ids_and_versions(id_, version)
+
+        if len(ids) == 1:
+            return self._retrieve_one(ids[0], versions[0], cross_bucket, **params)
+
+        return self._retrieve_many(ids, versions, cross_bucket, **params)
+
+    async def aretrieve(
+        self,
+        id_: Union[str, List[str]],
+        version: Union[Optional[Union[int, str]], List[Optional[Union[int, str]]]],
+        cross_bucket: bool = False,
+        **params,
+    ) -> Union[List[Optional[Resource]], Optional[Resource]]:
+
+        ids, versions = BlueBrainNexus._ids_and_versions(id_, version)
+
+        if len(ids) == 1:
+            return await self._aretrieve_one(
+                ids[0], versions[0], cross_bucket, self.service.client_session(), **params
+            )
+
+        return await self._aretrieve_many(ids, versions, cross_bucket, **params)
+
+    @staticmethod
+    def _ids_and_versions(
+        id_: Union[str, List[str]],
+        version: Union[Optional[Union[int, str]], List[Optional[Union[int, str]]]],
+    ) -> Tuple[List[str], List[Optional[Union[int, str]]]]:
+
         ids = [id_] if isinstance(id_, str) else id_
 
         if len(ids) == 1:
@@ -458,14 +637,14 @@ class BlueBrainNexus(Store):
                 [version] if isinstance(version, (str, int)) else (version or [None])
             )
 
-            return self._retrieve_one(ids[0], versions[0], cross_bucket, **params)
+            return ids, versions[:1]
 
         versions = [None] * len(ids) if version is None else version
 
         if len(versions) != len(ids):
             raise Exception("As many versions as ids need to be provided")
 
-        return self._retrieve_many(ids, versions, cross_bucket, **params)
+        return ids, versions
 
     def _make_get_resource_url(
         self,
@@ -531,7 +710,7 @@ class BlueBrainNexus(Store):
             return url, query_params
 
     def _retrieve_file_metadata(self, id_: str) -> Dict:
-        response = requests.get(
+        response = self.service.session.get(
             id_, headers=self.service.headers, timeout=REQUEST_TIMEOUT
         )
         catch_http_error_nexus(response, DownloadingError)
@@ -540,8 +719,55 @@ class BlueBrainNexus(Store):
 
     def _retrieve_filename(self, id_: str) -> Tuple[str, str]:
         metadata = self._retrieve_file_metadata(id_)
+        # Kept for the download of the file, which then does not retrieve it again.
+        self.service.file_metadata[id_] = metadata
         return metadata["_filename"], metadata["_mediaType"]
 
+    def download(
+        self,
+        data: Union[Resource, List[Resource]],
+        follow: str,
+        path: str,
+        overwrite: bool,
+        cross_bucket: bool,
+        content_type: str = None,
+    ) -> None:
+        # path: DirPath.
+        self.service.run(
+            self.adownload(data, follow, path, overwrite, cross_bucket, content_type)
+        )
+
+    async def adownload(
+        self,
+        data: Union[Resource, List[Resource]],
+        follow: str,
+        path: str,
+        overwrite: bool,
+        cross_bucket: bool,
+        content_type: Optional[str],
+    ) -> None:
+        # path: DirPath.
+        # The metadata of each file, giving its filename and media type, is retrieved by the task
+        # downloading it instead of for all the files beforehand, so that retrieving metadata
+        # and downloading files are pipelined.
+        urls, _, buckets = self._download_targets(data, follow, cross_bucket, content_type)
+        dirpath = Path(path)
+        dirpath.mkdir(parents=True, exist_ok=True)
+        timestamp = time.strftime("%Y%m%d%H%M%S")
+
+        def filepath(metadata: Dict) -> Optional[str]:
+            if content_type and metadata["_mediaType"] != content_type:
+                return None
+            return self._download_path(dirpath, metadata["_filename"], overwrite, timestamp)
+
+        downloaded = await self._adownload_files(
+            zip(urls, repeat(filepath), buckets), content_type
+        )
+        if not any(downloaded):
+            raise DownloadingError(
+                f"No resource with content_type {content_type} was found when following the resource path '{follow}'."
+            )
+
     def _download_many(
         self,
         urls: List[str],
@@ -551,42 +777,140 @@ class BlueBrainNexus(Store):
         content_type: str,
         buckets: List[str],
     ) -> None:
-        async def _bulk():
-            loop = asyncio.get_event_loop()
-            semaphore = Semaphore(self.service.max_connection)
-            headers = (
-                self.service.headers_download
-                if not content_type
-                else update_dict(
-                    self.service.headers_download, {"Accept": content_type}
-                )
-            )
-            async with ClientSession(headers=headers) as session:
-                tasks = (
-                    _create_task(x, y, z, b, loop, semaphore, session)
-                    for x, y, z, b in zip(urls, paths, store_metadata, buckets)
-                )
-                return await asyncio.gather(*tasks)
-
-        def _create_task(url, path, store_metadata, bucket, loop, semaphore, session):
-            return loop.create_task(
-                _download(url, path, store_metadata, bucket, semaphore, session)
-            )
+        self.service.run(
+            self._adownload_many(urls, paths, store_metadata, cross_bucket, content_type, buckets)
+        )
 
-        async def _download(url, path, store_metadata, bucket, semaphore, session):
-            async with semaphore:
-                params_download = copy.deepcopy(self.service.params.get("download", {}))
-                async with session.get(url, params=params_download) as response:
-                    catch_http_error_nexus(
-                        response,
-                        DownloadingError,
-                        error_message_formatter=lambda e: f"Downloading url {url} from bucket {bucket} failed: {_error_message(e)}",
-                    )
-                    with open(path, "wb") as f:
-                        data = await response.read()
-                        f.write(data)
+    async def _adownload_many(
+        self,
+        urls: List[str],
+        paths: List[str],
+        store_metadata: Optional[DictWrapper],
+        cross_bucket: bool,
+        content_type: str,
+        buckets: List[str],
+    ) -> None:
+        filepaths = ((lambda _, path=path: path) for path in paths)
+        await self._adownload_files(zip(urls, filepaths, buckets), content_type)
 
-        return asyncio.run(_bulk())
+    async def _adownload_files(
+        self,
+        files: Iterable[Tuple[str, Callable[[Dict], Optional[str]], str]],
+        content_type: Optional[str],
+    ) -> List[bool]:
+        # Each file is given by its url, a function returning the path to download it to from its
+        # metadata, or None to skip it, and its bucket. Returns whether each file was downloaded.
+        # Files are streamed in chunks of DOWNLOAD_CHUNK_SIZE bytes to a .part file next to their
+        # path, which is renamed to it once complete and verified against the digest the store
+        # computed. Interrupted transfers are resumed with Range requests. Each path is downloaded
+        # to by one file only: the next files given the same path, e.g. files with the same
+        # filename, are downloaded to it suffixed with a number, so that they never share a .part.
+        headers = (
+            self.service.headers_download
+            if not content_type
+            else update_dict(
+                self.service.headers_download, {"Accept": content_type}
+            )
+        )
+        limiter = self.service.limiter
+        retry_policy = self.service.retry_policy
+        # Only the reads of the body are bounded, as a whole file can take long to download.
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=REQUEST_TIMEOUT)
+        claimed: Set[str] = set()
+
+        def claim(path: str) -> str:
+            claimed_path, i = path, 0
+            while claimed_path in claimed:
+                i += 1
+                claimed_path = f"{path}.{i}"
+            claimed.add(claimed_path)
+            return claimed_path
+
+        async def _download(file, session) -> bool:
+            url, filepath, bucket = file
+            metadata = self.service.file_metadata.pop(url, None)
+            if metadata is None:
+                metadata = await self._aretrieve_file_metadata(url, session)
+            path = filepath(metadata)
+            if path is None:
+                return False
+            path = claim(path)
+            part = f"{path}.part"
+            params_download = copy.deepcopy(self.service.params.get("download", {}))
+            digest = metadata.get("_digest", {})
+            algorithm = BlueBrainNexus._hash_algorithm(digest.get("_algorithm"))
+            if algorithm is None:
+                # A part left by a previous download can only be resumed if it can be verified.
+                await run_in_executor(BlueBrainNexus._remove_part, part)
+
+            def error_message(message: str) -> str:
+                return f"Downloading url {url} from bucket {bucket} failed: {message}"
+
+            async def send(attempt: int) -> None:
+                offset = await run_in_executor(BlueBrainNexus._part_size, part)
+                request_headers = headers if offset == 0 else update_dict(
+                    headers, {hdrs.RANGE: f"bytes={offset}-"}
+                )
+                async with limiter.acquire() as slot:
+                    async with session.get(
+                        url, params=params_download, headers=request_headers, timeout=timeout
+                    ) as response:
+                        slot.status = response.status
+                        if response.status == 416 and retry_policy.retryable(attempt, True):
+                            # The part does not match the file anymore, it is downloaded again.
+                            await run_in_executor(BlueBrainNexus._remove_part, part)
+                            raise RetryRequest(response.status, 0)
+                        retry_policy.raise_for_retry(
+                            attempt, True, response.status, response.headers
+                        )
+                        catch_http_error_nexus(
+                            response,
+                            DownloadingError,
+                            error_message_formatter=lambda e: error_message(_error_message(e)),
+                        )
+                        # Files are written in the default executor so that the I/O loop, shared
+                        # by the requests of the store, does not wait for the disk.
+                        f = await run_in_executor(open, part, "ab" if response.status == 206 else "wb")
+                        try:
+                            async for chunk in response.content.iter_chunked(
+                                BlueBrainNexus.DOWNLOAD_CHUNK_SIZE
+                            ):
+                                await run_in_executor(f.write, chunk)
+                        except ClientPayloadError as e:
+                            # The transfer was interrupted, it is resumed from what was written.
+                            if not retry_policy.retryable(attempt, True):
+                                raise DownloadingError(error_message(str(e))) from e
+                            raise RetryRequest(response.status, retry_policy.backoff(attempt)) from e
+                        finally:
+                            await run_in_executor(f.close)
+
+            async def verified() -> bool:
+                try:
+                    await retry_policy.arun(send, idempotent=True)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise DownloadingError(error_message(str(e))) from e
+                if algorithm is None:
+                    return True
+                value = await run_in_executor(BlueBrainNexus._digest, part, algorithm)
+                if value != digest.get("_value"):
+                    await run_in_executor(BlueBrainNexus._remove_part, part)
+                    return False
+                return True
+
+            # A part left by a previous download may not match the file anymore, in which case
+            # the file is downloaded again from the start.
+            resumed = await run_in_executor(os.path.exists, part)
+            if not await verified() and (not resumed or not await verified()):
+                raise DownloadingError(error_message(
+                    f"the {digest['_algorithm']} digest of the downloaded file does not match the one of the store"
+                ))
+            await run_in_executor(os.replace, part, path)
+            return True
+
+        return await BatchRequestHandler.dispatch(
+            asyncio.get_running_loop(), files, _download, None, self.service.client_session(),
+            self.service.limiter
+        )
 
     def _download_one(
         self,
@@ -597,25 +921,55 @@ class BlueBrainNexus(Store):
         content_type: str,
         bucket: str,
     ) -> None:
-
-        params_download = copy.deepcopy(self.service.params.get("download", {}))
-        headers = (
-            self.service.headers_download
+        self.service.run(
+            self._adownload_many([url], [path], [store_metadata], cross_bucket, content_type, [bucket])
         )
 
-        response = requests.get(
-            url=url, headers=headers, params=params_download, timeout=REQUEST_TIMEOUT
-        )
-        catch_http_error_nexus(
-            response,
-            DownloadingError,
-            error_message_formatter=lambda e: f"Downloading from bucket {bucket} failed: "
-            f"{_error_message(e)}",
-        )
+    async def _aretrieve_file_metadata(self, id_: str, session: ClientSession) -> Dict:
+        retry_policy = self.service.retry_policy
+
+        async def send(attempt: int) -> Dict:
+            async with self.service.limiter.acquire() as slot:
+                async with session.get(id_, headers=self.service.headers) as response:
+                    slot.status = response.status
+                    retry_policy.raise_for_retry(
+                        attempt, True, response.status, response.headers
+                    )
+                    catch_http_error_nexus(response, DownloadingError, aiohttp_error=True)
+                    return await response.json(content_type=None)
+
+        return await retry_policy.arun(send, idempotent=True)
+
+    @staticmethod
+    def _hash_algorithm(algorithm: Optional[str]) -> Optional[str]:
+        # Nexus names the algorithms as in Java, e.g. SHA-256 for hashlib's sha256.
+        if algorithm is None:
+            return None
+        name = algorithm.replace("-", "").lower()
+        return name if name in hashlib.algorithms_available else None
+
+    @staticmethod
+    def _part_size(part: str) -> int:
+        try:
+            return os.path.getsize(part)
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _remove_part(part: str) -> None:
+        try:
+            os.remove(part)
+        except FileNotFoundError:
+            pass
 
-        with open(path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=4096):
-                f.write(chunk)
+    @staticmethod
+    def _digest(path: str, algorithm: str) -> str:
+        # hashlib releases the GIL while hashing, so files are verified in parallel threads.
+        h = hashlib.new(algorithm)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(BlueBrainNexus.DOWNLOAD_CHUNK_SIZE), b""):
+                h.update(chunk)
+        return h.hexdigest()
 
     def _prepare_download_one_with_org_project(self, url: str, org: str, project: str):
         file_id = url.split("/")[-1]
@@ -673,6 +1027,22 @@ class BlueBrainNexus(Store):
             schema_id=schema_id,
         )
 
+    def update_stream(
+        self, data: Iterable[Resource], schema_id: Optional[str]
+    ) -> Iterator[Resource]:
+        fc_name = self._update_many.__name__
+        return self._stream_request(
+            data,
+            fc_name=fc_name,
+            exception=UpdatingError,
+            id_required=True,
+            required_synchronized=False,
+            execute_actions=True,
+            prepare_function=prepare_methods.prepare_update,
+            callback=self.service.default_callback(fc_name),
+            schema_id=schema_id,
+        )
+
     def _update_many(self, resources: List[Resource], schema_id: str) -> None:
         fc_name = self._update_many.__name__
 
@@ -693,13 +1063,39 @@ class BlueBrainNexus(Store):
             schema_id=schema_id,
         )
 
+    async def aupdate(
+        self, data: Union[Resource, List[Resource]], schema_id: str = None
+    ) -> None:
+        await arun(self._aupdate_many, data, UpdatingError, schema_id=schema_id)
+
+    async def _aupdate_many(self, resources: List[Resource], schema_id: str) -> None:
+        fc_name = self._update_many.__name__
+
+        # Lazy actions of the resources, e.g. files to attach, are executed synchronously.
+        verified = self.service.verify(
+            resources,
+            function_name=fc_name,
+            exception=UpdatingError,
+            id_required=True,
+            required_synchronized=False,
+            execute_actions=True,
+        )
+
+        await BatchRequestHandler.abatch_request_on_resources(
+            service=self.service,
+            resources=verified,
+            callback=self.service.default_callback(fc_name),
+            prepare_function=prepare_methods.prepare_update,
+            schema_id=schema_id,
+        )
+
     def _update_one(self, resource: Resource, schema_id: str) -> None:
 
         method, url, resource, exception_, headers, params, payload = (
             prepare_methods.prepare_update(service=self.service, resource=resource, schema_id=schema_id)
         )
 
-        response = requests.request(
+        response = self.service.session.request(
             method=method,
             url=url,
             headers=headers,
@@ -710,6 +1106,7 @@ class BlueBrainNexus(Store):
 
         catch_http_error_nexus(response, exception_)
         self.service.sync_metadata(resource, response.json())
+        self.service.invalidate_cached(resource)
 
     def delete_schema(self, resource: Union[Resource, List[Resource]]):
         return self.update_schema(resource, schema_id=Service.UNCONSTRAINED_SCHEMA)
@@ -720,7 +1117,7 @@ class BlueBrainNexus(Store):
                 service=self.service, resource=resource, schema_id=schema_id
             )
         )
-        response = requests.request(
+        response = self.service.session.request(
             method=method,
             url=url,
             headers=headers,
@@ -731,6 +1128,7 @@ class BlueBrainNexus(Store):
 
         catch_http_error_nexus(response, exception_)
         self.service.sync_metadata(resource, response.json())
+        self.service.invalidate_cached(resource)
 
     def _update_schema_many(self, resources: List[Resource], schema_id: str):
         fc_name = self._update_schema_many.__name__
@@ -778,6 +1176,20 @@ class BlueBrainNexus(Store):
             value=value,
         )
 
+    def tag_stream(self, data: Iterable[Resource], value: str) -> Iterator[Resource]:
+        fc_name = self._tag_many.__name__
+        return self._stream_request(
+            data,
+            fc_name=fc_name,
+            exception=TaggingError,
+            id_required=True,
+            required_synchronized=True,
+            execute_actions=False,
+            prepare_function=prepare_methods.prepare_tag,
+            callback=self.service.default_callback(fc_name),
+            tag=value,
+        )
+
     def _tag_many(self, resources: List[Resource], value: str) -> None:
         fc_name = self._tag_many.__name__
 
@@ -804,7 +1216,7 @@ class BlueBrainNexus(Store):
             )
         )
 
-        response = requests.request(
+        response = self.service.session.request(
             method=method,
             url=url,
             headers=headers,
@@ -815,6 +1227,7 @@ class BlueBrainNexus(Store):
 
         catch_http_error_nexus(response, exception_)
         self.service.sync_metadata(resource, response.json())
+        self.service.invalidate_cached(resource)
 
     # CRU[D].
 
@@ -829,6 +1242,19 @@ class BlueBrainNexus(Store):
             monitored_status="_synchronized",
         )
 
+    def deprecate_stream(self, data: Iterable[Resource]) -> Iterator[Resource]:
+        fc_name = self._deprecate_many.__name__
+        return self._stream_request(
+            data,
+            fc_name=fc_name,
+            exception=DeprecationError,
+            id_required=True,
+            required_synchronized=True,
+            execute_actions=False,
+            prepare_function=prepare_methods.prepare_deprecate,
+            callback=self.service.default_callback(fc_name),
+        )
+
     def _deprecate_many(self, resources: List[Resource]) -> None:
         fc_name = self._deprecate_many.__name__
 
@@ -854,7 +1280,7 @@ class BlueBrainNexus(Store):
             prepare_methods.prepare_deprecate(service=self.service, resource=resource)
         )
 
-        response = requests.request(
+        response = self.service.session.request(
             method=method,
             url=url,
             headers=headers,
@@ -865,6 +1291,7 @@ class BlueBrainNexus(Store):
 
         catch_http_error_nexus(response, exception_)
         self.service.sync_metadata(resource, response.json())
+        self.service.invalidate_cached(resource)
 
         # Querying.
 
@@ -875,6 +1302,94 @@ class BlueBrainNexus(Store):
         **params,
     ) -> List[Resource]:
 
+        search_endpoint, query = self._build_search_query(resolvers, *filters, **params)
+
+        debug = params.get("debug", False)
+        limit = params.get("limit", 100)
+        offset = params.get("offset", None)
+        view = params.get("view", None)
+
+        if search_endpoint == Service.SPARQL_ENDPOINT_TYPE:
+            retrieve_source = params.get("retrieve_source", True)
+            hydrate = params.get("hydrate", BlueBrainNexus.HYDRATE_ELASTIC)
+            # support @id and @type
+            resources = self.sparql(query, debug=debug, limit=limit, offset=offset, view=view)
+            return self.service.run(self._ahydrate(resources, retrieve_source, hydrate))
+
+        return self.elastic(query, debug=debug, limit=limit, offset=offset, view=view)
+
+    async def asearch(
+        self,
+        *filters: Union[Dict, Filter],
+        resolvers: Optional[List[Resolver]],
+        **params,
+    ) -> List[Resource]:
+
+        if isinstance(self.service.elastic_endpoint["view"], LazyAction) and params.get(
+            "search_endpoint"
+        ) == Service.ELASTIC_ENDPOINT_TYPE:
+            # The view is retrieved once with a synchronous request.
+            await run_in_executor(self._elastic_view)
+
+        search_endpoint, query = self._build_search_query(resolvers, *filters, **params)
+
+        debug = params.get("debug", False)
+        limit = params.get("limit", 100)
+        offset = params.get("offset", None)
+        view = params.get("view", None)
+
+        if search_endpoint == Service.SPARQL_ENDPOINT_TYPE:
+            retrieve_source = params.get("retrieve_source", True)
+            hydrate = params.get("hydrate", BlueBrainNexus.HYDRATE_ELASTIC)
+            resources = await self.asparql(
+                query, debug=debug, limit=limit, offset=offset, view=view
+            )
+            return await self._ahydrate(resources, retrieve_source, hydrate)
+
+        return await self.aelastic(query, debug=debug, limit=limit, offset=offset, view=view)
+
+    def search_iter(
+        self,
+        *filters: Union[Dict, Filter],
+        resolvers: Optional[List[Resolver]],
+        page_size: int,
+        **params,
+    ) -> Iterator[Resource]:
+
+        search_endpoint, query = self._build_search_query(resolvers, *filters, **params)
+
+        debug = params.get("debug", False)
+        view = params.get("view", None)
+        keyset = params.get("keyset", "id")
+
+        if search_endpoint == Service.ELASTIC_ENDPOINT_TYPE:
+            if keyset not in KEYSET_VARIABLES:
+                raise QueryingError(
+                    f"The provided keyset value '{keyset}' is not supported. "
+                    f"Supported keyset values are: {list(KEYSET_VARIABLES)}"
+                )
+            query_dict = self._prepare_elastic(query, debug, None, None)
+            if keyset != "id":
+                query_dict["sort"] = [{keyset: "asc"}]
+            return self._elastic_pages(query_dict, page_size, view, True, "source")
+
+        retrieve_source = params.get("retrieve_source", True)
+        hydrate = params.get("hydrate", BlueBrainNexus.HYDRATE_ELASTIC)
+        qr = self._prepare_sparql(query, debug, None, None, view=view)
+
+        def build(resources: List[Resource]) -> List[Resource]:
+            return self.service.run(self._ahydrate(resources, retrieve_source, hydrate))
+
+        return self._sparql_pages(qr, keyset, page_size, view, build)
+
+    def _build_search_query(
+        self,
+        resolvers: Optional[List[Resolver]],
+        *filters: Union[Dict, Filter],
+        **params,
+    ) -> Tuple[str, str]:
+        # Returns the search endpoint type and the query to send to it.
+
         if "filters" in params:
             raise ValueError(
                 "A 'filters' key was provided as params. Filters should be provided as iterable."
@@ -883,9 +1398,6 @@ class BlueBrainNexus(Store):
         if self.model_context() is None:
             raise ValueError("context model missing")
 
-        debug = params.get("debug", False)
-        limit = params.get("limit", 100)
-        offset = params.get("offset", None)
         deprecated = params.get("deprecated", False)
         cross_bucket = params.get("cross_bucket", False)
         bucket = params.get("bucket", None)
@@ -905,6 +1417,15 @@ class BlueBrainNexus(Store):
                 f"Supported search_endpoint values are: {valid_endpoints}"
             )
 
+        hydrate = params.get("hydrate", BlueBrainNexus.HYDRATE_ELASTIC)
+        valid_hydrations = [BlueBrainNexus.HYDRATE_ELASTIC, BlueBrainNexus.HYDRATE_FETCH]
+
+        if hydrate not in valid_hydrations:
+            raise ValueError(
+                f"The provided hydrate value '{hydrate}' is not supported. "
+                f"Supported hydrate values are: {valid_hydrations}"
+            )
+
         if bucket and not cross_bucket:
             raise not_supported(("bucket", True))
 
@@ -963,64 +1484,9 @@ class BlueBrainNexus(Store):
             query = SPARQLQueryBuilder.create_select_query(
                 _vars, f"?id {statements} . \n {_filters}", distinct, search_in_graph
             )
-            # support @id and @type
-            resources = self.sparql(
-                query,
-                debug=debug,
-                limit=limit,
-                offset=offset,
-                view=params.get("view", None),
-            )
-            results = BatchRequestHandler.batch_request_on_resources(
-                service=self.service,
-                resources=resources,
-                prepare_function=prepare_methods.prepare_fetch,
-                callback=None,
-                retrieve_source=retrieve_source,
-            )
-            resources = []
-            for result in results:
-                resource = result.resource
-                if retrieve_source:
-                    store_metadata_response = as_json(
-                        result.resource,
-                        expanded=False,
-                        store_metadata=False,
-                        model_context=None,
-                        metadata_context=None,
-                        context_resolver=None,
-                    )  # store_metadata is obtained from SPARQL (resource) and
-                    # not from server (response) because of retrieve_source==True
-                else:
-                    store_metadata_response = result.response  # dict
-                try:
-                    resource = self.service.to_resource(result.response)
-                except Exception as e:
-                    self.service.synchronize_resource(
-                        resource,
-                        store_metadata_response,
-                        self.search.__name__,
-                        False,
-                        False,
-                    )
-                    raise ValueError(e) from e
-                finally:
-                    self.service.synchronize_resource(
-                        resource,
-                        store_metadata_response,
-                        self.search.__name__,
-                        True,
-                        True,
-                    )
-                resources.append(resource)
-            return resources
+            return search_endpoint, query
         else:
-            if isinstance(self.service.elastic_endpoint["view"], LazyAction):
-                self.service.elastic_endpoint["view"] = self.service.elastic_endpoint[
-                    "view"
-                ].execute()
-
-            elastic_mapping = self.service.elastic_endpoint["view"].get("mapping", None)
+            elastic_mapping = self._elastic_view().get("mapping", None)
 
             default_str_keyword_field = self.service.elastic_endpoint[
                 "default_str_keyword_field"
@@ -1078,13 +1544,130 @@ class BlueBrainNexus(Store):
                 excludes=excludes,
             )
 
-            return self.elastic(
-                json.dumps(query),
-                debug=debug,
-                limit=limit,
-                offset=offset,
-                view=params.get("view", None),
+            return search_endpoint, json.dumps(query)
+
+    def _elastic_view(self) -> Dict:
+        if isinstance(self.service.elastic_endpoint["view"], LazyAction):
+            self.service.elastic_endpoint["view"] = self.service.elastic_endpoint[
+                "view"
+            ].execute()
+        return self.service.elastic_endpoint["view"]
+
+    async def _ahydrate(
+        self, resources: List[Resource], retrieve_source: bool, hydrate: str
+    ) -> List[Resource]:
+        # Builds the full resources found by a SPARQL search. With the elastic hydration, their
+        # payloads are taken from the default Elasticsearch view with one query per
+        # ELASTIC_HYDRATION_BATCH resources. Resources missing from the view, indexed at another
+        # revision, e.g. because indexing lags behind, or indexed without their original payload,
+        # e.g. by a view indexing only some fields, are fetched one by one as with the fetch
+        # hydration.
+        sources = {}
+        if hydrate == BlueBrainNexus.HYDRATE_ELASTIC and resources:
+            sources = await self._aelastic_sources([r.id for r in resources])
+
+        results: List[Optional[BatchResult]] = []
+        to_fetch = []
+        for resource in resources:
+            source = sources.get(resource.id)
+            payload = None
+            if source is not None and (
+                not hasattr(resource, "_rev") or str(source.get("_rev")) == str(resource._rev)
+            ):
+                payload = self._elastic_payload(source, retrieve_source)
+            if payload is not None:
+                results.append(BatchResult(resource, payload))
+            else:
+                results.append(None)
+                to_fetch.append(resource)
+
+        fetched = iter(await BatchRequestHandler.abatch_request_on_resources(
+            service=self.service,
+            resources=to_fetch,
+            prepare_function=prepare_methods.prepare_fetch,
+            callback=None,
+            retrieve_source=retrieve_source,
+        ))
+        results = [result if result is not None else next(fetched) for result in results]
+        return self._fetched_resources(results, retrieve_source)
+
+    async def _aelastic_sources(self, ids: List[str]) -> Dict[str, Dict]:
+        # Returns the documents of the default Elasticsearch view for the given ids, or none of
+        # them if the view cannot be queried.
+        endpoint = self._query_endpoint(None, "elastic")
+        batch = BlueBrainNexus.ELASTIC_HYDRATION_BATCH
+        chunks = [ids[i:i + batch] for i in range(0, len(ids), batch)]
+
+        async def query(chunk: List[str], _) -> List[Dict]:
+            body = {"query": {"bool": {"filter": [{"terms": {"@id": chunk}}]}}, "size": len(chunk)}
+            response = await self._aquery(endpoint, json.dumps(body), self.service.headers_elastic)
+            return response["hits"]["hits"]
+
+        try:
+            hits = await BatchRequestHandler.dispatch(
+                asyncio.get_running_loop(), chunks, query, None, None, self.service.limiter
             )
+        except (QueryingError, aiohttp.ClientError, asyncio.TimeoutError, KeyError):
+            return {}
+        return {
+            hit["_source"].get("@id", hit.get("_id")): hit["_source"]
+            for chunk_hits in hits for hit in chunk_hits
+        }
+
+    @staticmethod
+    def _elastic_payload(source: Dict, retrieve_source: bool) -> Optional[Dict]:
+        # The default view keeps the payload as registered in _original_source, next to the
+        # store metadata. Without it, the indexed document may miss some of the payload.
+        if "_original_source" not in source:
+            return None
+        payload = json.loads(source["_original_source"])
+        if "@id" in source:
+            payload.setdefault("@id", source["@id"])
+        if retrieve_source:
+            return payload
+        metadata = {k: v for k, v in source.items() if k.startswith("_") and k != "_original_source"}
+        return {**payload, **metadata}
+
+    def _fetched_resources(
+        self, results: List[BatchResult], retrieve_source: bool
+    ) -> List[Resource]:
+        # Builds the resources found by a SPARQL search from their fetched payloads.
+        resources = []
+        for result in results:
+            resource = result.resource
+            if retrieve_source:
+                store_metadata_response = as_json(
+                    result.resource,
+                    expanded=False,
+                    store_metadata=False,
+                    model_context=None,
+                    metadata_context=None,
+                    context_resolver=None,
+                )  # store_metadata is obtained from SPARQL (resource) and
+                # not from server (response) because of retrieve_source==True
+            else:
+                store_metadata_response = result.response  # dict
+            try:
+                resource = self.service.to_resource(result.response)
+            except Exception as e:
+                self.service.synchronize_resource(
+                    resource,
+                    store_metadata_response,
+                    self.search.__name__,
+                    False,
+                    False,
+                )
+                raise ValueError(e) from e
+            finally:
+                self.service.synchronize_resource(
+                    resource,
+                    store_metadata_response,
+                    self.search.__name__,
+                    True,
+                    True,
+                )
+            resources.append(resource)
+        return resources
 
     @staticmethod  # for testing
     def reformat_contexts(model_context: Context, metadata_context: Optional[Context]):
@@ -1108,17 +1691,14 @@ class BlueBrainNexus(Store):
 
     def _sparql(self, query: str, view: str) -> List[Resource]:
 
-        endpoint = (
-            self.service.sparql_endpoint["endpoint"]
-            if view is None
-            else self.service.make_query_endpoint_self(view, endpoint_type="sparql")
-        )
+        endpoint = self._query_endpoint(view, "sparql")
 
-        response = requests.post(
+        response = self.service.session.post(
             endpoint,
             data=query,
             headers=self.service.headers_sparql,
             timeout=REQUEST_TIMEOUT,
+            idempotent=True,
         )
         catch_http_error_nexus(response, QueryingError)
 
@@ -1127,6 +1707,15 @@ class BlueBrainNexus(Store):
         context = self.model_context() or self.context
         return SPARQLQueryBuilder.build_resource_from_response(query, data, context)
 
+    async def _asparql(self, query: str, view: Optional[str]) -> List[Resource]:
+
+        endpoint = self._query_endpoint(view, "sparql")
+
+        data = await self._aquery(endpoint, query, self.service.headers_sparql)
+
+        context = self.model_context() or self.context
+        return SPARQLQueryBuilder.build_resource_from_response(query, data, context)
+
     def _elastic(
         self,
         query: Dict,
@@ -1135,21 +1724,104 @@ class BlueBrainNexus(Store):
         build_resource_from: str,
     ) -> Optional[Union[List[Resource], Resource, List[Dict], Dict]]:
 
-        endpoint = (
-            self.service.elastic_endpoint["endpoint"]
-            if view is None
-            else self.service.make_query_endpoint_self(view, endpoint_type="elastic")
+        endpoint = self._query_endpoint(view, "elastic")
+        results = self._elastic_query(endpoint, query)
+
+        return self._elastic_results(results, as_resource, build_resource_from)
+
+    def elastic_iter(
+        self, query: str, debug: bool, page_size: int = 100, **params
+    ) -> Iterator[Union[Resource, Dict]]:
+        query_dict = self._prepare_elastic(query, debug, None, None)
+        return self._elastic_pages(
+            query_dict,
+            page_size,
+            view=params.get("view", None),
+            as_resource=params.get("as_resource", True),
+            build_resource_from=params.get("build_resource_from", "source"),
         )
 
-        response = requests.post(
+    def _elastic_pages(
+        self,
+        query: Dict,
+        page_size: int,
+        view: Optional[str],
+        as_resource: bool,
+        build_resource_from: str,
+    ) -> Iterator[Union[Resource, Dict]]:
+        # Pages of hits are fetched with search_after on sort values ending with @id as a
+        # tiebreaker. Unlike from and size, this is not bounded by the maximum result window of
+        # the index (10,000 hits by default) and the previous hits are not collected again for
+        # each page. Nexus does not expose point in time searches on its views, so documents
+        # indexed while iterating are returned if they sort after the current page.
+        endpoint = self._query_endpoint(view, "elastic")
+
+        def fetch_page(last: Optional[List]) -> Tuple[List, Optional[List]]:
+            qr = ESQueryBuilder.apply_search_after_to_query(query, last, page_size)
+            results = self._elastic_query(endpoint, qr)
+            hits = results["hits"]["hits"]
+            following = hits[-1]["sort"] if len(hits) >= page_size else None
+            return self._elastic_results(results, as_resource, build_resource_from), following
+
+        return run_pages(fetch_page)
+
+    def _elastic_query(self, endpoint: str, query: Dict) -> Dict:
+        response = self.service.session.post(
             endpoint,
             data=json.dumps(query),
             headers=self.service.headers_elastic,
             timeout=REQUEST_TIMEOUT,
+            idempotent=True,
         )
         catch_http_error_nexus(response, QueryingError)
+        return response.json()
+
+    async def _aelastic(
+        self,
+        query: Dict,
+        view: Optional[str],
+        as_resource: bool,
+        build_resource_from: str,
+    ) -> Optional[Union[List[Resource], Resource, List[Dict], Dict]]:
+
+        endpoint = self._query_endpoint(view, "elastic")
+
+        results = await self._aquery(
+            endpoint, json.dumps(query), self.service.headers_elastic
+        )
+
+        return self._elastic_results(results, as_resource, build_resource_from)
+
+    def _query_endpoint(self, view: Optional[str], endpoint_type: str) -> str:
+        if view is not None:
+            return self.service.make_query_endpoint_self(view, endpoint_type=endpoint_type)
+        if endpoint_type == "sparql":
+            return self.service.sparql_endpoint["endpoint"]
+        return self.service.elastic_endpoint["endpoint"]
+
+    async def _aquery(self, endpoint: str, data: str, headers: Dict) -> Dict:
+        # Queries are read-only and therefore retried although they are sent with POST.
+        session = self.service.client_session()
+        limiter = self.service.limiter
+        retry_policy = self.service.retry_policy
+
+        async def send(attempt: int) -> Dict:
+            async with limiter.acquire() as slot:
+                async with session.post(endpoint, data=data, headers=headers) as response:
+                    slot.status = response.status
+                    retry_policy.raise_for_retry(
+                        attempt, True, response.status, response.headers
+                    )
+                    catch_http_error_nexus(response, QueryingError, aiohttp_error=True)
+                    # SPARQL results are not served as application/json.
+                    return await response.json(content_type=None)
+
+        return await retry_policy.arun(send, idempotent=True)
+
+    def _elastic_results(
+        self, results: Dict, as_resource: bool, build_resource_from: str
+    ) -> Optional[Union[List[Resource], Resource, List[Dict], Dict]]:
 
-        results = response.json()
         results = results["hits"]["hits"]
 
         if not as_resource:
@@ -1178,6 +1850,36 @@ class BlueBrainNexus(Store):
             for hit in results
         ]
 
+    # State.
+
+    def freshness(self) -> Optional[str]:
+        # Changes with the project, i.e. its base, vocab and API mappings, and with its schemas and
+        # ontologies, from which the shapes and the ontologies of a model are loaded.
+        with ThreadPoolExecutor(3, thread_name_prefix="kgforge-freshness") as executor:
+            project = executor.submit(
+                project_fetch, self.endpoint, self.token, self.organisation, self.project,
+                session=self.service.session
+            )
+            schemas = executor.submit(self._last_update, self.service.url_schemas, {})
+            ontologies = executor.submit(
+                self._last_update, self.service.url_resources,
+                {"type": "http://www.w3.org/2002/07/owl#Ontology"}
+            )
+        return json.dumps([project.result()["_rev"], schemas.result(), ontologies.result()])
+
+    def _last_update(self, url: str, params: Dict) -> List:
+        response = self.service.session.get(
+            url, params={**params, "size": 1, "sort": "-_updatedAt"},
+            headers=self.service.headers, timeout=REQUEST_TIMEOUT
+        )
+        catch_http_error_nexus(response, RetrievalError)
+        listing = response.json()
+        results = listing["_results"]
+        return [listing["_total"], results[0]["_updatedAt"] if results else None]
+
+    def close(self) -> None:
+        self.service.close()
+
     # Utils.
 
     def _initialize_service(
@@ -1195,6 +1897,14 @@ class BlueBrainNexus(Store):
                 raise ValueError(
                     f"max_connection value should be great than 0 but {max_connection} is provided"
                 )
+            concurrency = store_config.pop("concurrency", {})
+            retry = store_config.pop("retry", {})
+            prepare_workers = store_config.pop("prepare_workers", Service.PREPARE_WORKERS)
+            if prepare_workers < 0:
+                raise ValueError(
+                    f"prepare_workers value should be positive but {prepare_workers} is provided"
+                )
+            cache = store_config.pop("cache", None)
             store_context_config = store_config.pop("vocabulary", {})
             nexus_metadata_context = store_context_config.get(
                 "metadata",
@@ -1233,6 +1943,10 @@ class BlueBrainNexus(Store):
             token=token,
             model_context=self.model_context(),
             max_connection=max_connection,
+            concurrency=concurrency,
+            retry=retry,
+            prepare_workers=prepare_workers,
+            cache=cache,
             searchendpoints=searchendpoints,
             store_context=nexus_context_iri,
             store_local_context=nexus_context_local_iri,
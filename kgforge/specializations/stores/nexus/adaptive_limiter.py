@@ -0,0 +1,189 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from aiohttp import ClientConnectionError, ClientResponseError
+
+
+class AdaptiveLimiter:
+    """Concurrency limit for requests sent to the store, adjusted with AIMD.
+
+    The limit grows additively (about one slot per round trip) while the smoothed latency stays
+    within latency_tolerance times the baseline latency, and shrinks multiplicatively by
+    decrease_factor on overload responses (429, 502, 503, 504), connection errors, timeouts or
+    latency spikes. It stays between min_limit and max_limit. With adaptive=False the limit is
+    fixed to max_limit and the limiter behaves as a semaphore which still reports latencies.
+
+    The limiter can be shared by coroutines running in different event loops.
+    """
+
+    OVERLOAD_STATUSES = {429, 502, 503, 504}
+    DEFAULT_INITIAL_LIMIT = 10
+
+    def __init__(
+            self,
+            max_limit: int,
+            initial_limit: Optional[int] = None,
+            min_limit: int = 1,
+            adaptive: bool = True,
+            latency_tolerance: float = 2.0,
+            decrease_factor: float = 0.5,
+            smoothing: float = 0.2,
+            baseline_drift: float = 0.01,
+    ) -> None:
+        if max_limit <= 0:
+            raise ValueError(f"max_limit value should be greater than 0 but {max_limit} is provided")
+        self.max_limit = max_limit
+        self.min_limit = max(1, min(min_limit, max_limit))
+        self.adaptive = adaptive
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.smoothing = smoothing
+        self.baseline_drift = baseline_drift
+        if adaptive:
+            initial = initial_limit or min(max_limit, AdaptiveLimiter.DEFAULT_INITIAL_LIMIT)
+            self._limit = float(min(max(initial, self.min_limit), max_limit))
+        else:
+            self._limit = float(max_limit)
+        self.inflight = 0
+        # Exponentially smoothed latency of successful requests, in seconds.
+        self.latency: Optional[float] = None
+        # Lowest latency observed, slowly forgotten so that the baseline follows the store.
+        self.baseline_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        latency = f"{self.latency * 1000:.1f}ms" if self.latency is not None else None
+        return f"AdaptiveLimiter(limit={self.limit}, inflight={self.inflight}, latency={latency})"
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def acquire(self) -> "_Slot":
+        return _Slot(self)
+
+    async def _acquire(self) -> None:
+        with self._lock:
+            if self.inflight < self.limit and not self._waiters:
+                self.inflight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                handed_over = waiter not in self._waiters
+                if not handed_over:
+                    self._waiters.remove(waiter)
+            if handed_over and waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        with self._lock:
+            self.inflight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        with self._lock:
+            woken = []
+            while self._waiters and self.inflight < self.limit:
+                woken.append(self._waiters.popleft())
+                self.inflight += 1
+        for waiter in woken:
+            waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter)
+
+    def _hand_over(self, waiter: asyncio.Future) -> None:
+        if waiter.cancelled():
+            self._release()
+        else:
+            waiter.set_result(None)
+
+    def _record(self, latency: float, overloaded: bool) -> None:
+        with self._lock:
+            if overloaded:
+                self._decrease()
+            else:
+                self.latency = latency if self.latency is None \
+                    else (1 - self.smoothing) * self.latency + self.smoothing * latency
+                self.baseline_latency = latency if self.baseline_latency is None \
+                    else min(latency, self.baseline_latency * (1 + self.baseline_drift))
+                if self.latency > self.latency_tolerance * self.baseline_latency:
+                    self._decrease()
+                elif self.adaptive and self.inflight >= self.limit:
+                    # Only grow when the current limit is actually used.
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+        self._wake()
+
+    def _decrease(self) -> None:
+        # At most one decrease per round trip so that a burst of errors from requests sent under
+        # the same limit only counts once.
+        now = time.monotonic()
+        if not self.adaptive or now - self._last_decrease < (self.latency or 0):
+            return
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+        self._last_decrease = now
+
+
+class _Slot:
+
+    def __init__(self, limiter: AdaptiveLimiter) -> None:
+        self.limiter = limiter
+        self._status: Optional[int] = None
+        self._start: Optional[float] = None
+        self._responded: Optional[float] = None
+
+    @property
+    def status(self) -> Optional[int]:
+        return self._status
+
+    @status.setter
+    def status(self, status: int) -> None:
+        # The HTTP status of the response, to be set as soon as it is received. The latency is
+        # measured until then so that reading a large body, e.g. a file, does not count as latency.
+        self._status = status
+        self._responded = time.monotonic()
+
+    async def __aenter__(self) -> "_Slot":
+        await self.limiter._acquire()
+        self._start = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        latency = (self._responded or time.monotonic()) - self._start
+        try:
+            if not isinstance(exc, asyncio.CancelledError):
+                self.limiter._record(latency, self._overloaded(exc))
+        finally:
+            self.limiter._release()
+
+    def _overloaded(self, exc: Optional[BaseException]) -> bool:
+        if self.status in AdaptiveLimiter.OVERLOAD_STATUSES:
+            return True
+        while exc is not None:
+            if isinstance(exc, (ClientConnectionError, asyncio.TimeoutError)):
+                return True
+            if isinstance(exc, ClientResponseError):
+                return exc.status in AdaptiveLimiter.OVERLOAD_STATUSES
+            exc = exc.__cause__
+        return False
@@ -1,73 +1,49 @@
 from asyncio import AbstractEventLoop
 from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 import json
 import asyncio
+from functools import partial
 
-from typing import Callable, Dict, List, Optional, Tuple, Type, Any, Coroutine, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Any, Coroutine, Union
 
 from kgforge.core.commons.actions import Action
-from kgforge.core.commons.constants import DEFAULT_REQUEST_TIMEOUT
 
 from typing_extensions import Unpack
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession
 
 from kgforge.core.resource import Resource
 from kgforge.core.commons.exceptions import RunException
+from kgforge.specializations.stores.nexus.adaptive_limiter import AdaptiveLimiter
 from kgforge.specializations.stores.nexus.service import Service, _error_message
 
 BatchResult = namedtuple("BatchResult", ["resource", "response"])
 BatchResults = List[BatchResult]
 
-BATCH_REQUEST_TIMEOUT_PER_REQUEST = DEFAULT_REQUEST_TIMEOUT
-
 
 class BatchRequestHandler:
-    BATCH_SIZE = 80
-
-    @staticmethod
-    def batch(iterable, n=BATCH_SIZE):
-
-        length_v = len(iterable)
-        for ndx in range(0, length_v, n):
-            yield iterable[ndx:min(ndx + n, length_v)]
 
     @staticmethod
-    def batch_request(
+    def batch_request_on_resources(
             service: Service,
-            data: List[Any],
-            task_creator: Callable[
-                [asyncio.Semaphore, AbstractEventLoop, List[Any], Service, Unpack[Any]],
-                Coroutine[Any, Any, Tuple[List[asyncio.Task], List[ClientSession]]]
+            resources: List[Resource],
+            prepare_function: Callable[
+                ['Service', Resource, Dict, Unpack[Any]],
+                Tuple[str, str, Resource, Type[RunException], Dict, Optional[Dict], Optional[Dict]]
             ],
+            callback: Optional[Callable] = None,
             **kwargs
-    ):
-
-        try:
-            loop = asyncio.get_running_loop()  # Try getting the current running loop
-        except RuntimeError:
-            loop = asyncio.new_event_loop()  # Create a new event loop if not running
-            asyncio.set_event_loop(loop)
-
-        async def dispatch_action():
-            semaphore = asyncio.Semaphore(service.max_connection)
-
-            tasks, sessions = await task_creator(semaphore, loop, data, service, **kwargs)
-            return await asyncio.gather(*tasks), sessions
-
-        async def close_sessions(sesss):
-            for sess in sesss:
-                await sess.close()
-
-        # Run both dispatch and session cleanup synchronously
-        res, sessions = loop.run_until_complete(dispatch_action())
-        loop.run_until_complete(close_sessions(sessions))
-        loop.close()
-
-        return res
+    ) -> BatchResults:
+        # The loop and the client session are owned by the service and reused across calls.
+        return service.run(
+            BatchRequestHandler.abatch_request_on_resources(
+                service, resources, prepare_function, callback, **kwargs
+            )
+        )
 
     @staticmethod
-    def batch_request_on_resources(
+    async def abatch_request_on_resources(
             service: Service,
             resources: List[Resource],
             prepare_function: Callable[
@@ -77,79 +53,181 @@ class BatchRequestHandler:
             callback: Optional[Callable] = None,
             **kwargs
     ) -> BatchResults:
+        # Runs in the running event loop, with the client session of the service bound to it.
 
-        async def create_tasks_for_resources(
-                semaphore: asyncio.Semaphore,
-                loop: AbstractEventLoop,
-                resources: List[Resource],
-                service,
-                **kwargs
-        ) -> Tuple[List[asyncio.Task], List[ClientSession]]:
-
-            prepare_function = kwargs["prepare_function"]
-            callback = kwargs["callback"]
+        async def request(resource: Optional[Resource], client_session: ClientSession) -> BatchResult:
+            return await BatchRequestHandler.request_on_resource(
+                service, resource, client_session, prepare_function, **kwargs
+            )
 
-            async def request(resource: Optional[Resource], client_session: ClientSession) -> BatchResult:
+        # The limiter is owned by the service so that the concurrency it converged to is kept
+        # across calls.
+        return await BatchRequestHandler.dispatch(
+            asyncio.get_running_loop(), resources, request, callback, service.client_session(),
+            service.limiter, service.prepare_workers
+        )
 
-                method, url, resource, exception, headers, params, payload = prepare_function(
-                    service, resource, **kwargs
+    @staticmethod
+    def stream_request_on_resources(
+            service: Service,
+            resources: Iterable[Resource],
+            prepare_function: Callable[
+                ['Service', Resource, Dict, Unpack[Any]],
+                Tuple[str, str, Resource, Type[RunException], Dict, Optional[Dict], Optional[Dict]]
+            ],
+            callback: Optional[Callable] = None,
+            verify: Optional[Callable[[Resource], bool]] = None,
+            **kwargs
+    ) -> Iterator[BatchResult]:
+        # Requests are submitted to the I/O loop of the service in a sliding window bounded by the
+        # limit of its limiter and the number of its preparation workers, as the results are
+        # consumed. Resources are therefore pulled lazily from the iterable and the results are
+        # yielded in completion order. Resources for which verify() returns False are not sent
+        # and are yielded with the error they were given.
+
+        async def request(resource: Resource) -> BatchResult:
+            task = asyncio.ensure_future(
+                BatchRequestHandler.request_on_resource(
+                    service, resource, service.client_session(), prepare_function, **kwargs
                 )
+            )
+            # Done callbacks are called in the order they are added, so before this coroutine
+            # resumes and the result is yielded.
+            if callback:
+                task.add_done_callback(callback)
+            return await task
 
-                async with semaphore:
+        pending: Set[Future] = set()
+        resources = iter(resources)
+        exhausted = False
 
+        try:
+            while True:
+                while not exhausted and len(pending) < service.limiter.limit + service.prepare_workers:
                     try:
-                        async with client_session.request(
-                                method=method,
-                                url=url,
-                                headers=headers,
-                                data=json.dumps(payload, ensure_ascii=True),
-                                params=params
-                        ) as response:
-                            content = await response.json()
-                            if response.status < 400:
-                                return BatchResult(resource, content)
-
-                            error = exception(_error_message(content))
-                            return BatchResult(resource, error)
-
-                    except Exception as e:
-                        return BatchResult(resource, exception(str(e)))
-
-            return BatchRequestHandler.create_tasks_and_sessions(
-                loop, resources, request, callback
+                        resource = next(resources)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if verify is not None and not verify(resource):
+                        yield BatchResult(resource, resource._last_action.error)
+                        continue
+                    pending.add(service.submit(request(resource)))
+
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    async def request_on_resource(
+            service: Service,
+            resource: Optional[Resource],
+            client_session: ClientSession,
+            prepare_function: Callable[
+                ['Service', Resource, Dict, Unpack[Any]],
+                Tuple[str, str, Resource, Type[RunException], Dict, Optional[Dict], Optional[Dict]]
+            ],
+            **kwargs
+    ) -> BatchResult:
+
+        if service.prepare_executor is None:
+            prepared = BatchRequestHandler._prepare(service, resource, prepare_function, **kwargs)
+        else:
+            prepared = await asyncio.get_running_loop().run_in_executor(
+                service.prepare_executor,
+                partial(BatchRequestHandler._prepare, service, resource, prepare_function, **kwargs),
             )
+        method, url, resource, exception, headers, params, data = prepared
+        retry_policy = service.retry_policy
+
+        async def send(attempt: int) -> BatchResult:
+            async with service.limiter.acquire() as slot:
+                async with client_session.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        data=data,
+                        params=params
+                ) as response:
+                    slot.status = response.status
+                    retry_policy.raise_for_retry(
+                        attempt, idempotent, response.status, response.headers
+                    )
+                    content = await response.json()
+                    if response.status < 400:
+                        return BatchResult(resource, content)
+
+                    error = exception(_error_message(content))
+                    return BatchResult(resource, error)
+
+        try:
+            idempotent = retry_policy.idempotent(method, url, params)
+            return await retry_policy.arun(send, idempotent)
+        except Exception as e:
+            return BatchResult(resource, exception(str(e)))
 
-        return BatchRequestHandler.batch_request(
-            service=service,
-            data=resources,
-            task_creator=create_tasks_for_resources,
-            prepare_function=prepare_function,
-            callback=callback,
+    @staticmethod
+    def _prepare(
+            service: Service,
+            resource: Optional[Resource],
+            prepare_function: Callable[
+                ['Service', Resource, Dict, Unpack[Any]],
+                Tuple[str, str, Resource, Type[RunException], Dict, Optional[Dict], Optional[Dict]]
+            ],
             **kwargs
+    ) -> Tuple[str, str, Resource, Type[RunException], Dict, Optional[Dict], str]:
+        # Builds the request and serialises its payload, which is CPU-bound for large resources.
+        method, url, resource, exception, headers, params, payload = prepare_function(
+            service, resource, **kwargs
         )
+        return method, url, resource, exception, headers, params, json.dumps(payload, ensure_ascii=True)
 
     @staticmethod
-    def create_tasks_and_sessions(
+    async def dispatch(
             loop: AbstractEventLoop,
-            elements: List[Union[str, Resource]],
-            fc: Callable[[Union[str, Resource], ClientSession], Coroutine[Any, Any, Union[Resource, Action, BatchResult]]],
-            callback: Optional[Callable]
-    ) -> Tuple[List[asyncio.Task], List[ClientSession]]:
-
-        tasks = []
-        sessions = []
+            elements: Iterable[Any],
+            fc: Callable[[Any, ClientSession], Coroutine[Any, Any, Union[Resource, Action, BatchResult]]],
+            callback: Optional[Callable],
+            session: ClientSession,
+            limiter: AdaptiveLimiter,
+            ahead: int = 0,
+    ) -> List[Union[Resource, Action, BatchResult]]:
+        # Tasks are created for the elements in a sliding window as slots of the limiter free up
+        # instead of all at once, so that the coroutines and the prepared payloads kept in memory
+        # are proportional to the concurrency limit and not to the number of elements. The window
+        # exceeds the limit by ahead tasks, which can prepare their request while waiting for a slot.
+        results: Dict[int, Union[Resource, Action, BatchResult]] = {}
+        pending: Dict[asyncio.Task, int] = {}
+        elements = enumerate(elements)
+        exhausted = False
 
-        for batch_i in BatchRequestHandler.batch(elements):
-
-            session = ClientSession(timeout=ClientTimeout(BATCH_REQUEST_TIMEOUT_PER_REQUEST))
-            sessions.append(session)
-
-            for res in batch_i:
-                prepared_request: asyncio.Task = loop.create_task(fc(res, session))
-
-                if callback:
-                    prepared_request.add_done_callback(callback)
-
-                tasks.append(prepared_request)
-
-        return tasks, sessions
+        try:
+            while True:
+                while not exhausted and len(pending) < limiter.limit + ahead:
+                    try:
+                        i, element = next(elements)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    task = loop.create_task(fc(element, session))
+                    if callback:
+                        task.add_done_callback(callback)
+                    pending[task] = i
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[pending.pop(task)] = task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return [results[i] for i in range(len(results))]
@@ -0,0 +1,125 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import asyncio
+import threading
+import weakref
+from asyncio import AbstractEventLoop
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional, Set
+
+import requests
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from requests.adapters import HTTPAdapter
+
+from kgforge.core.commons.constants import DEFAULT_REQUEST_TIMEOUT
+from kgforge.specializations.stores.nexus.retry_policy import RetryPolicy, RetrySession
+
+
+class ConnectionPool:
+    """Long-lived keep-alive HTTP connections shared by all the operations of a store.
+
+    Synchronous requests go through a single requests.Session and asynchronous ones through an
+    aiohttp.ClientSession created once per event loop. Both are bounded by max_connection.
+    Synchronous requests failing transiently are retried following retry_policy.
+    Coroutines submitted with run() are executed in an I/O event loop running in a background
+    thread owned by the pool, so that callers in several threads can share it and no event loop
+    needs to be created or nested per call.
+    """
+
+    KEEPALIVE_TIMEOUT = 60
+
+    def __init__(
+            self,
+            max_connection: int,
+            timeout: int = DEFAULT_REQUEST_TIMEOUT,
+            retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        self.max_connection = max_connection
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.session: requests.Session = RetrySession(self.retry_policy)
+        adapter = HTTPAdapter(pool_connections=max_connection, pool_maxsize=max_connection)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._client_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._closers: Set[asyncio.Task] = set()
+        self._loop: Optional[AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def event_loop(self) -> AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="kgforge-io", daemon=True
+                )
+                self._thread.start()
+        return self._loop
+
+    def run(self, coroutine: Coroutine) -> Any:
+        # Blocks the calling thread until the coroutine completes in the I/O loop.
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("run() cannot be called from the I/O loop thread, await the coroutine instead")
+        return self.submit(coroutine).result()
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        # Schedules the coroutine in the I/O loop without waiting for it to complete.
+        return asyncio.run_coroutine_threadsafe(coroutine, self.event_loop())
+
+    def client_session(self) -> ClientSession:
+        # Should be called from a coroutine running in the loop the session is bound to.
+        loop = asyncio.get_running_loop()
+        session = self._client_sessions.get(loop)
+        if session is None or session.closed:
+            connector = TCPConnector(
+                limit=self.max_connection, keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            session = ClientSession(
+                connector=connector, timeout=ClientTimeout(total=self.timeout)
+            )
+            self._client_sessions[loop] = session
+            if loop is not self._loop:
+                # The loop only keeps weak references to its tasks.
+                closer = loop.create_task(ConnectionPool._close_on_shutdown(session))
+                self._closers.add(closer)
+                closer.add_done_callback(self._closers.discard)
+        return session
+
+    @staticmethod
+    async def _close_on_shutdown(session: ClientSession) -> None:
+        # Pending until the tasks of the loop are cancelled when it shuts down, e.g. at the end of
+        # asyncio.run(), so that the session of a loop owned by the caller is closed before it.
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await session.close()
+
+    def close(self) -> None:
+        io_loop = self._loop
+        for loop, session in list(self._client_sessions.items()):
+            if session.closed or loop.is_closed():
+                continue
+            if loop is io_loop:
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result()
+            elif not loop.is_running():
+                loop.run_until_complete(session.close())
+        self._client_sessions.clear()
+        if io_loop is not None and not io_loop.is_closed():
+            io_loop.call_soon_threadsafe(io_loop.stop)
+            self._thread.join()
+            io_loop.close()
+        self.session.close()
@@ -50,7 +50,8 @@ def files_create(
         endpoint: Optional[str],
         token: Optional[str],
         org_label: str, project_label: str, filepath: str, storage_id: Optional[str] = None,
-        file_id: Optional[str] = None, filename: Optional[str] = None, content_type: Optional[str] = None
+        file_id: Optional[str] = None, filename: Optional[str] = None, content_type: Optional[str] = None,
+        session: Optional[requests.Session] = None
 ) -> Dict:
     """
         Creates a file resource from a binary attachment using the POST method when the user does not provide
@@ -67,6 +68,7 @@ def files_create(
                         If not provided, an ID will be generated.
         :param filename: OPTIONAL Overrides the automatically detected filename
         :param content_type: OPTIONAL Override the automatically detected content type
+        :param session: OPTIONAL a requests.Session to reuse the connections of
         :return: A payload containing only the Nexus metadata for this updated file.
     """
 
@@ -84,14 +86,23 @@ def files_create(
     }
 
     if file_id is None:
-        return http_post(environment=endpoint, token=token, path=path, body=file_obj, data_type="file", storage=storage_id)
+        return http_post(
+            environment=endpoint, token=token, path=path, body=file_obj, data_type="file", session=session,
+            storage=storage_id
+        )
     else:
         path.append(url_encode(file_id))
-        return http_put(environment=endpoint, token=token, path=path, body=file_obj, data_type="file", storage=storage_id)
+        return http_put(
+            environment=endpoint, token=token, path=path, body=file_obj, data_type="file", session=session,
+            storage=storage_id
+        )
 
 
 # TODO add docstring
-def http_post(environment: Optional[str], token: Optional[str], path: Union[str, List[str]], body=None, data_type="default", use_base=False, **kwargs):
+def http_post(
+        environment: Optional[str], token: Optional[str], path: Union[str, List[str]], body=None, data_type="default",
+        use_base=False, session: Optional[requests.Session] = None, **kwargs
+):
     """
         Perform a POST request.
         :param environment: the endpoint base, mandatory is use_base is True, else it is not used
@@ -99,23 +110,28 @@ def http_post(environment: Optional[str], token: Optional[str], path: Union[str,
         :param path: complete URL if use_base is False or just the ending if use_base is True
         :param body: OPTIONAL Things to send, can be a dictionary
         :param data_type: OPTIONAL can be "json" or "text" (default: "default" = "json")
+        :param session: OPTIONAL a requests.Session to reuse the connections of
         :param params: OPTIONAL provide some URL parameters (?foo=bar&hello=world) as a dictionary
         :return: the dictionary that is equivalent to the json response
     """
     header = prepare_header(token=token, type=data_type)
     full_url = _full_url(environment, path, use_base)
+    http = session or requests
 
     if data_type != "file":
         body_data = prepare_body(body, data_type)
-        response = requests.post(full_url, headers=header, data=body_data, params=kwargs)
+        response = http.post(full_url, headers=header, data=body_data, params=kwargs)
     else:
-        response = requests.post(full_url, headers=header, files=body, params=kwargs)
+        response = http.post(full_url, headers=header, files=body, params=kwargs)
 
     response.raise_for_status()
     return decode_json_ordered(response.text)
 
 
-def http_put(environment: Optional[str], token: Optional[str], path: Union[str, List[str]], body=None, data_type="default", use_base=False, **kwargs):
+def http_put(
+        environment: Optional[str], token: Optional[str], path: Union[str, List[str]], body=None, data_type="default",
+        use_base=False, session: Optional[requests.Session] = None, **kwargs
+):
     """
         Performs a PUT request
 
@@ -124,18 +140,20 @@ def http_put(environment: Optional[str], token: Optional[str], path: Union[str,
         :param data_type: OPTIONAL can be "json" or "text" or "file" (default: "default" = "json")
         :param use_base: OPTIONAL if True, the Nexus env provided by nexus.config.set_environment will
         be prepended to path. (default: False)
+        :param session: OPTIONAL a requests.Session to reuse the connections of
 
         :param params: OPTIONAL provide some URL parameters (?foo=bar&hello=world) as a dictionary
         :return: the dictionary that is equivalent to the json response
     """
     header = prepare_header(token=token, type=data_type)
     full_url = _full_url(environment, path, use_base)
+    http = session or requests
 
     if data_type != "file":
         body_data = prepare_body(body, data_type)
-        response = requests.put(full_url, headers=header, data=body_data, params=kwargs)
+        response = http.put(full_url, headers=header, data=body_data, params=kwargs)
     else:
-        response = requests.put(full_url, headers=header, files=body, params=kwargs)
+        response = http.put(full_url, headers=header, files=body, params=kwargs)
 
     response.raise_for_status()
     return decode_json_ordered(response.text)
@@ -144,7 +162,7 @@ def http_put(environment: Optional[str], token: Optional[str], path: Union[str,
 def http_get(
         environment: Optional[str], token: Optional[str],
         path: Union[str, List[str]], stream=False, get_raw_response=False, use_base=False,
-        data_type="default", accept="json", **kwargs
+        data_type="default", accept="json", session: Optional[requests.Session] = None, **kwargs
 ):
     """
         Wrapper to perform a GET request.
@@ -159,16 +177,18 @@ def http_get(
         (convenient when getting a binary file). If False, a dictionary representation of the response will be returned
         (default: False)
         :param stream: OPTIONAL True if GETting a file (default: False)
+        :param session: OPTIONAL a requests.Session to reuse the connections of
         :return: if get_raw_response is True, returns the request.get object. If get_raw_response is False, return the
         dictionary that is equivalent to the json response
     """
     header = prepare_header(token=token, type=data_type, accept=accept)
     full_url = _full_url(environment=environment, path=path, use_base=use_base)
     params = kwargs.pop("params", None)
+    http = session or requests
     if params:
-        response = requests.get(full_url, headers=header, stream=stream, params=params, **kwargs)
+        response = http.get(full_url, headers=header, stream=stream, params=params, **kwargs)
     else:
-        response = requests.get(full_url, headers=header, stream=stream, params=kwargs)
+        response = http.get(full_url, headers=header, stream=stream, params=kwargs)
     response.raise_for_status()
 
     if get_raw_response:
@@ -238,7 +258,7 @@ def prepare_body(data, type="default"):
 def project_fetch(
         endpoint: Optional[str],
         token: Optional[str],
-        org_label: str, project_label: str, rev=None
+        org_label: str, project_label: str, rev=None, session: Optional[requests.Session] = None
 ):
     """
         Fetch a project and all its details.
@@ -249,6 +269,7 @@ def project_fetch(
         :param org_label: The label of the organization that contains the project to be fetched
         :param project_label: label of a the project to fetch
         :param rev: OPTIONAL The specific revision of the wanted project. If not provided, will get the last.
+        :param session: OPTIONAL a requests.Session to reuse the connections of
         :return: All the details of this project, as a dictionary
     """
 
@@ -259,13 +280,13 @@ def project_fetch(
     if rev is not None:
         path = path + "?rev=" + str(rev)
 
-    return http_get(environment=endpoint, token=token, path=path, use_base=True)
+    return http_get(environment=endpoint, token=token, path=path, use_base=True, session=session)
 
 
 def views_fetch(
         endpoint: Optional[str],
         token: Optional[str],
-        org_label, project_label, view_id, rev=None, tag=None
+        org_label, project_label, view_id, rev=None, tag=None, session: Optional[requests.Session] = None
 ):
     """
     Fetches a distant view and returns the payload as a dictionary.
@@ -278,6 +299,7 @@ def views_fetch(
     :param view_id: id of the view
     :param rev: OPTIONAL fetches a specific revision of a view (default: None, fetches the last)
     :param tag: OPTIONAL fetches the view version that has a specific tag (default: None)
+    :param session: OPTIONAL a requests.Session to reuse the connections of
     :return: Payload of the whole view as a dictionary
     """
 
@@ -297,4 +319,4 @@ def views_fetch(
     if tag is not None:
         path = path + "?tag=" + str(tag)
 
-    return http_get(environment=endpoint, token=token, path=path, use_base=True)
+    return http_get(environment=endpoint, token=token, path=path, use_base=True, session=session)
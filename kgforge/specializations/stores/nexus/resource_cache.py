@@ -0,0 +1,167 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Mapping, NamedTuple, Optional, Set, Tuple
+
+
+class CachedResponse(NamedTuple):
+    id: str
+    text: str
+    etag: Optional[str]
+    pinned: bool
+    immutable: bool
+    stored_at: float
+
+
+class ResourceCache:
+    """Client-side cache of the responses to resource retrievals, keyed by URL and parameters.
+
+    Up to max_entries responses are kept in memory, the least recently used one being evicted
+    first. Responses for a pinned version, i.e. a rev or a tag parameter, are valid until they are
+    invalidated. Responses for the latest revision are fresh for ttl seconds, after which they
+    should be revalidated with their ETag. When a directory is given, responses for a given rev,
+    which never change, are also written there so that they outlive the store instance. Keys
+    include a digest of identity, e.g. the endpoint and the token of the store, so that responses
+    written to a shared directory are only served to the identity which was allowed to get them.
+    invalidate() should be called when a resource is changed through the store: responses for its
+    latest revision and for its tags are then dropped.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 1000,
+            ttl: float = 60,
+            directory: Optional[str] = None,
+            identity: Optional[str] = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError(f"max_entries value should be greater than 0 but {max_entries} is provided")
+        if ttl < 0:
+            raise ValueError(f"ttl value should be positive but {ttl} is provided")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = Path(directory) if directory is not None else None
+        self._identity = hashlib.sha256((identity or "").encode()).hexdigest()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._keys_by_id: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "entries": len(self._entries),
+        }
+
+    def lookup(self, url: str, params: Mapping) -> Tuple[Optional[CachedResponse], bool]:
+        """Return the cached response, if any, and whether it can be used without a request."""
+        key = self._key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and "rev" in params:
+                entry = self._read(key)
+                if entry is not None:
+                    self._add(key, entry)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            fresh = entry is not None and (entry.pinned or time.monotonic() - entry.stored_at < self.ttl)
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry, fresh
+
+    def store(self, url: str, params: Mapping, id_: str, text: str, etag: Optional[str]) -> None:
+        key = self._key(url, params)
+        immutable = "rev" in params
+        pinned = immutable or "tag" in params
+        entry = CachedResponse(id_, text, etag, pinned, immutable, time.monotonic())
+        with self._lock:
+            self._add(key, entry)
+        if immutable:
+            self._write(key, entry)
+
+    def revalidated(self, url: str, params: Mapping, entry: CachedResponse) -> None:
+        # The store answered that the cached response is still the latest one.
+        with self._lock:
+            self.revalidations += 1
+            self._add(self._key(url, params), entry._replace(stored_at=time.monotonic()))
+
+    def invalidate(self, id_: str) -> None:
+        with self._lock:
+            for key in list(self._keys_by_id.get(id_, ())):
+                if not self._entries[key].immutable:
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+
+    def _add(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._keys_by_id.setdefault(entry.id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        keys = self._keys_by_id[entry.id]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_id[entry.id]
+
+    def _key(self, url: str, params: Mapping) -> str:
+        return f"{self._identity} {url} {json.dumps(params, sort_keys=True, default=str)}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _read(self, key: str) -> Optional[CachedResponse]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(data["id"], data["text"], data["etag"], True, True, time.monotonic())
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        # Written to a temporary file first so that concurrent readers never see a partial entry.
+        if self.directory is None:
+            return
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"id": entry.id, "text": entry.text, "etag": entry.etag}, f)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
@@ -0,0 +1,164 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, TypeVar
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from aiohttp import ClientConnectionError
+
+T = TypeVar("T")
+
+
+class RetryRequest(Exception):
+    """Raised by a request attempt whose response is transient and can be retried."""
+
+    def __init__(self, status: int, delay: float) -> None:
+        super().__init__(f"Request failed with the transient status {status}, retrying in {delay:.2f}s")
+        self.status = status
+        self.delay = delay
+
+
+class RetryPolicy:
+    """When and how long to wait before sending again a request which failed transiently.
+
+    Connection errors, timeouts and responses with a status in statuses are retried up to
+    max_retries times, waiting for the Retry-After response header when present and otherwise
+    for an exponential backoff (backoff_factor * 2 ** attempt) randomised with full jitter. Both
+    waits are capped by max_backoff. Only idempotent requests are retried: GET, HEAD and OPTIONS
+    ones, PUT and DELETE ones targeting a revision (rev parameter), and POST ones only if
+    retry_post is True. Callers can override the idempotency of a request, e.g. for read-only
+    queries sent with POST.
+    """
+
+    RETRY_STATUSES = (429, 502, 503, 504)
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+    REVISION_METHODS = {"PUT", "DELETE"}
+
+    def __init__(
+            self,
+            max_retries: int = 3,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 30.0,
+            jitter: bool = True,
+            statuses: Iterable[int] = RETRY_STATUSES,
+            retry_post: bool = False,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError(f"max_retries value should be positive but {max_retries} is provided")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = set(statuses)
+        self.retry_post = retry_post
+
+    def idempotent(self, method: str, url: str, params: Optional[Mapping] = None) -> bool:
+        method = method.upper()
+        if method in RetryPolicy.SAFE_METHODS:
+            return True
+        if method in RetryPolicy.REVISION_METHODS:
+            return (params is not None and "rev" in params) or "rev" in parse_qs(urlparse(url).query)
+        if method == "POST":
+            return self.retry_post
+        return False
+
+    def retryable(self, attempt: int, idempotent: bool) -> bool:
+        return idempotent and attempt < self.max_retries
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        delay = _parse_retry_after(retry_after)
+        if delay is not None:
+            return min(self.max_backoff, delay)
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def raise_for_retry(self, attempt: int, idempotent: bool, status: int, headers: Mapping) -> None:
+        """Raise RetryRequest if a response with this status should be retried."""
+        if status in self.statuses and self.retryable(attempt, idempotent):
+            raise RetryRequest(status, self.backoff(attempt, headers.get("Retry-After")))
+
+    async def arun(self, send: Callable[[int], Awaitable[T]], idempotent: bool) -> T:
+        """Await send(attempt) until it succeeds, it fails permanently or retries are exhausted.
+
+        send should call raise_for_retry() on the status of the response it gets, in order to
+        retry it, before reading the response.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await send(attempt)
+            except RetryRequest as e:
+                delay = e.delay
+            except (ClientConnectionError, asyncio.TimeoutError):
+                if not self.retryable(attempt, idempotent):
+                    raise
+                delay = self.backoff(attempt)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+class RetrySession(requests.Session):
+    """A requests.Session retrying the requests it sends following a RetryPolicy.
+
+    The idempotency of a request can be given with the idempotent keyword argument. Requests
+    uploading files are never retried as their body cannot be sent again.
+    """
+
+    def __init__(self, retry_policy: RetryPolicy) -> None:
+        super().__init__()
+        self.retry_policy = retry_policy
+
+    def request(self, method: str, url: str, *args, idempotent: Optional[bool] = None, **kwargs) -> Any:
+        policy = self.retry_policy
+        params = kwargs.get("params")
+        if kwargs.get("files") or hasattr(kwargs.get("data"), "read"):
+            idempotent = False
+        elif idempotent is None:
+            idempotent = policy.idempotent(method, url, params if isinstance(params, Dict) else None)
+        attempt = 0
+        while True:
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not policy.retryable(attempt, idempotent):
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                try:
+                    policy.raise_for_retry(attempt, idempotent, response.status_code, response.headers)
+                    return response
+                except RetryRequest as e:
+                    response.close()
+                    delay = e.delay
+            time.sleep(delay)
+            attempt += 1
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # Retry-After is either a number of seconds or an HTTP date.
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -13,16 +13,17 @@
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
 from typing import Callable, Dict, List, Optional, Union, Tuple, Type, Any
-import asyncio
 import copy
 import json
+import weakref
 from asyncio import Task
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial
 from urllib.error import URLError
 from urllib.parse import quote_plus, urlparse, parse_qs
 
 import aiohttp
-import nest_asyncio
 import requests
 
 from kgforge.core.resource import Resource
@@ -36,7 +37,9 @@ from kgforge.core.commons.actions import (
 )
 
 from kgforge.core.commons.exceptions import ConfigurationError, RunException
+from kgforge.core.commons.execution import timed
 from kgforge.core.commons.context import Context
+from kgforge.core.commons.context_cache import cached_context, get_context_scope, using_context_scope
 from kgforge.core.conversions.rdf import (
     _from_jsonld_one,
     _remove_ld_keys,
@@ -46,6 +49,10 @@ from kgforge.core.conversions.rdf import (
 import kgforge
 from kgforge.core.wrappings.dict import wrap_dict
 from kgforge.specializations.stores.nexus.http_helpers import views_fetch
+from kgforge.specializations.stores.nexus.adaptive_limiter import AdaptiveLimiter
+from kgforge.specializations.stores.nexus.connection_pool import ConnectionPool
+from kgforge.specializations.stores.nexus.resource_cache import ResourceCache
+from kgforge.specializations.stores.nexus.retry_policy import RetryPolicy
 
 from kgforge.core.conversions.rdf import _from_jsonld_one, _remove_ld_keys, recursive_resolve
 from kgforge.core.wrappings.dict import wrap_dict
@@ -70,6 +77,8 @@ class Service:
 
     NEXUS_CONTENT_LENGTH_HEADER = "x-nxs-file-content-length"
 
+    PREPARE_WORKERS = 2
+
     def __init__(
             self,
             endpoint: str,
@@ -88,6 +97,10 @@ class Service:
             accept: str,
             files_upload_config: Dict,
             files_download_config: Dict,
+            concurrency: Optional[Dict] = None,
+            retry: Optional[Dict] = None,
+            prepare_workers: int = PREPARE_WORKERS,
+            cache: Optional[Dict] = None,
             **params,
     ):
         self.endpoint = endpoint
@@ -95,7 +108,35 @@ class Service:
         self.project = prj
         self.model_context = model_context
         self.context_cache: Dict = {}
+        # Metadata of the files to download, retrieved when preparing their download.
+        self.file_metadata: Dict[str, Dict] = {}
+        # Contexts resolved later, or in other threads, still go through the forge context cache
+        # and are recorded as resolved by the forge.
+        self.context_scope = get_context_scope()
         self.max_connection = max_connection
+        self.retry_policy = RetryPolicy(**(retry or {}))
+        self.connection_pool = ConnectionPool(
+            max_connection, Service.REQUEST_TIMEOUT, self.retry_policy
+        )
+        self.session = self.connection_pool.session
+        # Payloads of batch requests are built and serialised by these workers instead of in the
+        # event loop, so that preparing a request overlaps with the requests in flight.
+        # With prepare_workers=0 they are prepared in the event loop.
+        self.prepare_workers = prepare_workers
+        self.prepare_executor = ThreadPoolExecutor(
+            prepare_workers, thread_name_prefix="kgforge-prepare"
+        ) if prepare_workers > 0 else None
+        self._finalizer = weakref.finalize(
+            self, Service._release, self.connection_pool, self.prepare_executor
+        )
+        # Bounds the number of concurrent asynchronous requests, adapting it to the latency and
+        # the overload responses of the store between 1 and max_connection.
+        self.limiter = AdaptiveLimiter(max_connection, **(concurrency or {}))
+        # Retrieved resources are cached only if a cache configuration is given. Cached responses
+        # are scoped to the endpoint and the token they were retrieved with.
+        self.resource_cache = ResourceCache(
+            **cache, identity=f"{endpoint} {token or ''}"
+        ) if cache is not None else None
         self.params = copy.deepcopy(params)
         self.store_context = store_context
         self.store_local_context = store_local_context
@@ -146,19 +187,19 @@ class Service:
             self.headers_upload["Authorization"] = "Bearer " + token
             self.headers_download["Authorization"] = "Bearer " + token
 
-        self.context = Context(self.get_project_context())
-
         self.url_files = Service.make_endpoint(self.endpoint, "files", org, prj)
         self.url_resources = Service.make_endpoint(self.endpoint, "resources", org, prj)
         self.url_resolver = Service.make_endpoint(self.endpoint, "resolvers", org, prj)
         self.url_schemas = Service.make_endpoint(self.endpoint, "schemas", org, prj)
 
-        self.metadata_context = Context(
-            recursive_resolve(
-                self.store_context, self.resolve_context, already_loaded=[]
-            ),
-            store_context,
-        )
+        # The project and the metadata context are fetched concurrently as they do not depend on
+        # each other. Their durations are reported in startup_timings.
+        self.startup_timings: Dict[str, float] = {}
+        with ThreadPoolExecutor(2, thread_name_prefix="kgforge-startup") as startup:
+            project_context = startup.submit(self._timed, "project_context", self._project_context)
+            metadata_context = startup.submit(self._timed, "metadata_context", self._metadata_context)
+        self.context = project_context.result()
+        self.metadata_context = metadata_context.result()
         sparql_view = (
             sparql_config["endpoint"]
             if sparql_config and "endpoint" in sparql_config
@@ -196,15 +237,27 @@ class Service:
             quote_plus(org),
             quote_plus(prj),
             es_mapping if es_mapping else elastic_view,  # Todo consider using Dict for es_mapping
+            session=self.session,
         )
         self.elastic_endpoint["default_str_keyword_field"] = default_str_keyword_field
 
-        # The following code is for async to work on jupyter notebooks
-        try:
-            asyncio.get_event_loop()
-            nest_asyncio.apply()
-        except RuntimeError:
-            pass
+    def client_session(self) -> aiohttp.ClientSession:
+        return self.connection_pool.client_session()
+
+    def run(self, coroutine) -> Any:
+        return self.connection_pool.run(coroutine)
+
+    def submit(self, coroutine) -> Future:
+        return self.connection_pool.submit(coroutine)
+
+    def close(self) -> None:
+        self._finalizer()
+
+    @staticmethod
+    def _release(connection_pool: ConnectionPool, prepare_executor: Optional[ThreadPoolExecutor]) -> None:
+        connection_pool.close()
+        if prepare_executor is not None:
+            prepare_executor.shutdown()
 
     @staticmethod
     def make_endpoint(endpoint: str, endpoint_type: str, organisation: str, project: str):
@@ -270,14 +323,40 @@ class Service:
             project=self.project
         )
 
+    def _timed(self, step: str, fun: Callable[[], Any]) -> Any:
+        with timed(self.startup_timings, step):
+            return fun()
+
+    def _project_context(self) -> Context:
+        return Context(self.get_project_context())
+
+    def _metadata_context(self) -> Context:
+        return Context(
+            recursive_resolve(self.store_context, self.resolve_context, already_loaded=[]),
+            self.store_context,
+        )
+
     def get_project_context(self) -> Dict:
-        project_data = kgforge.specializations.stores.nexus.http_helpers.project_fetch(endpoint=self.endpoint, token=self.token, org_label=self.organisation, project_label=self.project)
+        with using_context_scope(self.context_scope):
+            project_data = cached_context(
+                "/".join([self.endpoint, "projects", self.organisation, self.project]),
+                partial(
+                    kgforge.specializations.stores.nexus.http_helpers.project_fetch,
+                    endpoint=self.endpoint, token=self.token, org_label=self.organisation,
+                    project_label=self.project, session=self.session
+                ),
+                self.token,
+            )
         context = {"@base": project_data["base"], "@vocab": project_data["vocab"]}
         for mapping in project_data['apiMappings']:
             context[mapping['prefix']] = mapping['namespace']
         return context
 
     def resolve_context(self, iri: str, local_only: Optional[bool] = False) -> Dict:
+        with using_context_scope(self.context_scope):
+            return self._resolve_context(iri, local_only)
+
+    def _resolve_context(self, iri: str, local_only: Optional[bool]) -> Dict:
         if iri in self.context_cache:
             return self.context_cache[iri]
         try:
@@ -291,9 +370,7 @@ class Service:
                 resource_id=context_to_resolve
             )
 
-            response = requests.get(url, headers=self.headers, timeout=Service.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            resource = response.json()
+            resource = cached_context(url, partial(self._fetch_context_resource, url), self.token)
         except Exception as exc:
             if not local_only:
                 try:
@@ -317,6 +394,11 @@ class Service:
         self.context_cache.update({context_to_resolve: document})
         return document
 
+    def _fetch_context_resource(self, url: str) -> Dict:
+        response = self.session.get(url, headers=self.headers, timeout=Service.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
     @staticmethod
     def _local_parse(id_value, version_params) -> Tuple[str, Dict]:
         parsed_id = urlparse(id_value)
@@ -377,6 +459,11 @@ class Service:
         resource._last_action = action
         resource._synchronized = synchronized
 
+    def invalidate_cached(self, resource: Resource) -> None:
+        # Should be called once a resource was changed in the store.
+        if self.resource_cache is not None and hasattr(resource, "id"):
+            self.resource_cache.invalidate(resource.id)
+
     def default_callback(self, fun_name: str) -> Callable:
         def callback(task: Task):
             result = task.result()
@@ -387,6 +474,8 @@ class Service:
                 resource=result.resource, response=result.response, action_name=fun_name,
                 succeeded=succeeded, synchronized=succeeded
             )
+            if succeeded:
+                self.invalidate_cached(result.resource)
 
         return callback
 
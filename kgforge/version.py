@@ -0,0 +1 @@
+__version__ = '0.1.dev26+ge11bd9094.d20261018'
@@ -46,7 +46,6 @@ setup(
         "rdflib==7.0.0",
         "pyLD",
         "pyshacl==v0.25.0",
-        "nest-asyncio>=1.5.1",
         "pyparsing>=2.0.2",
         "owlrl>=5.2.3",
         "elasticsearch_dsl==7.4.0",
@@ -64,6 +63,7 @@ setup(
         ],
         "docs": ["sphinx", "sphinx-bluebrain-theme"],
         "linking_sklearn": ["scikit-learn"],
+        "arrow": ["pyarrow>=14"],
     },
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
@@ -15,6 +15,7 @@
 # Placeholder for the test suite for actions.
 import pytest
 
+from kgforge.core.archetypes.read_only_store import ReadOnlyStore
 from kgforge.core.resource import Resource
 from kgforge.core.forge import KnowledgeGraphForge
 from kgforge.core.commons.exceptions import DownloadingError
@@ -24,4 +25,10 @@ def test_download(config):
     simple = Resource(type="Experiment", url="file.gz")
     with pytest.raises(DownloadingError):
         forge = KnowledgeGraphForge(config)
-        forge._store.download(simple, "fake.path", "./", overwrite=False, cross_bucket=False)
\ No newline at end of file
+        forge._store.download(simple, "fake.path", "./", overwrite=False, cross_bucket=False)
+
+def test_download_path(tmp_path):
+    assert ReadOnlyStore._download_path(tmp_path, "file.gz", False, "20240101") == str(tmp_path / "file.gz")
+    (tmp_path / "file.gz").touch()
+    assert ReadOnlyStore._download_path(tmp_path, "file.gz", True, "20240101") == str(tmp_path / "file.gz")
+    assert ReadOnlyStore._download_path(tmp_path, "file.gz", False, "20240101") == f"{tmp_path / 'file.gz'}.20240101"
@@ -39,3 +39,9 @@ def test_execute_lazy_actions():
     assert ra.pa5[1] == 123
     assert ra.pa5[2].pd1 == "pd1 executed"
     assert ra.pa5[3] == "string"
+
+
+def test_lazy_action_keyword_arguments():
+    action = LazyAction(lambda x, y=None: (x, y), "x", y="y")
+    assert action.execute() == ("x", "y")
+    assert str(action).endswith("args=['x'], kwargs={'y': 'y'})")
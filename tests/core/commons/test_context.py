@@ -13,13 +13,16 @@
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
 import json
+import pickle
 
 import pytest
 from urllib.error import URLError
+from rdflib.compare import isomorphic
 from rdflib.plugins.shared.jsonld.context import URI_GEN_DELIMS
 
-from kgforge.core.commons.context import Context
-from kgforge.core.conversions.rdf import _merge_jsonld
+from kgforge.core.commons.context import Context, interned_context
+from kgforge.core.conversions.rdf import _merge_jsonld, as_graph
+from kgforge.core.resource import Resource
 
 
 def test_load_context_as_dict(custom_context):
@@ -67,6 +70,26 @@ def test_load_context_fail():
         Context(context_url)
 
 
+def test_interned_context(custom_context, context_iri_file):
+    document = json.loads(json.dumps(custom_context))
+    context = interned_context(document)
+    assert interned_context(json.loads(json.dumps(custom_context))) is context
+    assert interned_context(document, "http://example.org/context") is not context
+    document["@context"]["Person"] = "http://example.org/Person"
+    assert context.document == custom_context
+    assert interned_context(document) is not context
+    assert interned_context(context_iri_file, context_iri_file) is interned_context(context_iri_file, context_iri_file)
+
+
+def test_pickled_context(model_context):
+    context = pickle.loads(pickle.dumps(model_context))
+    assert context.document == model_context.document
+    assert context.iri == model_context.iri
+    resource = Resource(type="Person", name="a name")
+    assert isomorphic(as_graph(resource, False, context, None, None),
+                      as_graph(resource, False, model_context, None, None))
+
+
 def test_prefix_with_non_URI_GEN_DELIMS_expands(model_context):
     context = model_context
     assert "_" not in URI_GEN_DELIMS
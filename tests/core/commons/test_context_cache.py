@@ -0,0 +1,104 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import json
+from urllib.error import URLError
+
+import pytest
+
+from kgforge.core.commons.context import Context
+from kgforge.core.commons.context_cache import (
+    ContextCache,
+    cached_context,
+    get_context_scope,
+    new_context_scope,
+    restored_contexts,
+    using_context_scope,
+)
+
+IRI = "https://example.org/context.json"
+DOCUMENT = {"@context": {"@vocab": "https://example.org/", "name": "https://schema.org/name"}}
+
+
+def test_context_cache(tmp_path):
+    fetched = []
+
+    def fetch():
+        fetched.append(IRI)
+        return DOCUMENT
+
+    def fail():
+        raise URLError("unreachable")
+
+    cache = ContextCache(str(tmp_path))
+    assert cache.get(IRI, fetch) == DOCUMENT
+    document = cache.get(IRI, fetch)
+    document["@context"].clear()
+    assert cache.get(IRI, fetch) == DOCUMENT
+    assert len(fetched) == 1
+
+    other_process = ContextCache(str(tmp_path))
+    assert other_process.get(IRI, fail) == DOCUMENT
+
+    stale = ContextCache(str(tmp_path), ttl=0)
+    assert stale.get(IRI, fail) == DOCUMENT
+    assert stale.get(IRI, fetch) == DOCUMENT
+    assert len(fetched) == 2
+
+    offline = ContextCache(str(tmp_path), ttl=0, offline=True)
+    assert offline.get(IRI, fail) == DOCUMENT
+    with pytest.raises(URLError):
+        offline.get("https://example.org/missing.json", fetch)
+    assert len(fetched) == 2
+
+
+def test_context_cache_identity(tmp_path):
+    def fail():
+        raise URLError("unreachable")
+
+    cache = ContextCache(str(tmp_path))
+    assert cache.get(IRI, lambda: DOCUMENT, "token") == DOCUMENT
+    assert cache.get(IRI, fail, "token") == DOCUMENT
+    with pytest.raises(URLError):
+        cache.get(IRI, fail, "other")
+    with pytest.raises(URLError):
+        cache.get(IRI, fail)
+    assert not any("token" in path.read_text() for path in cache.directory.glob("*.json"))
+
+
+def test_context_from_cache(tmp_path):
+    ContextCache(str(tmp_path)).get(IRI, lambda: DOCUMENT)
+    scope = new_context_scope(ContextCache(str(tmp_path), offline=True))
+    with using_context_scope(scope):
+        context = Context(IRI, IRI)
+    assert get_context_scope() is None
+    assert scope.resolved == {IRI: json.dumps(DOCUMENT)}
+    assert context.document == DOCUMENT
+    assert context.vocab == "https://example.org/"
+    assert context.expand("name") == "https://schema.org/name"
+
+
+def test_restored_contexts():
+    def fail():
+        raise URLError("unreachable")
+
+    with restored_contexts({IRI: json.dumps(DOCUMENT)}):
+        scope = new_context_scope(None)
+    other = new_context_scope(None)
+    with using_context_scope(scope):
+        assert cached_context(IRI, fail) == DOCUMENT
+    assert scope.resolved == {IRI: json.dumps(DOCUMENT)}
+    with using_context_scope(other), pytest.raises(URLError):
+        cached_context(IRI, fail)
+    assert other.resolved == {}
@@ -10,6 +10,7 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+import copy
 from typing import List
 
 import elasticsearch_dsl
@@ -797,3 +798,41 @@ class TestESQueryBuilder:
                 filters,
                 default_str_keyword_field=default_str_keyword_field,
             )
+
+    @pytest.mark.parametrize(
+        "query, last, expected",
+        [
+            pytest.param(
+                {"query": {"match_all": {}}, "from": 20, "size": 5},
+                None,
+                {"query": {"match_all": {}}, "sort": [{"@id": "asc"}], "size": 10},
+                id="first_page",
+            ),
+            pytest.param(
+                {"query": {"match_all": {}}, "sort": [{"_createdAt": "desc"}]},
+                ["2024-01-01T00:00:00Z", "http://ex.org/a"],
+                {
+                    "query": {"match_all": {}},
+                    "sort": [{"_createdAt": "desc"}, {"@id": "asc"}],
+                    "size": 10,
+                    "search_after": ["2024-01-01T00:00:00Z", "http://ex.org/a"],
+                },
+                id="following_page_with_sort",
+            ),
+            pytest.param(
+                {"query": {"match_all": {}}, "sort": "@id"},
+                ["http://ex.org/a"],
+                {
+                    "query": {"match_all": {}},
+                    "sort": ["@id"],
+                    "size": 10,
+                    "search_after": ["http://ex.org/a"],
+                },
+                id="following_page_sorted_by_tiebreaker",
+            ),
+        ],
+    )
+    def test_apply_search_after_to_query(self, query, last, expected):
+        original = copy.deepcopy(query)
+        assert ESQueryBuilder.apply_search_after_to_query(query, last, 10) == expected
+        assert query == original
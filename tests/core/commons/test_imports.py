@@ -0,0 +1,47 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import subprocess
+import sys
+
+import pytest
+
+from kgforge.core.commons.imports import lazy_classes, lazy_import
+
+
+def test_lazy_import():
+    json = lazy_import("json")
+    assert json.loads("[1]") == [1]
+
+
+def test_lazy_classes():
+    __getattr__ = lazy_classes("kgforge.specializations.models", {"DemoModel": ".demo_model"})
+    from kgforge.specializations.models.demo_model import DemoModel
+    assert __getattr__("DemoModel") is DemoModel
+    with pytest.raises(AttributeError):
+        __getattr__("MissingModel")
+
+
+def test_heavy_dependencies_not_imported():
+    # Run in a new interpreter as other tests import them.
+    heavy = ["pandas", "numpy", "elasticsearch_dsl", "aiohttp", "pyshacl", "pyld"]
+    code = (
+        "import sys\n"
+        "from kgforge.core import KnowledgeGraphForge\n"
+        "import kgforge.specializations.models\n"
+        "import kgforge.specializations.stores\n"
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == ""
@@ -175,6 +175,37 @@ def test__replace_in_sparql_exception():
         )
 
 
+@pytest.mark.parametrize("keyset, last, expected", [
+    ("id", None,
+     "SELECT ?id WHERE { ?id a ?type } ORDER BY ?id LIMIT 10"),
+    ("id", ["http://ex.org/a\"b"],
+     "SELECT ?id WHERE { ?id a ?type  FILTER (STR(?id) > \"http://ex.org/a\\\"b\")\n} "
+     "ORDER BY ?id LIMIT 10"),
+    ("_createdAt", ["2024-01-01T00:00:00Z", "http://ex.org/a"],
+     "SELECT ?id WHERE { ?id a ?type  FILTER ("
+     "?_createdAt > \"2024-01-01T00:00:00Z\"^^<http://www.w3.org/2001/XMLSchema#dateTime> || "
+     "(?_createdAt = \"2024-01-01T00:00:00Z\"^^<http://www.w3.org/2001/XMLSchema#dateTime> && "
+     "STR(?id) > \"http://ex.org/a\"))\n} ORDER BY ?_createdAt ?id LIMIT 10"),
+])
+def test_apply_keyset_to_query(keyset, last, expected):
+    query = "SELECT ?id WHERE { ?id a ?type } LIMIT 100 OFFSET 20"
+    if keyset == "_createdAt":
+        query = query.replace("?id a", "?id <https://ex.org/createdAt> ?_createdAt ; a")
+        expected = expected.replace("?id a", "?id <https://ex.org/createdAt> ?_createdAt ; a")
+    assert SPARQLQueryBuilder.apply_keyset_to_query(query, keyset, last, 10) == expected
+
+
+@pytest.mark.parametrize("query, keyset", [
+    ("SELECT ?x WHERE { ?x a ?type }", "id"),
+    ("SELECT ?id WHERE { ?id a ?type }", "_createdAt"),
+    ("SELECT ?id WHERE { ?id a ?type } ORDER BY ?type", "id"),
+    ("SELECT ?id WHERE { ?id a ?type }", "_updatedAt"),
+])
+def test_apply_keyset_to_query_exception(query, keyset):
+    with pytest.raises(QueryingError):
+        SPARQLQueryBuilder.apply_keyset_to_query(query, keyset, None, 10)
+
+
 class TestSPARQLQueryBuilder:
     @pytest.mark.parametrize(
         "query, response, resource_json",
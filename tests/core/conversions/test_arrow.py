@@ -0,0 +1,97 @@
+#
+# Blue Brain Nexus Forge is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Blue Brain Nexus Forge is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser
+# General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+
+import pytest
+
+from kgforge.core.resource import Resource
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+# Test suite for conversion of resources to Arrow tables and Parquet files.
+
+
+class TestArrowConversion:
+
+    def test_as_arrow_columns(self, forge, r1, r2, r3, r4):
+        rcs = [r1, r2, r3, r4]
+        x = forge.as_arrow(rcs)
+        assert x.column_names == list(forge.as_dataframe(rcs).columns)
+        assert x.column("p4.id").to_pylist() == [None, None, "123", "345"]
+        assert x.schema.field("p1").type == pa.string()
+
+    def test_as_arrow_na(self, forge, r1, r2):
+        r2.p1 = "NA"
+        x = forge.as_arrow([r1, r2], na=[None, "NA"])
+        assert x.column("p1").to_pylist() == ["v1a", None]
+
+    def test_as_arrow_lists(self, forge):
+        rcs = [Resource(type="Person"), Resource(type=["Person", "Agent"])]
+        x = forge.as_arrow(rcs)
+        assert x.column("type").to_pylist() == [["Person"], ["Person", "Agent"]]
+
+    def test_as_arrow_mixed_types(self, forge):
+        rcs = [Resource(type="Type", p1="v1"), Resource(type="Type", p1=1)]
+        x = forge.as_arrow(rcs)
+        assert x.column("p1").to_pylist() == ['"v1"', "1"]
+
+    def test_to_parquet_batches(self, forge, tmp_path, r1, r2, r3, r4):
+        path = str(tmp_path / "resources.parquet")
+        rcs = [r1, r2, r3, r4]
+        forge.to_parquet(iter(rcs), path, batch_size=2)
+        x = pq.read_table(path)
+        assert x.column_names == list(forge.as_dataframe(rcs).columns)
+        assert pq.ParquetFile(path).num_row_groups == 2
+        assert x.column("p1").to_pylist() == ["v1a", "v1b", None, None]
+        assert x.column("p4.id").to_pylist() == [None, None, "123", "345"]
+
+    def test_to_parquet_types(self, forge, tmp_path):
+        path = str(tmp_path / "resources.parquet")
+        rcs = [Resource(type="Person", p1=1, p2="v2"), Resource(type=["Person", "Agent"], p1=1.5, p2=2)]
+        forge.to_parquet(rcs, path, batch_size=1)
+        x = pq.read_table(path)
+        assert x.column("type").to_pylist() == [["Person"], ["Person", "Agent"]]
+        assert x.column("p1").to_pylist() == [1.0, 1.5]
+        assert x.column("p2").to_pylist() == ['"v2"', "2"]
+
+    def test_to_parquet_mixed_types(self, forge, tmp_path):
+        path = str(tmp_path / "resources.parquet")
+        rcs = [Resource(type="Type", v=x) for x in (1, "x", [1, 2], 2.5)]
+        forge.to_parquet(rcs, path, batch_size=1)
+        x = pq.read_table(path)
+        assert x.column("v").to_pylist() == forge.as_arrow(rcs).column("v").to_pylist()
+        assert x.column("v").to_pylist() == ["1", '"x"', "[1, 2]", "2.5"]
+
+    def test_to_parquet_nested_fields(self, forge, tmp_path):
+        path = str(tmp_path / "resources.parquet")
+        rcs = [Resource(type="Type", parts=[Resource(x=1)]),
+               Resource(type="Type", parts=[Resource(x=2, y="s")])]
+        forge.to_parquet(rcs, path, batch_size=1)
+        x = pq.read_table(path)
+        assert x.column("parts").to_pylist() == [[{"x": 1, "y": None}], [{"x": 2, "y": "s"}]]
+
+    def test_to_parquet_failure(self, forge, tmp_path, monkeypatch):
+        def fail(table, schema):
+            raise pa.ArrowTypeError("failure")
+
+        monkeypatch.setattr("kgforge.core.conversions.arrow._conformed", fail)
+        rcs = [Resource(type="Type", p1="v1"), Resource(type="Type", p1="v2")]
+        forge.to_parquet(rcs, str(tmp_path / "resources.parquet"), batch_size=1)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_to_parquet_empty(self, forge, tmp_path):
+        path = str(tmp_path / "resources.parquet")
+        forge.to_parquet(iter([]), path)
+        assert pq.read_table(path).num_rows == 0
@@ -216,6 +216,13 @@ class TestConversionFromDataFrame:
         del r2.p1
         rcs = [r1, r2]
         assert x == rcs
+
+    def test_from_dataframe_numbers(self, forge):
+        # Integers are kept as such next to floats.
+        df = DataFrame({"n": [1, 2], "x": [1.5, np.nan]})
+        x = forge.from_dataframe(df)
+        assert [type(r.n) for r in x] == [int, int]
+        assert x == [Resource(n=1, x=1.5), Resource(n=2)]
         
     def test_from_dataframe_nesting_default_depth_1(self, ndf, forge, r3, r4):
         x = forge.from_dataframe(ndf)
@@ -12,8 +12,16 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
+import json
+
+import hjson
 import pytest
 
+from kgforge.core.commons.attributes import sort_attrs
+from kgforge.core.conversions.json import _remove_context
+from kgforge.core.resource import Resource, encode
+from kgforge.core.wrappings.dict import wrap_dict
+
 
 # Test suite for conversion of a resource to / from JSON.
 
@@ -142,3 +150,44 @@ class TestConversionFromJson:
         del r2.p1
         rcs = [r3, r4]
         assert x == rcs
+
+
+class TestConversionToJson:
+
+    def test_as_json_nested(self, forge, r3, r4):
+        r3.context = {"p": "http://example.org/"}
+        r3.p4.context = "http://example.org/context.json"
+        r3.p5 = [r4, [{"context": 1, "p6": 2.5}], ("v5", None, True)]
+        x = forge.as_json(r3)
+        assert x == {
+            "id": "678", "type": "Other", "p3": "v3c",
+            "p4": {"id": "123", "type": "Type", "p1": "v1a", "p2": "v2a"},
+            "p5": [
+                {"id": "912", "type": "Other", "p3": "v3d",
+                 "p4": {"id": "345", "type": "Type", "p1": "v1b", "p2": "v2b"}},
+                [{"context": 1, "p6": 2.5}],
+                ["v5", None, True],
+            ],
+        }
+        expected = json.loads(hjson.dumpsJSON(r3, default=encode, item_sort_key=sort_attrs))
+        _remove_context(expected)
+        assert json.dumps(x) == json.dumps(expected)
+
+    def test_as_json_store_metadata(self, forge, r1):
+        r1._store_metadata = wrap_dict({"_rev": 2, "context": "c", "_self": "http://s/123"})
+        assert forge.as_json(r1, store_metadata=True) == {
+            "id": "123", "type": "Type", "p1": "v1a", "p2": "v2a",
+            "context": "c", "_rev": 2, "_self": "http://s/123",
+        }
+        assert forge.as_json(r1) == {"id": "123", "type": "Type", "p1": "v1a", "p2": "v2a"}
+
+    def test_as_json_not_finite(self, forge, r1):
+        r1.p1 = float("nan")
+        r1.p2 = [float("inf"), 1.5]
+        assert forge.as_json(r1) == {"id": "123", "type": "Type", "p1": None, "p2": [None, 1.5]}
+
+    def test_as_json_circular(self, r1):
+        from kgforge.core.conversions.json import as_json
+        r1.p1 = Resource(p2=r1)
+        with pytest.raises(ValueError):
+            as_json(r1, False, False, None, None, None)
@@ -22,11 +22,15 @@ from urllib.request import pathname2url
 import json
 import pytest
 from rdflib import Graph, BNode, term
+from rdflib.compare import isomorphic
 from rdflib.namespace import RDF, Namespace
 
 from kgforge.core.resource import Resource
+from kgforge.core.commons.context import Context
+from kgforge.core.wrappings.dict import wrap_dict
 from kgforge.core.commons.exceptions import NotSupportedError
-from kgforge.core.conversions.rdf import _merge_jsonld, _resolve_iri, from_jsonld, as_jsonld, Form, as_graph, from_graph, LD_KEYS
+from kgforge.core.conversions.rdf import _merge_jsonld, _resolve_iri, from_jsonld, as_jsonld, Form, as_graph, from_graph, LD_KEYS, \
+    _from_graph_framed, from_graph_iter, _ADD_TO_GRAPH
 
 form_store_metadata_combinations = [
     pytest.param(Form.COMPACTED.value, True, id="compacted-with-metadata"),
@@ -62,6 +66,26 @@ class TestJsonLd:
         result["founder"]["@type"] = sorted(result["founder"]["@type"])
         assert compacted == result
 
+    def test_compacted_without_graph(self, building_with_context, building_jsonld, monkeypatch):
+        expected = building_jsonld(building_with_context, "compacted", False, None)
+
+        def parse(*args, **kwargs):
+            raise AssertionError("no graph should be parsed")
+
+        monkeypatch.setattr(Graph, "parse", parse)
+        result = as_jsonld(building_with_context, form="compacted", store_metadata=False,
+                           model_context=None, metadata_context=None, context_resolver=None)
+        assert expected == result
+
+    def test_output_context_not_shared(self, building_with_context):
+        other = deepcopy(building_with_context)
+        result = as_jsonld(building_with_context, form="compacted", store_metadata=False,
+                           model_context=None, metadata_context=None, context_resolver=None)
+        result["@context"]["evil"] = "https://evil.org/"
+        other_result = as_jsonld(other, form="compacted", store_metadata=False,
+                                 model_context=None, metadata_context=None, context_resolver=None)
+        assert "evil" not in other_result["@context"]
+
     @pytest.mark.parametrize("form, store_metadata", form_store_metadata_combinations)
     def test_no_context(self, form, store_metadata, valid_resource):
         with pytest.raises(NotSupportedError):
@@ -225,6 +249,38 @@ class TestGraph:
         result = as_graph([building, organization], store_metadata, model_context, None, None)
         _assert_same_graph(result, expected)
 
+    def test_rdflib_add_to_graph(self):
+        # Triples are added with a private method of the JSON-LD parser of rdflib, if it has it.
+        assert _ADD_TO_GRAPH is not None, "rdflib has no JSONLD Parser._add_to_graph anymore"
+
+    @pytest.mark.parametrize("add_to_graph", [
+        pytest.param(True, id="rdflib-add-to-graph"),
+        pytest.param(False, id="rdflib-parse"),
+    ])
+    def test_as_graph_as_expanded_jsonld(self, model_context, metadata_context, add_to_graph, monkeypatch):
+        if not add_to_graph:
+            monkeypatch.setattr("kgforge.core.conversions.rdf._ADD_TO_GRAPH", None)
+        context = Context({
+            "@vocab": "http://example.org/vocab/",
+            "@base": "http://example.org/",
+            "knows": {"@id": "http://schema.org/knows", "@type": "@id"},
+            "items": {"@id": "http://schema.org/items", "@container": "@list"},
+            "date": {"@id": "http://schema.org/date", "@type": "xsd:date"},
+            "label": {"@id": "http://schema.org/label", "@language": "en"},
+            "xsd": "http://www.w3.org/2001/XMLSchema#",
+        })
+        resource = Resource(id="1234", type="Person", knows="5678", date="2020-01-01",
+                            label="a person", items=[1, 2.5, True, Resource(name="item")],
+                            member=Resource(type="Organization", name=["a", "b"]))
+        resource._store_metadata = wrap_dict({"id": "1234", "version": 1, "deprecated": False})
+        for store_metadata in [False, True]:
+            expanded = as_jsonld(resource, form="expanded", store_metadata=store_metadata,
+                                 model_context=context, metadata_context=metadata_context,
+                                 context_resolver=None)
+            expected = Graph().parse(data=json.dumps(expanded), format="json-ld")
+            result = as_graph(resource, store_metadata, context, metadata_context, None)
+            assert isomorphic(result, expected)
+
     @pytest.mark.parametrize("store_metadata", store_metadata_params)
     def test_from_graph(self, building, organization, building_jsonld, model_context, store_metadata, metadata_context):
         store_metadata = False
@@ -288,6 +344,45 @@ class TestGraph:
         assert result_jsonld == expected
 
 
+    @pytest.mark.parametrize("use_model_context", [False, True])
+    def test_from_graph_as_pyld_frames(self, model_context, use_model_context):
+        context = model_context if use_model_context else None
+        schema = Namespace("https://schema.org/")
+        graph = Graph()
+        graph.bind("schemaorg", schema)
+        building, person, address = term.URIRef("http://test/1234"), term.URIRef("http://test/person"), BNode()
+        graph.add((building, RDF.type, schema.Building))
+        graph.add((building, schema.name, term.Literal("The Empire State Building")))
+        graph.add((building, schema.image, term.URIRef("http://test/image.jpg")))
+        graph.add((building, schema.address, address))
+        graph.add((address, RDF.type, schema.PostalAddress))
+        graph.add((address, schema.postalCode, term.Literal(10118)))
+        graph.add((address, schema.addressLocality, term.Literal("New York", lang="en")))
+        graph.add((person, RDF.type, schema.Person))
+        graph.add((person, schema.name, term.Literal("Jane")))
+        graph.add((person, schema.birthDate, term.Literal("1990-01-01", datatype="http://www.w3.org/2001/XMLSchema#date")))
+        graph.add((person, schema.knows, building))
+        for type_ in [None, ["https://schema.org/Building"], ["https://schema.org/Organization"]]:
+            expected = _from_graph_framed(graph, type_, None, context)
+            assert from_graph(graph, type_, model_context=context) == expected
+
+    def test_from_graph_iter(self):
+        schema = Namespace("https://schema.org/")
+        graph = Graph()
+        for i in range(5):
+            person, address = term.URIRef(f"http://test/person/{i}"), BNode()
+            graph.add((person, RDF.type, schema.Person))
+            graph.add((person, schema.name, term.Literal(f"Person {i}")))
+            graph.add((person, schema.address, address))
+            graph.add((address, schema.postalCode, term.Literal(i)))
+        results = from_graph_iter(graph, type_="https://schema.org/Person", chunk_size=2)
+        assert not isinstance(results, list)
+        results = list(results)
+        assert [x.id for x in results] == [f"http://test/person/{i}" for i in range(5)]
+        assert all(not hasattr(getattr(x, "schema:address"), "id") for x in results)
+        assert results == from_graph(graph)
+
+
 def _assert_same_graph(result,expected):
     for s, p, o in expected:
         if isinstance(o, BNode):
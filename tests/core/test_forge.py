@@ -14,9 +14,13 @@
 
 # Test suite for initializing a forge.
 
+import json
 import os
 
+from kgforge.core.commons.context_cache import cached_context, using_context_scope
 from kgforge.core.forge import KnowledgeGraphForge
+from kgforge.core.resource import Resource
+from kgforge.specializations.stores.demo_store import DemoStore
 
 SCOPE = "terms"
 MODEL = "DemoModel"
@@ -35,6 +39,73 @@ class TestForgeInitialization:
         assert type(forge._store).__name__ == STORE
         assert type(forge._resolvers[SCOPE][RESOLVER]).__name__ == RESOLVER
 
+    def test_startup_timings(self, config):
+        forge = KnowledgeGraphForge(config)
+        timings = forge.startup_timings()
+        assert {"model", "store", "resolvers", "total"} <= timings.keys()
+        assert all(v >= 0 for v in timings.values())
+        assert timings["total"] >= timings["model"] + timings["store"] + timings["resolvers"]
+
+    def test_save_and_restore_state(self, config, tmp_path):
+        forge = KnowledgeGraphForge(config, token="secret")
+        path = str(tmp_path / "state.json")
+        forge.save_state(path)
+        with open(path, encoding="utf-8") as f:
+            assert "secret" not in f.read()
+        restored = KnowledgeGraphForge.from_state(path, token="secret")
+        assert restored._config == forge._config
+        assert restored._store.token == "secret"
+        assert restored.types(pretty=False) == forge.types(pretty=False)
+
+    def test_save_and_restore_rdf_model_state(self, context_iri_file, shacl_schemas_file_path, tmp_path):
+        config = {
+            "Model": {
+                "name": "RdfModel",
+                "origin": "directory",
+                "source": shacl_schemas_file_path,
+                "context": {"iri": context_iri_file},
+            },
+            "Store": {"name": "DemoStore", "model": {"name": "RdfModel"}},
+        }
+        forge = KnowledgeGraphForge(config)
+        service = forge._model.service
+        service.get_shape_graph(service.get_shape_uriref_from_class_fragment("Person"))
+        path = str(tmp_path / "state.json")
+        forge.save_state(path)
+        restored = KnowledgeGraphForge.from_state(path)
+        assert restored._model.service._maps is not None
+        assert restored._model.service._imported == service._imported
+        assert restored._model.template("Person", False, "dict") == forge._model.template("Person", False, "dict")
+
+    def test_restore_outdated_state(self, config, tmp_path, monkeypatch):
+        freshness = iter(["saved", "changed", "changed"])
+        closed = []
+        monkeypatch.setattr(DemoStore, "freshness", lambda self: next(freshness))
+        monkeypatch.setattr(DemoStore, "close", lambda self: closed.append(self))
+        path = str(tmp_path / "state.json")
+        KnowledgeGraphForge(config).save_state(path)
+        restored = KnowledgeGraphForge.from_state(path)
+        assert len(closed) == 1 and closed[0] is not restored._store
+
+    def test_save_state_of_own_contexts(self, config, tmp_path):
+        forge = KnowledgeGraphForge(config)
+        other = KnowledgeGraphForge(config)
+        with using_context_scope(other._context_scope):
+            cached_context("https://example.org/context.json", lambda: {"@context": {}})
+        path = str(tmp_path / "state.json")
+        forge.save_state(path)
+        with open(path, encoding="utf-8") as f:
+            assert "https://example.org/context.json" not in json.load(f)["contexts"]
+
+
+class TestSearch:
+
+    def test_search_iter(self, config):
+        forge = KnowledgeGraphForge(config)
+        forge.register([Resource(type="Person", name=name) for name in ("Jane", "John")])
+        found = forge.search_iter({"type": "Person"}, page_size=1, keyset="_createdAt")
+        assert sorted(x.name for x in found) == ["Jane", "John"]
+
 
 class TestResolver:
     """
@@ -11,6 +11,7 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+import json
 import os
 from pathlib import Path
 import pytest
@@ -80,3 +81,27 @@ def test_build_ontology_map(rdf_model_from_dir: RdfModel):
     assert ont_to_named_graph == {
         URIRef("https://schema.org/"): URIRef(str(f.resolve()))
     }
+
+
+def test_maps_built_on_first_use(rdf_model_from_dir: RdfModel):
+    service = rdf_model_from_dir.service
+    assert service.startup_timings == {}
+    assert service.class_to_shape == service._build_shapes_map()[0]
+    assert service.ont_to_named_graph == service._build_ontology_map()
+    assert service.startup_timings.keys() == {"shapes_map", "ontology_map"}
+
+
+def test_restore_state(rdf_model_from_dir: RdfModel, context_iri_file, shacl_schemas_file_path):
+    service = rdf_model_from_dir.service
+    shape = service.get_shape_uriref_from_class_fragment("Person")
+    service.get_shape_graph(shape)
+    state = json.loads(json.dumps(rdf_model_from_dir.state()))
+    assert state["imported"] == ["https://schema.org/", "http://shapes.ex/person"]
+    restored = RdfModel(
+        shacl_schemas_file_path, context={"iri": context_iri_file}, origin="directory"
+    )
+    restored.restore_state(state)
+    assert restored.service._maps is not None
+    assert restored.service._imported == service._imported
+    assert restored.service._defining_resource_to_imported_ontology == service._defining_resource_to_imported_ontology
+    assert restored.template("Person", False, "dict") == rdf_model_from_dir.template("Person", False, "dict")
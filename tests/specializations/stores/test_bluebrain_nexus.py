@@ -11,8 +11,13 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
+import asyncio
 import copy
 import os
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 from urllib.parse import quote_plus, urljoin
 from urllib.request import pathname2url
@@ -27,12 +32,17 @@ from kgforge.core.commons.files import load_yaml_from_file
 from kgforge.core.resource import Resource
 from kgforge.core.archetypes.store import Store
 from kgforge.core.commons.context import Context
+from kgforge.core.commons.exceptions import RegistrationError
 from kgforge.core.conversions.rdf import _merge_jsonld
 from kgforge.core.wrappings.dict import wrap_dict
 from kgforge.core.wrappings.paths import Filter, create_filters_from_dict
 from kgforge.core.commons.sparql_query_builder import SPARQLQueryBuilder
 from kgforge.specializations.models import DemoModel
 from kgforge.specializations.stores.bluebrain_nexus import BlueBrainNexus
+from kgforge.specializations.stores.nexus.adaptive_limiter import AdaptiveLimiter
+from kgforge.specializations.stores.nexus.batch_request_handler import BatchRequestHandler
+from kgforge.specializations.stores.nexus.resource_cache import ResourceCache
+from kgforge.specializations.stores.nexus.retry_policy import RetryPolicy, RetryRequest
 
 # FIXME mock Nexus for unittests
 # TODO To be port to the generic parameterizable test suite for stores in test_stores.py. DKE-135.
@@ -185,6 +195,323 @@ def test_config(nexus_store):
     assert nexus_store.context.base == NEXUS_PROJECT_CONTEXT["base"]
 
 
+def test_connection_pool(nexus_store):
+    service = nexus_store.service
+    assert service.session is service.connection_pool.session
+    assert service.session.get_adapter(NEXUS)._pool_maxsize == service.max_connection
+
+    async def client_sessions():
+        return service.client_session(), service.client_session()
+
+    first, second = service.run(client_sessions())
+    assert first is second
+    assert first.connector.limit == service.max_connection
+    assert service.run(client_sessions())[0] is first
+
+
+def test_io_loop(nexus_store):
+    service = nexus_store.service
+
+    async def current_thread():
+        return threading.current_thread()
+
+    io_thread = service.run(current_thread())
+    assert io_thread is not threading.current_thread()
+
+    async def from_running_loop():
+        return service.run(current_thread())
+
+    assert asyncio.run(from_running_loop()) is io_thread
+
+    with ThreadPoolExecutor(4) as executor:
+        threads = list(executor.map(lambda _: service.run(current_thread()), range(8)))
+    assert all(thread is io_thread for thread in threads)
+
+    service.close()
+    assert not io_thread.is_alive()
+
+
+def test_client_session_of_caller_loop(nexus_store):
+    service = nexus_store.service
+
+    async def client_session():
+        return service.client_session()
+
+    session = asyncio.run(client_session())
+    assert session.closed
+    assert not service.run(client_session()).closed
+
+
+def test_ids_and_versions():
+    assert BlueBrainNexus._ids_and_versions("a", 1) == (["a"], [1])
+    assert BlueBrainNexus._ids_and_versions(["a"], None) == (["a"], [None])
+    assert BlueBrainNexus._ids_and_versions(["a", "b"], None) == (["a", "b"], [None, None])
+    assert BlueBrainNexus._ids_and_versions(["a", "b"], [1, "tag"]) == (["a", "b"], [1, "tag"])
+    with pytest.raises(Exception):
+        BlueBrainNexus._ids_and_versions(["a", "b"], [1])
+
+
+def test_adaptive_limiter(nexus_store):
+    assert nexus_store.service.limiter.max_limit == nexus_store.service.max_connection
+
+    inflight = []
+
+    async def request(limiter, status, delay):
+        async with limiter.acquire() as slot:
+            inflight.append(limiter.inflight)
+            await asyncio.sleep(delay)
+            slot.status = status
+
+    def send(limiter, status, count, delay=0.01):
+        async def gather():
+            await asyncio.gather(*(request(limiter, status, delay) for _ in range(count)))
+        asyncio.run(gather())
+
+    limiter = AdaptiveLimiter(8, initial_limit=4)
+    send(limiter, 200, 64)
+    assert max(inflight) <= 8
+    assert limiter.limit == 8
+    assert limiter.inflight == 0
+    assert limiter.latency is not None
+
+    send(limiter, 503, 1)
+    assert limiter.limit == 4
+
+    send(limiter, 200, 32, delay=0.1)
+    assert limiter.limit < 4
+
+    fixed = AdaptiveLimiter(3, adaptive=False)
+    send(fixed, 429, 8)
+    assert fixed.limit == 3
+
+
+def test_retry_policy(nexus_store):
+    assert nexus_store.service.session.retry_policy is nexus_store.service.retry_policy
+
+    policy = RetryPolicy(max_retries=2, backoff_factor=1, max_backoff=3, jitter=False)
+    assert policy.idempotent("GET", NEXUS)
+    assert policy.idempotent("PUT", NEXUS, {"rev": 1})
+    assert policy.idempotent("DELETE", f"{NEXUS}?rev=1")
+    assert not policy.idempotent("PUT", NEXUS)
+    assert not policy.idempotent("POST", NEXUS)
+    assert RetryPolicy(retry_post=True).idempotent("POST", NEXUS)
+
+    assert [policy.backoff(attempt) for attempt in range(4)] == [1, 2, 3, 3]
+    assert policy.backoff(0, "2") == 2
+    assert policy.backoff(0, "3600") == 3
+
+    with pytest.raises(RetryRequest):
+        policy.raise_for_retry(0, True, 503, {})
+    policy.raise_for_retry(2, True, 503, {})
+    policy.raise_for_retry(0, False, 503, {})
+    policy.raise_for_retry(0, True, 404, {})
+
+    statuses = [503, 429, 200]
+
+    async def send(attempt):
+        policy.raise_for_retry(attempt, True, statuses[attempt], {"Retry-After": "0"})
+        return attempt
+
+    assert asyncio.run(policy.arun(send, idempotent=True)) == 2
+
+
+def test_batch_dispatch_window():
+    limiter = AdaptiveLimiter(4, adaptive=False)
+    consumed = []
+    finished = []
+    window = []
+
+    def elements():
+        for i in range(50):
+            consumed.append(i)
+            window.append(len(consumed) - len(finished))
+            yield i
+
+    async def fc(element, session):
+        await asyncio.sleep(0.001 * (element % 3))
+        finished.append(element)
+        return element * 2
+
+    async def dispatch():
+        loop = asyncio.get_running_loop()
+        return await BatchRequestHandler.dispatch(loop, elements(), fc, None, None, limiter)
+
+    assert asyncio.run(dispatch()) == [i * 2 for i in range(50)]
+    assert max(window) == limiter.limit
+
+    async def dispatch_ahead():
+        loop = asyncio.get_running_loop()
+        return await BatchRequestHandler.dispatch(loop, elements(), fc, None, None, limiter, 2)
+
+    consumed.clear()
+    finished.clear()
+    window.clear()
+    assert asyncio.run(dispatch_ahead()) == [i * 2 for i in range(50)]
+    assert max(window) == limiter.limit + 2
+
+
+def test_prepare_workers(nexus_store):
+    service = nexus_store.service
+    person = Resource(type="Person", name="Jane Doe")
+    assert service.prepare_workers == Service.PREPARE_WORKERS
+    threads = []
+
+    def prepare(service_, resource, **kwargs):
+        threads.append(threading.current_thread())
+        return "POST", "http://127.0.0.1:1", resource, RegistrationError, {}, None, {"a": 1}
+
+    async def request():
+        return await BatchRequestHandler.request_on_resource(
+            service, person, service.client_session(), prepare
+        )
+
+    result = service.run(request())
+    assert result.resource is person
+    assert isinstance(result.response, RegistrationError)
+    assert threads[0].name.startswith("kgforge-prepare")
+
+
+def test_file_digest(tmp_path):
+    assert BlueBrainNexus._hash_algorithm("SHA-256") == "sha256"
+    assert BlueBrainNexus._hash_algorithm("unknown") is None
+    assert BlueBrainNexus._hash_algorithm(None) is None
+    path = tmp_path / "file"
+    path.write_bytes(b"content" * BlueBrainNexus.DOWNLOAD_CHUNK_SIZE)
+    expected = hashlib.sha256(path.read_bytes()).hexdigest()
+    assert BlueBrainNexus._digest(str(path), "sha256") == expected
+
+
+def test_download_same_filenames(nexus_store, tmp_path, monkeypatch):
+    contents = {f"{NEXUS}/files/{BUCKET}/{i}": f"content of file {i}".encode() for i in range(2)}
+
+    async def retrieve_file_metadata(url, session):
+        digest = {"_algorithm": "SHA-256", "_value": hashlib.sha256(contents[url]).hexdigest()}
+        return {"_filename": "file.txt", "_mediaType": "text/plain", "_digest": digest}
+
+    class Content:
+        def __init__(self, data):
+            self.data = data
+
+        async def iter_chunked(self, size):
+            # One byte at a time so that both downloads interleave.
+            for i in range(len(self.data)):
+                await asyncio.sleep(0)
+                yield self.data[i:i + 1]
+
+    class Response:
+        status = 200
+        headers = {}
+
+        def __init__(self, url):
+            self.content = Content(contents[url])
+
+        def raise_for_status(self):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+    class Session:
+        def get(self, url, **kwargs):
+            return Response(url)
+
+    monkeypatch.setattr(nexus_store, "_aretrieve_file_metadata", retrieve_file_metadata)
+    monkeypatch.setattr(nexus_store.service, "client_session", Session)
+    files = [(url, lambda metadata: str(tmp_path / metadata["_filename"]), BUCKET) for url in contents]
+    assert nexus_store.service.run(nexus_store._adownload_files(files, None)) == [True, True]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["file.txt", "file.txt.1"]
+    assert sorted(path.read_bytes() for path in tmp_path.iterdir()) == sorted(contents.values())
+
+
+def test_download_reuses_file_metadata(nexus_store, tmp_path, monkeypatch):
+    url = f"{NEXUS}/files/{BUCKET}/1"
+    content = b"content of file 1"
+    digest = {"_algorithm": "SHA-256", "_value": hashlib.sha256(content).hexdigest()}
+    metadata = {"_filename": "file.txt", "_mediaType": "text/plain", "_digest": digest}
+
+    async def retrieve_file_metadata(url, session):
+        raise AssertionError("the file metadata should not be retrieved again")
+
+    class Content:
+        async def iter_chunked(self, size):
+            yield content
+
+    class Response:
+        status = 200
+        headers = {}
+        content = Content()
+
+        def raise_for_status(self):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+    class Session:
+        def get(self, url, **kwargs):
+            return Response()
+
+    monkeypatch.setattr(nexus_store, "_retrieve_file_metadata", lambda id_: metadata)
+    monkeypatch.setattr(nexus_store, "_aretrieve_file_metadata", retrieve_file_metadata)
+    monkeypatch.setattr(nexus_store.service, "client_session", Session)
+    assert nexus_store._retrieve_filename(url) == ("file.txt", "text/plain")
+    path = str(tmp_path / "file.txt")
+    nexus_store._download_one(url, path, None, False, None, BUCKET)
+    assert (tmp_path / "file.txt").read_bytes() == content
+    assert not nexus_store.service.file_metadata
+
+
+def test_elastic_payload():
+    payload = {"@id": "https://example.org/1", "@type": "Person", "name": "Jane Doe"}
+    metadata = {"_rev": 2, "_project": "org/project"}
+    source = {"@id": payload["@id"], "_original_source": json.dumps({"@type": "Person", "name": "Jane Doe"}), **metadata}
+    assert BlueBrainNexus._elastic_payload(source, True) == payload
+    assert BlueBrainNexus._elastic_payload(source, False) == {**payload, **metadata}
+    indexed = {**payload, **metadata}
+    assert BlueBrainNexus._elastic_payload(indexed, True) is None
+
+
+def test_resource_cache(tmp_path):
+    url = f"{NEXUS}/resources/org/project/_/1"
+    cache = ResourceCache(max_entries=2, ttl=60, directory=str(tmp_path))
+    assert cache.lookup(url, {}) == (None, False)
+
+    cache.store(url, {}, "1", '{"@id": "1"}', '"etag"')
+    entry, fresh = cache.lookup(url, {})
+    assert fresh and entry.etag == '"etag"'
+    cache.ttl = 0
+    assert cache.lookup(url, {}) == (entry, False)
+    cache.revalidated(url, {}, entry)
+    cache.ttl = 60
+    assert cache.lookup(url, {})[1]
+
+    cache.store(url, {"rev": 1}, "1", '{"@id": "1", "_rev": 1}', None)
+    cache.store(url, {"tag": "v1"}, "1", '{"@id": "1", "_rev": 1}', None)
+    assert cache.lookup(url, {})[0] is None
+    cache.ttl = 0
+    assert cache.lookup(url, {"tag": "v1"})[1]
+    cache.invalidate("1")
+    assert cache.lookup(url, {"tag": "v1"})[0] is None
+    assert cache.lookup(url, {"rev": 1})[1]
+
+    assert cache.stats() == {"hits": 4, "misses": 4, "revalidations": 1, "entries": 1}
+    on_disk = ResourceCache(directory=str(tmp_path))
+    assert on_disk.lookup(url, {"rev": 1})[0].text == '{"@id": "1", "_rev": 1}'
+    assert on_disk.lookup(url, {"tag": "v1"})[0] is None
+
+    scoped = ResourceCache(directory=str(tmp_path), identity=f"{NEXUS} token")
+    scoped.store(url, {"rev": 2}, "1", '{"@id": "1", "_rev": 2}', None)
+    assert ResourceCache(directory=str(tmp_path), identity=f"{NEXUS} token").lookup(url, {"rev": 2})[1]
+    assert ResourceCache(directory=str(tmp_path), identity=f"{NEXUS} other").lookup(url, {"rev": 2})[0] is None
+    assert ResourceCache(directory=str(tmp_path)).lookup(url, {"rev": 2})[0] is None
+
+
 def test_freeze_fail(nexus_store: Store, nested_resource):
     """nested resource is not registered, thus freeze will fail"""
     nexus_store.versioned_id_template = "{x.id}?rev={x._store_metadata._rev}"
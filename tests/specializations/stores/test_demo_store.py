@@ -12,7 +12,11 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with Blue Brain Nexus Forge. If not, see <https://choosealicense.com/licenses/lgpl-3.0/>.
 
+import asyncio
+
 import pytest
+
+from kgforge.core.commons.exceptions import RegistrationError
 from kgforge.specializations.stores.demo_store import DemoStore
 from tests.conftest import check_report, do
 
@@ -65,6 +69,58 @@ def test_register_exception(monkeypatch, store, valid_resource, exception_messag
         assert str(e) == exception_message
 
 
+def test_register_stream(store, valid_resources, registered_resource):
+    pulled = []
+
+    def resources():
+        for x in [*valid_resources, registered_resource]:
+            pulled.append(x)
+            yield x
+
+    stream = store.register_stream(resources(), None)
+    assert next(stream) is valid_resources[0]
+    assert len(pulled) == 1
+    registered = [valid_resources[0], *stream]
+    assert registered == [*valid_resources, registered_resource]
+    for x in valid_resources:
+        assert x._synchronized is True
+        assert x._last_action.succeeded is True
+    assert registered_resource._last_action.succeeded is False
+    assert registered_resource._last_action.message == "resource should not be synchronized"
+
+
+def test_update_stream(store, registered_resources):
+    for x in registered_resources:
+        x.name = "updated"
+    updated = list(store.update_stream(iter(registered_resources), None))
+    assert updated == registered_resources
+    for x in registered_resources:
+        assert x._synchronized is True
+        assert x._store_metadata == {'version': 2, 'deprecated': False}
+
+
+def test_async_defaults(store, valid_resources, registered_resource):
+    # The asynchronous operations of stores without a native implementation run the
+    # synchronous ones in an executor.
+
+    async def operations():
+        await store.aregister(valid_resources, None)
+        retrieved = await store.aretrieve(valid_resources[0].id, None, False)
+        updated = valid_resources[0]
+        updated.name = "updated"
+        await store.aupdate(updated, None)
+        return retrieved
+
+    retrieved = asyncio.run(operations())
+    assert retrieved.id == valid_resources[0].id
+    assert retrieved.name == "resource 0"
+    for x in valid_resources:
+        assert x._synchronized is True
+    assert valid_resources[0]._store_metadata == {'version': 2, 'deprecated': False}
+    with pytest.raises(RegistrationError):
+        asyncio.run(store.aregister(registered_resource, None))
+
+
 @pytest.mark.parametrize("data, expected_metadata", [
     ("registered_resource", "{'version': 1, 'deprecated': False}"),
 ])